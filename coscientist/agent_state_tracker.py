@@ -63,6 +63,10 @@ class AgentStateTracker(BaseCallbackHandler):
         self.events_file = self.output_dir / "agent_events.jsonl"
         self.current_invocation = None
         self.start_time = None
+        # Token usage summed over every LLM call of the invocation
+        self.llm_calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -90,8 +94,14 @@ class AgentStateTracker(BaseCallbackHandler):
         pass
     
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
-        """Called when LLM completes."""
-        pass
+        """Called when LLM completes. Accumulates token usage."""
+        self.llm_calls += 1
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    self.input_tokens += usage.get("input_tokens", 0)
+                    self.output_tokens += usage.get("output_tokens", 0)
     
     def on_llm_error(self, error: Exception, **kwargs: Any) -> None:
         """Called when LLM errors."""
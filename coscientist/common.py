@@ -1,16 +1,53 @@
+import json
 import os
 import re
 import logging
+import threading
+from collections import Counter
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage
 
+from pydantic import ValidationError
+
 from coscientist.custom_types import ParsedHypothesis
-from coscientist.robust_parsing import robust_parse_with_llm
+from coscientist.robust_parsing import arobust_parse_with_llm, robust_parse_with_llm
 
 logger = logging.getLogger(__name__)
 
+# How often each tier of parse_hypothesis_tiered produced the hypothesis
+_PARSE_TIERS = Counter()
+_PARSE_TIERS_LOCK = threading.Lock()
+_PLACEHOLDER_PREFIX = "Failed to parse"
+
+# Rendered prompt sizes per template, bucketed by powers of two tokens, and
+# how many renders of each template had to be compressed to fit a budget
+_PROMPT_TOKENS: dict[str, Counter] = {}
+_PROMPT_COMPRESSIONS = Counter()
+_PROMPT_STATS_LOCK = threading.Lock()
+
+# Context windows in tokens, matched against the model name by prefix.
+# The longest matching prefix wins.
+MODEL_CONTEXT_TOKENS = {
+    "gpt-4o": 128000,
+    "gpt-4.1": 1047576,
+    "gpt-5": 400000,
+    "o1": 200000,
+    "o3": 200000,
+    "o4": 200000,
+    "gemini": 1048576,
+    "models/gemini": 1048576,
+    "claude": 200000,
+}
+DEFAULT_CONTEXT_TOKENS = 128000
+
+# Templates declare compressible variables in a comment on their first line,
+# e.g. {# compress: debates=1, ratings=2 #}. Lower priorities are
+# compressed first.
+_COMPRESS_DECLARATION = re.compile(r"\{#\s*compress:(.*?)#\}")
+_TRUNCATION_NOTE = "\n\n... [truncated]"
+
 _env = Environment(
     loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "prompts")),
     autoescape=select_autoescape(),
@@ -19,15 +56,119 @@ _env = Environment(
 )
 
 
-def load_prompt(name: str, **kwargs) -> str:
+class PromptTooLargeError(ValueError):
+    """A prompt does not fit its token budget even after compression."""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English prose (about four characters per token)."""
+    return len(text) // 4
+
+
+def context_tokens(llm: BaseChatModel) -> int:
+    """
+    Context window of a model, from its model name.
+
+    Parameters
+    ----------
+    llm : BaseChatModel
+        The model
+
+    Returns
+    -------
+    int
+        Context window in tokens; DEFAULT_CONTEXT_TOKENS for unknown models
+    """
+    model = str(getattr(llm, "model_name", None) or getattr(llm, "model", None) or "")
+    matches = [prefix for prefix in MODEL_CONTEXT_TOKENS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_TOKENS
+    return MODEL_CONTEXT_TOKENS[max(matches, key=len)]
+
+
+def prompt_token_budget(llm: BaseChatModel, margin: float = 0.1) -> int:
+    """
+    Token budget for a prompt to a model.
+
+    The budget is the context window less the model's output token limit
+    and a safety margin, since token counts are estimated.
+
+    Parameters
+    ----------
+    llm : BaseChatModel
+        The model the prompt is sent to
+    margin : float
+        Fraction of the context window held back
+
+    Returns
+    -------
+    int
+        Prompt budget in estimated tokens
+    """
+    limit = context_tokens(llm)
+    max_output = getattr(llm, "max_tokens", None) or getattr(llm, "max_output_tokens", None) or 0
+    return int(limit * (1 - margin)) - int(max_output)
+
+
+def compressible_variables(name: str) -> dict[str, int]:
+    """
+    Compressible variables a template declares, with their priorities.
+
+    Parameters
+    ----------
+    name: str
+        The name of the template, without the .md extension.
+
+    Returns
+    -------
+    dict[str, int]
+        Variable name to priority; lower priorities are compressed first
+    """
+    source, _, _ = _env.loader.get_source(_env, f"{name}.md")
+    match = _COMPRESS_DECLARATION.match(source.lstrip())
+    if match is None:
+        return {}
+    variables = {}
+    for entry in match.group(1).split(","):
+        variable, _, priority = entry.partition("=")
+        if variable.strip():
+            variables[variable.strip()] = int(priority or 1)
+    return variables
+
+
+def _record_prompt_size(name: str, tokens: int, compressed: bool) -> None:
+    bucket = 1 << max(tokens, 1).bit_length()
+    with _PROMPT_STATS_LOCK:
+        _PROMPT_TOKENS.setdefault(name, Counter())[bucket] += 1
+        if compressed:
+            _PROMPT_COMPRESSIONS[name] += 1
+
+
+def load_prompt(
+    name: str,
+    token_budget: int | None = None,
+    digests: dict[str, str] | None = None,
+    **kwargs,
+) -> str:
     """
     Load a template from the prompts directory and renders
     it with the given kwargs.
 
+    If a token budget is given and the rendered prompt exceeds it, the
+    template's compressible variables are shrunk in priority order until
+    the prompt fits. Variables of equal priority are first swapped for
+    their digests, where given, and then truncated in proportion to their
+    length.
+
     Parameters
     ----------
     name: str
         The name of the template to load, without the .md extension.
+    token_budget: int | None
+        Maximum size of the rendered prompt in estimated tokens. See
+        `prompt_token_budget`. If None, the prompt is not compressed.
+    digests: dict[str, str] | None
+        Shorter stand-ins for compressible variables, used before truncating.
     **kwargs: dict
         The kwargs to render the template with.
 
@@ -35,8 +176,77 @@ def load_prompt(name: str, **kwargs) -> str:
     -------
     str
         The rendered template.
+
+    Raises
+    ------
+    PromptTooLargeError
+        If the prompt does not fit the budget after compressing every
+        compressible variable.
+    """
+    template = _env.get_template(f"{name}.md")
+    prompt = template.render(**kwargs)
+    tokens = estimate_tokens(prompt)
+    if token_budget is None or tokens <= token_budget:
+        _record_prompt_size(name, tokens, compressed=False)
+        return prompt
+
+    priorities = compressible_variables(name)
+    digests = digests or {}
+    for priority in sorted(set(priorities.values())):
+        group = [v for v in priorities if priorities[v] == priority and kwargs.get(v)]
+        if not group:
+            continue
+        for variable in group:
+            digest = digests.get(variable)
+            if digest is not None and len(digest) < len(str(kwargs[variable])):
+                kwargs[variable] = digest
+        prompt = template.render(**kwargs)
+        tokens = estimate_tokens(prompt)
+        if tokens <= token_budget:
+            break
+
+        # Truncate the group's variables in proportion to their length
+        lengths = {variable: len(str(kwargs[variable])) for variable in group}
+        excess = 4 * (tokens - token_budget) + len(_TRUNCATION_NOTE) * len(group)
+        for variable, length in lengths.items():
+            cut = -(-excess * length // sum(lengths.values()))
+            kwargs[variable] = str(kwargs[variable])[: max(0, length - cut)] + _TRUNCATION_NOTE
+        prompt = template.render(**kwargs)
+        tokens = estimate_tokens(prompt)
+        if tokens <= token_budget:
+            break
+
+    if tokens > token_budget:
+        raise PromptTooLargeError(
+            f"Prompt '{name}' is {tokens} tokens after compressing "
+            f"{sorted(priorities) or 'nothing'}, over its budget of {token_budget}"
+        )
+    logger.warning(
+        f"Compressed prompt '{name}' to {tokens} tokens to fit its budget of {token_budget}"
+    )
+    _record_prompt_size(name, tokens, compressed=True)
+    return prompt
+
+
+def prompt_token_stats() -> dict[str, dict]:
+    """
+    Histogram of rendered prompt sizes for each template.
+
+    Returns
+    -------
+    dict[str, dict]
+        For each template, "histogram" maps the upper bound of each
+        power-of-two token bucket to the number of prompts in it, and
+        "compressed" counts prompts that were compressed to fit a budget.
     """
-    return _env.get_template(f"{name}.md").render(**kwargs)
+    with _PROMPT_STATS_LOCK:
+        return {
+            name: {
+                "histogram": dict(sorted(buckets.items())),
+                "compressed": _PROMPT_COMPRESSIONS[name],
+            }
+            for name, buckets in sorted(_PROMPT_TOKENS.items())
+        }
 
 
 def validate_llm_response(response: AIMessage, agent_name: str, prompt: str, context: dict = None) -> str:
@@ -196,6 +406,15 @@ def parse_hypothesis_markdown(markdown_text: str) -> ParsedHypothesis:
     )
 
 
+_HYPOTHESIS_PARSING_INSTRUCTION = """Extract the scientific hypothesis from this text.
+The hypothesis should include:
+- The main hypothesis statement
+- Falsifiable predictions that could test the hypothesis
+- Underlying assumptions
+
+If any section is missing, extract what is available."""
+
+
 def parse_hypothesis_with_llm(
     llm: BaseChatModel,
     text: str,
@@ -229,14 +448,7 @@ def parse_hypothesis_with_llm(
     RuntimeError
         If parsing fails after all retry attempts
     """
-    instruction = """Extract the scientific hypothesis from this text.
-The hypothesis should include:
-- The main hypothesis statement
-- Falsifiable predictions that could test the hypothesis
-- Underlying assumptions
-
-If any section is missing, extract what is available."""
-
+    instruction = _HYPOTHESIS_PARSING_INSTRUCTION
     if use_robust_parsing:
         return robust_parse_with_llm(
             llm=llm,
@@ -254,6 +466,162 @@ If any section is missing, extract what is available."""
         ])
 
 
+def _repair_json(text: str) -> dict | None:
+    """
+    Parse a JSON object out of LLM output, repairing common defects.
+
+    Handles surrounding prose and code fences, trailing commas and smart
+    quotes used as JSON quotes. Returns None if no JSON object can be
+    recovered.
+    """
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    candidate = text[start : end + 1]
+    # Each repair is only applied if the text does not parse without it
+    repairs = [
+        lambda t: t,
+        lambda t: re.sub(r",\s*([}\]])", r"\1", t),
+        lambda t: t.replace("\u201c", '"').replace("\u201d", '"'),
+    ]
+    for repair in repairs:
+        candidate = repair(candidate)
+        try:
+            data = json.loads(candidate, strict=False)
+        except json.JSONDecodeError:
+            continue
+        return data if isinstance(data, dict) else None
+    return None
+
+
+def _hypothesis_from_json(data: dict) -> ParsedHypothesis:
+    """Build a ParsedHypothesis from a JSON object with loosely named keys."""
+    fields = {}
+    for key, value in data.items():
+        name = key.lower()
+        if "hypothesis" in name and isinstance(value, str):
+            fields["hypothesis"] = value
+        elif "prediction" in name:
+            fields["predictions"] = value
+        elif "assumption" in name:
+            fields["assumptions"] = value
+    return ParsedHypothesis(**fields)
+
+
+def parse_hypothesis_fast(text: str) -> tuple[ParsedHypothesis | None, str | None]:
+    """
+    Parse a hypothesis without an LLM call.
+
+    Tries the markdown headings the generation and evolution prompts ask
+    for, then a JSON object with light repairs. A result only counts if it
+    validates against ParsedHypothesis and has real predictions and
+    assumptions rather than placeholders.
+
+    Parameters
+    ----------
+    text : str
+        LLM output containing a hypothesis
+
+    Returns
+    -------
+    tuple[ParsedHypothesis | None, str | None]
+        The parsed hypothesis and the tier that produced it ("markdown" or
+        "json"), or (None, None) if neither tier succeeded.
+    """
+    try:
+        parsed = parse_hypothesis_markdown(text)
+        if not any(
+            item.startswith(_PLACEHOLDER_PREFIX)
+            for item in parsed.predictions + parsed.assumptions
+        ):
+            return parsed, "markdown"
+    except (AssertionError, ValidationError):
+        pass
+
+    data = _repair_json(text)
+    if data is not None:
+        try:
+            return _hypothesis_from_json(data), "json"
+        except ValidationError:
+            pass
+
+    return None, None
+
+
+def parse_hypothesis_tiered(llm: BaseChatModel, text: str) -> ParsedHypothesis:
+    """
+    Parse a hypothesis, calling the LLM only when local parsing fails.
+
+    `parse_hypothesis_fast` is tried first; the structured-output LLM parser
+    (`parse_hypothesis_with_llm`) is only used for text it cannot parse.
+    See `hypothesis_parse_stats` for how often each tier is used.
+
+    Parameters
+    ----------
+    llm : BaseChatModel
+        The language model to fall back to
+    text : str
+        Text containing hypothesis to parse
+
+    Returns
+    -------
+    ParsedHypothesis
+        Parsed hypothesis with structured fields
+
+    Raises
+    ------
+    RuntimeError
+        If the LLM fallback fails after all retry attempts
+    """
+    parsed, tier = parse_hypothesis_fast(text)
+    if parsed is None:
+        logger.info("Local hypothesis parsing failed, falling back to LLM parsing")
+        parsed, tier = parse_hypothesis_with_llm(llm, text), "llm"
+    with _PARSE_TIERS_LOCK:
+        _PARSE_TIERS[tier] += 1
+    return parsed
+
+
+async def aparse_hypothesis_tiered(llm: BaseChatModel, text: str) -> ParsedHypothesis:
+    """
+    Async version of `parse_hypothesis_tiered`.
+
+    The local tiers run synchronously since they are cheap; the LLM fallback
+    uses `ainvoke`, so cancelling the call (e.g. on a generation timeout)
+    stops the in-flight parser LLM call.
+    """
+    parsed, tier = parse_hypothesis_fast(text)
+    if parsed is None:
+        logger.info("Local hypothesis parsing failed, falling back to LLM parsing")
+        parsed = await arobust_parse_with_llm(
+            llm=llm,
+            text=text,
+            output_model=ParsedHypothesis,
+            instruction=_HYPOTHESIS_PARSING_INSTRUCTION,
+        )
+        tier = "llm"
+    with _PARSE_TIERS_LOCK:
+        _PARSE_TIERS[tier] += 1
+    return parsed
+
+
+def hypothesis_parse_stats() -> dict[str, float]:
+    """
+    Counts of hypotheses parsed by each tier of `parse_hypothesis_tiered`.
+
+    Returns
+    -------
+    dict[str, float]
+        Counts for the "markdown", "json" and "llm" tiers, and the fraction
+        of hypotheses parsed without an LLM call as "fast_path_rate".
+    """
+    with _PARSE_TIERS_LOCK:
+        counts = {tier: _PARSE_TIERS[tier] for tier in ("markdown", "json", "llm")}
+    total = sum(counts.values())
+    fast = counts["markdown"] + counts["json"]
+    return {**counts, "fast_path_rate": fast / total if total else 0.0}
+
+
 def _parse_numbered_list(content: str) -> list[str]:
     """
     Parse a numbered list from text content into a list of strings.
@@ -75,6 +75,15 @@ class ParsedHypothesis(BaseModel):
         return v
 
 
+class HypothesisBatch(BaseModel):
+    """Structured output for batch generation: several distinct hypotheses."""
+
+    hypotheses: list[ParsedHypothesis] = Field(
+        description="Distinct hypotheses, each with its own predictions and assumptions.",
+        min_length=1,
+    )
+
+
 class ReviewedHypothesis(ParsedHypothesis):
     """Structured output for reviewed hypothesis."""
 
@@ -85,6 +94,16 @@ class ReviewedHypothesis(ParsedHypothesis):
     verification_result: str = Field(
         description="The result of the deep verification process"
     )
+    review_card: str | None = Field(
+        default=None,
+        description="A compact summary of the review's strengths, weaknesses and key evidence",
+    )
+
+    @property
+    def prompt_review(self) -> str:
+        """The review card if one was written, otherwise the full review."""
+        # Hypotheses pickled before review cards existed have no such attribute
+        return getattr(self, "review_card", None) or self.verification_result
 
 
 class RankingMatchResult(BaseModel):
@@ -0,0 +1,167 @@
+"""
+Map-reduce summaries of tournament debates for the meta-review.
+
+Every match in the tournament stores its full debate transcript, so the
+debates read by the meta-review grow with the number of matches. When they
+exceed a token budget, the debates are split into chunks, each chunk is
+summarised concurrently by a cheaper model, and the summaries are merged in
+rounds until they fit. Chunks are formed greedily in match order, so earlier
+chunks keep their boundaries as matches are added. Every summary is cached in
+the goal directory under the SHA-256 of its input, so the next meta-review
+only summarises the chunks that changed.
+"""
+
+import asyncio
+import os
+from typing import Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+
+from coscientist.common import load_prompt, validate_llm_response
+from coscientist.report_digests import estimate_tokens, report_hash
+
+
+def chunk_by_tokens(texts: list[str], chunk_tokens: int) -> list[list[str]]:
+    """
+    Group texts in order into chunks of at most `chunk_tokens` tokens.
+
+    A text longer than `chunk_tokens` gets a chunk of its own.
+
+    Parameters
+    ----------
+    texts : list[str]
+        Texts in the order they should be read
+    chunk_tokens : int
+        Target size of a chunk in estimated tokens
+
+    Returns
+    -------
+    list[list[str]]
+        The chunks, in order
+    """
+    chunks: list[list[str]] = []
+    size = 0
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if not chunks or size + tokens > chunk_tokens:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(text)
+        size += tokens
+    return chunks
+
+
+class DebateSummarizer:
+    """
+    Map-reduce summariser for debate transcripts with a summary cache.
+
+    Parameters
+    ----------
+    output_dir : str
+        Goal directory; summaries are stored in its `debate_summaries` folder
+    llm : BaseChatModel
+        Model used for chunk summaries and merges
+    token_budget : int
+        Debates at or under this many estimated tokens are used as they are
+    chunk_tokens : int
+        Size of the chunks each summary call reads
+    """
+
+    DIRNAME = "debate_summaries"
+
+    def __init__(
+        self,
+        output_dir: str,
+        llm: BaseChatModel,
+        token_budget: int,
+        chunk_tokens: int = 12000,
+    ):
+        self.directory = os.path.join(output_dir, self.DIRNAME)
+        os.makedirs(self.directory, exist_ok=True)
+        self.llm = llm
+        self.token_budget = token_budget
+        self.chunk_tokens = chunk_tokens
+        # Summary calls made and served from the cache, since creation
+        self.calls = 0
+        self.cache_hits = 0
+
+    def _path(self, prompt_name: str, text: str) -> str:
+        return os.path.join(self.directory, f"{report_hash(prompt_name + text)}.md")
+
+    def _get(self, prompt_name: str, text: str) -> Optional[str]:
+        path = self._path(prompt_name, text)
+        if not os.path.exists(path):
+            return None
+        self.cache_hits += 1
+        with open(path, "r") as f:
+            return f.read()
+
+    def _put(self, prompt_name: str, text: str, summary: str) -> None:
+        # Write then rename so concurrent readers never see a partial summary
+        path = self._path(prompt_name, text)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(summary)
+        os.replace(tmp_path, path)
+
+    async def _asummarize(self, prompt_name: str, chunk: list[str]) -> str:
+        """Summarise one chunk, reading and filling the cache."""
+        text = "\n\n".join(chunk)
+        summary = self._get(prompt_name, text)
+        if summary is not None:
+            return summary
+
+        prompt = load_prompt(prompt_name, debates=text)
+        response = await self.llm.ainvoke(prompt)
+        summary = validate_llm_response(
+            response=response,
+            agent_name=prompt_name,
+            prompt=prompt,
+            context={"num_items": len(chunk)},
+        )
+        self.calls += 1
+        self._put(prompt_name, text, summary)
+        return summary
+
+    async def asummarize(self, debates: list[str]) -> str:
+        """
+        Debates as one text that fits the token budget.
+
+        Parameters
+        ----------
+        debates : list[str]
+            Formatted debates, in match order
+
+        Returns
+        -------
+        str
+            The debates joined by blank lines if they fit the budget, or
+            otherwise their merged summaries
+        """
+        if estimate_tokens("\n\n".join(debates)) <= self.token_budget:
+            return "\n\n".join(debates)
+
+        # Map: summarise chunks of debates concurrently
+        summaries = await asyncio.gather(
+            *[
+                self._asummarize("debate_chunk_summary", chunk)
+                for chunk in chunk_by_tokens(debates, self.chunk_tokens)
+            ]
+        )
+        # Reduce: merge neighbouring summaries until they fit or one is left
+        while (
+            len(summaries) > 1
+            and estimate_tokens("\n\n".join(summaries)) > self.token_budget
+        ):
+            chunks = chunk_by_tokens(summaries, self.chunk_tokens)
+            if len(chunks) == len(summaries):
+                # Every summary fills a chunk on its own; merge pairs instead
+                chunks = [summaries[i : i + 2] for i in range(0, len(summaries), 2)]
+            summaries = await asyncio.gather(
+                *[self._asummarize("debate_summary_merge", chunk) for chunk in chunks]
+            )
+        return "\n\n".join(summaries)
+
+    def summarize(self, debates: list[str]) -> str:
+        """Synchronous version of `asummarize`."""
+        return asyncio.run(self.asummarize(debates))
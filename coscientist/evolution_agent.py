@@ -21,9 +21,15 @@ that should in principle be better.
 from typing import TypedDict
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph
 
-from coscientist.common import load_prompt, parse_hypothesis_markdown, parse_hypothesis_with_llm, validate_llm_response
+from coscientist.common import (
+    aparse_hypothesis_tiered,
+    load_prompt,
+    parse_hypothesis_tiered,
+    validate_llm_response,
+)
 from coscientist.custom_types import ParsedHypothesis, ReviewedHypothesis
 
 
@@ -83,42 +89,74 @@ def build_evolution_agent(
         )
 
 
-def _evolve_from_feedback_node(
-    state: EvolveFromFeedbackState,
-    llm: BaseChatModel,
-) -> EvolveFromFeedbackState:
+def _evolution_node(
+    prompt_fn, validate_fn, finish_fn, llm: BaseChatModel
+) -> RunnableLambda:
+    """
+    Evolution node with sync and async versions.
+
+    The response is validated with `validate_fn` and parsed locally, with the
+    LLM parser as a fallback, before `finish_fn` builds the new state. The
+    async version awaits both the evolution and the parser LLM calls, so
+    cancelling it cancels whichever call is in flight.
+    """
+
+    def node(state):
+        prompt = prompt_fn(state)
+        response_content = validate_fn(state, prompt, llm.invoke(prompt))
+        return finish_fn(state, parse_hypothesis_tiered(llm, response_content))
+
+    async def anode(state):
+        prompt = prompt_fn(state)
+        response_content = validate_fn(state, prompt, await llm.ainvoke(prompt))
+        return finish_fn(state, await aparse_hypothesis_tiered(llm, response_content))
+
+    return RunnableLambda(node, afunc=anode)
+
+
+def _evolve_from_feedback_prompt(state: EvolveFromFeedbackState) -> str:
     """
-    Evolution node for evolving a hypothesis based on feedback.
+    Prompt for evolving a hypothesis based on feedback.
     """
-    prompt = load_prompt(
+    return load_prompt(
         "evolve_from_feedback",
         goal=state["goal"],
         hypothesis=state["parent_hypothesis"].hypothesis,
         review=state["parent_hypothesis"].verification_result,
         meta_review=state["meta_review"],
     )
-    response = llm.invoke(prompt)
-    response_content = validate_llm_response(
+
+
+def _validate_evolve_from_feedback(
+    state: EvolveFromFeedbackState, prompt: str, response
+) -> str:
+    """
+    Validate the evolved hypothesis response.
+    """
+    return validate_llm_response(
         response=response,
         agent_name="evolution_evolve_from_feedback",
         prompt=prompt,
         context={
             "goal": state["goal"],
-            "parent_hypothesis_uid": state["parent_hypothesis"].uid
-        }
+            "parent_hypothesis_uid": state["parent_hypothesis"].uid,
+        },
     )
-    # Use robust LLM-based parsing
-    parsed_hypothesis = parse_hypothesis_with_llm(llm, response_content)
+
+
+def _finish_evolve_from_feedback(
+    state: EvolveFromFeedbackState, parsed_hypothesis: ParsedHypothesis
+) -> EvolveFromFeedbackState:
+    """
+    Link the parsed hypothesis to its parent.
+    """
     parsed_hypothesis.parent_uid = state["parent_hypothesis"].uid
     return {**state, "evolved_hypothesis": parsed_hypothesis}
 
 
-def _out_of_the_box_node(
-    state: OutOfTheBoxState,
-    llm: BaseChatModel,
-) -> OutOfTheBoxState:
+def _out_of_the_box_prompt(state: OutOfTheBoxState) -> str:
     """
-    Evolution node for generating out-of-the-box ideas from top hypotheses.
+    Prompt for generating out-of-the-box ideas from top hypotheses.
     """
     # Convert list of hypotheses to formatted string
     hypotheses_text = "\n".join(
@@ -128,23 +166,31 @@ def _out_of_the_box_node(
         ]
     )
 
-    prompt = load_prompt(
+    return load_prompt(
         "out_of_the_box",
         goal=state["goal"],
         hypotheses=hypotheses_text,
     )
-    response = llm.invoke(prompt)
-    response_content = validate_llm_response(
+
+
+def _validate_out_of_the_box(state: OutOfTheBoxState, prompt: str, response) -> str:
+    """
+    Validate the out-of-the-box hypothesis response.
+    """
+    return validate_llm_response(
         response=response,
         agent_name="evolution_out_of_the_box",
         prompt=prompt,
-        context={
-            "goal": state["goal"],
-            "num_hypotheses": len(state["top_hypotheses"])
-        }
+        context={"goal": state["goal"], "num_hypotheses": len(state["top_hypotheses"])},
     )
-    # Use robust LLM-based parsing
-    parsed_hypothesis = parse_hypothesis_with_llm(llm, response_content)
+
+
+def _finish_out_of_the_box(
+    state: OutOfTheBoxState, parsed_hypothesis: ParsedHypothesis
+) -> OutOfTheBoxState:
+    """
+    Store the parsed out-of-the-box hypothesis.
+    """
     return {**state, "evolved_hypothesis": parsed_hypothesis}
 
 
@@ -166,7 +212,12 @@ def _build_evolve_from_feedback_agent(llm: BaseChatModel) -> StateGraph:
 
     graph.add_node(
         "evolution",
-        lambda state: _evolve_from_feedback_node(state, llm),
+        _evolution_node(
+            _evolve_from_feedback_prompt,
+            _validate_evolve_from_feedback,
+            _finish_evolve_from_feedback,
+            llm,
+        ),
     )
     graph.add_edge("evolution", END)
 
@@ -192,7 +243,12 @@ def _build_out_of_the_box_agent(llm: BaseChatModel) -> StateGraph:
 
     graph.add_node(
         "evolution",
-        lambda state: _out_of_the_box_node(state, llm),
+        _evolution_node(
+            _out_of_the_box_prompt,
+            _validate_out_of_the_box,
+            _finish_out_of_the_box,
+            llm,
+        ),
     )
 
     graph.add_edge("evolution", END)
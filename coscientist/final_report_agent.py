@@ -10,14 +10,19 @@ More details:
 - Provides detailed information for top k hypotheses including causal reasoning,
   verification results, and falsifiable predictions
 - Generates a structured scientific report suitable for domain experts
+- Optionally drafts the section for each top hypothesis concurrently and
+  writes the rest of the report in one assembly call
 """
 
-from typing import TypedDict
+import asyncio
+import logging
+from typing import NotRequired, TypedDict
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph
 
-from coscientist.common import load_prompt, validate_llm_response
+from coscientist.common import load_prompt, prompt_token_budget, validate_llm_response
 from coscientist.custom_types import ReviewedHypothesis
 from coscientist.ranking_agent import EloTournament
 
@@ -31,9 +36,17 @@ class FinalReportState(TypedDict):
     tournament: EloTournament
     top_k: int
     result: str
+    # Drafted analysis of each top hypothesis, in rank order
+    sections: NotRequired[list[str]]
 
 
-def build_final_report_agent(llm: BaseChatModel) -> StateGraph:
+# Line the assembly call writes where the drafted sections belong
+SECTIONS_MARKER = "<!-- TOP_HYPOTHESES -->"
+
+
+def build_final_report_agent(
+    llm: BaseChatModel, parallel_sections: bool = False
+) -> StateGraph:
     """
     Builds and configures a LangGraph for final report generation.
 
@@ -41,6 +54,12 @@ def build_final_report_agent(llm: BaseChatModel) -> StateGraph:
     ----------
     llm : BaseChatModel
         The language model to use for final report generation.
+    parallel_sections : bool
+        If True, the analysis of each top hypothesis is drafted in its own
+        concurrent call, and one assembly call writes the summary, research
+        directions and conclusions around them. Each call writes a fraction
+        of the report, so the report finishes sooner and is less likely to
+        be cut off at the output token limit.
 
     Returns
     -------
@@ -49,6 +68,14 @@ def build_final_report_agent(llm: BaseChatModel) -> StateGraph:
     """
     graph = StateGraph(FinalReportState)
 
+    if parallel_sections:
+        graph.add_node("draft_sections", _draft_sections_node(llm))
+        graph.add_node("assemble_report", _assemble_report_node(llm))
+        graph.add_edge("draft_sections", "assemble_report")
+        graph.add_edge("assemble_report", END)
+        graph.set_entry_point("draft_sections")
+        return graph.compile()
+
     graph.add_node(
         "final_report",
         lambda state: _final_report_node(state, llm),
@@ -72,7 +99,7 @@ def _format_detailed_hypothesis(hypothesis: ReviewedHypothesis, rating: float) -
         f"## Hypothesis {hypothesis.uid} (ELO: {rating:.2f})",
         f"**Hypothesis Statement:** {hypothesis.hypothesis}",
         f"**Causal Reasoning:** {hypothesis.causal_reasoning}",
-        f"**Verification Result:** {hypothesis.verification_result}",
+        f"**Verification Result:** {hypothesis.prompt_review}",
         f"**Falsifiable Predictions:** {' '.join(hypothesis.predictions)}",
     ]
     return "\n\n".join(sections)
@@ -86,6 +113,127 @@ def _get_top_hypotheses_data(
     return sorted_hypotheses[:top_k]
 
 
+def _hypotheses_by_ranking_text(tournament: EloTournament) -> str:
+    """Helper function to list all hypotheses sorted by ELO rating."""
+    return "\n".join(
+        _format_hypothesis_with_rating(tournament.hypotheses[hyp_id], rating)
+        for hyp_id, rating in tournament.get_sorted_hypotheses()
+    )
+
+
+def _section_prompts(state: FinalReportState, llm: BaseChatModel) -> list[str]:
+    """
+    One section prompt per top hypothesis, in rank order.
+    """
+    tournament = state["tournament"]
+    return [
+        load_prompt(
+            "final_report_section",
+            token_budget=prompt_token_budget(llm),
+            goal=state["goal"],
+            rank=rank,
+            hypothesis=_format_detailed_hypothesis(tournament.hypotheses[hyp_id], rating),
+        )
+        for rank, (hyp_id, rating) in enumerate(
+            _get_top_hypotheses_data(tournament, state.get("top_k", 3)), 1
+        )
+    ]
+
+
+def _finish_sections(
+    state: FinalReportState, prompts: list[str], responses: list
+) -> FinalReportState:
+    """
+    Validate the drafted sections.
+    """
+    sections = [
+        validate_llm_response(
+            response=response,
+            agent_name="final_report_section",
+            prompt=prompt,
+            context={"goal": state["goal"], "rank": rank},
+        )
+        for rank, (prompt, response) in enumerate(zip(prompts, responses), 1)
+    ]
+    return {**state, "sections": sections}
+
+
+def _draft_sections_node(llm: BaseChatModel) -> RunnableLambda:
+    """
+    Node that drafts the section for each top hypothesis concurrently, with
+    sync and async versions.
+    """
+
+    def node(state):
+        prompts = _section_prompts(state, llm)
+        # batch runs the calls in a thread pool
+        return _finish_sections(state, prompts, llm.batch(prompts))
+
+    async def anode(state):
+        prompts = _section_prompts(state, llm)
+        responses = await asyncio.gather(*[llm.ainvoke(prompt) for prompt in prompts])
+        return _finish_sections(state, prompts, responses)
+
+    return RunnableLambda(node, afunc=anode)
+
+
+def _assembly_prompt(state: FinalReportState, llm: BaseChatModel) -> str:
+    """
+    Prompt for the overview and conclusions around the drafted sections.
+    """
+    return load_prompt(
+        "final_report_assembly",
+        token_budget=prompt_token_budget(llm),
+        goal=state["goal"],
+        hypotheses_by_ranking=_hypotheses_by_ranking_text(state["tournament"]),
+        sections="\n\n".join(state["sections"]),
+        marker=SECTIONS_MARKER,
+    )
+
+
+def _finish_assembly(
+    state: FinalReportState, prompt: str, response
+) -> FinalReportState:
+    """
+    Validate the assembled report and put the drafted sections in place.
+    """
+    response_content = validate_llm_response(
+        response=response,
+        agent_name="final_report_assembly",
+        prompt=prompt,
+        context={"goal": state["goal"], "num_sections": len(state["sections"])},
+    )
+    sections = "\n\n".join(
+        ["### 3. Top-Ranked Hypotheses Analysis", *state["sections"]]
+    )
+    if SECTIONS_MARKER in response_content:
+        report = response_content.replace(SECTIONS_MARKER, sections, 1)
+    else:
+        logging.warning(
+            "Final report assembly did not mark where the hypothesis sections go; "
+            "appending them"
+        )
+        report = f"{response_content}\n\n{sections}"
+    return {**state, "result": report}
+
+
+def _assemble_report_node(llm: BaseChatModel) -> RunnableLambda:
+    """
+    Node that writes the rest of the report around the drafted sections,
+    with sync and async versions.
+    """
+
+    def node(state):
+        prompt = _assembly_prompt(state, llm)
+        return _finish_assembly(state, prompt, llm.invoke(prompt))
+
+    async def anode(state):
+        prompt = _assembly_prompt(state, llm)
+        return _finish_assembly(state, prompt, await llm.ainvoke(prompt))
+
+    return RunnableLambda(node, afunc=anode)
+
+
 def _final_report_node(
     state: FinalReportState,
     llm: BaseChatModel,
@@ -118,6 +266,7 @@ def _final_report_node(
 
     prompt = load_prompt(
         "final_report",
+        token_budget=prompt_token_budget(llm),
         goal=state["goal"],
         hypotheses_by_ranking=hypotheses_by_ranking_text,
         top_ranked_hypotheses=top_ranked_hypotheses_text,
@@ -9,6 +9,10 @@ import logging
 import math
 import os
 import random
+import sqlite3
+import time
+import weakref
+from collections import Counter, defaultdict
 
 import numpy as np
 from langchain_anthropic import ChatAnthropic
@@ -16,20 +20,29 @@ from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.graph import StateGraph
 
+from coscientist.common import hypothesis_parse_stats, prompt_token_stats
+from coscientist.custom_types import ParsedHypothesis
+from coscientist.debate_summaries import DebateSummarizer
 from coscientist.evolution_agent import build_evolution_agent
 from coscientist.final_report_agent import build_final_report_agent
 from coscientist.generation_agent import (
+    BatchConfig,
     CollaborativeConfig,
     IndependentConfig,
     build_generation_agent,
 )
 from coscientist.global_state import CoscientistStateManager, log_progress
 from coscientist.status_manager import StatusManager, ResearchStatus
+from coscientist.literature_index import LiteratureIndex
 from coscientist.literature_review_agent import build_literature_review_agent
 from coscientist.meta_review_agent import build_meta_review_agent
+from coscientist.multiturn import TranscriptWindow, summarize_turn_usage
 from coscientist.reasoning_types import ReasoningType
-from coscientist.reflection_agent import build_deep_verification_agent
+from coscientist.reflection_agent import ReflectionState, build_deep_verification_agent
+from coscientist.report_digests import ReportDigestCache
 from coscientist.supervisor_agent import build_supervisor_agent
 from coscientist.validation import (
     ValidationError,
@@ -77,6 +90,96 @@ class CoscientistConfig:
     specialist_fields : list[str]
         The fields of expertise for generation agents. This list should be expanded
         by the configuration agent.
+    streaming_pipeline : bool
+        If True, each generated hypothesis flows through reflection, proximity
+        embedding and round-robin ranking as soon as it exists, instead of
+        waiting for the whole generation batch to finish.
+    pipeline_queue_size : int
+        Maximum number of hypotheses buffered between two pipeline stages.
+    condense_reports : bool
+        If True, every research report gets a cached, citation-preserving
+        digest, and generation and deep verification prompts use digests for
+        the longest reports when the full text would exceed their token budget.
+    literature_review_token_budget : int
+        Token budget for the literature review in generation prompts.
+    assumption_research_token_budget : int
+        Token budget for assumption research in deep verification prompts.
+    literature_retrieval : bool
+        If True, subtopic reports are embedded into a per-run passage index
+        and each generation call receives only the passages most relevant to
+        its fields and reasoning types, within literature_review_token_budget.
+    literature_retrieval_top_k : int
+        Maximum number of passages retrieved per generation call.
+    subtopic_dedup_threshold : float
+        Embedding cosine similarity at or above which a newly proposed
+        literature review subtopic is treated as a duplicate and not researched.
+    early_start_min_reports : int | None
+        If set, `start` begins hypothesis generation once this many subtopic
+        reports are in, and later reports feed into subsequent generation
+        calls. If None, generation waits for the whole literature review.
+    straggler_deadline : float
+        Seconds that remaining subtopics get after the early start threshold
+        is reached. Subtopics still running are folded into the next
+        literature review expansion.
+    straggler_timeout : float
+        Seconds a straggler may keep running in the background before it is
+        cancelled, releasing its research slot. A cancelled straggler is
+        researched again by the next literature review expansion.
+    generation_concurrency : int
+        Maximum number of hypothesis generations and evolutions in flight at
+        once, shared by every such call on the event loop.
+    batch_generation_size : int
+        If greater than 1, independent generations are replaced by batch
+        generations that return up to this many distinct hypotheses from a
+        single structured-output LLM call, so the goal and literature review
+        are sent once per batch instead of once per hypothesis.
+    transcript_window : int | None
+        If set, agents in collaborative generation and simulated debates see
+        only this many recent turns verbatim plus a rolling summary of
+        earlier turns. If None, every turn sees the full transcript.
+    transcript_summary_every : int
+        Number of turns that fall out of the window before the rolling
+        summary is refreshed.
+    transcript_summary_llm : BaseChatModel
+        The language model that writes the rolling transcript summary.
+        Defaults to FAST_LLM from the config.
+    parallel_drafting : bool
+        If True, agents in collaborative generation draft at the same time
+        in each round and read each other's drafts before the next, and a
+        final merge turn writes the hypothesis. If False, agents take turns.
+    drafting_rounds : int
+        Number of drafting rounds before the merge turn when
+        parallel_drafting is True.
+    incremental_meta_review : bool
+        If True, each meta-review after the first updates the previous one
+        with only the matches played since it, instead of reading every
+        debate in the tournament.
+    debate_token_budget : int | None
+        If set, debates read by a meta-review that exceed this many tokens
+        are split into chunks, summarised concurrently and merged until they
+        fit. Chunk summaries are cached by content hash in the goal
+        directory. If None, the meta-review reads every debate in full.
+    debate_chunk_tokens : int
+        Number of tokens of debates or summaries read by each summary call.
+    debate_summary_llm : BaseChatModel
+        The language model that summarises debates. Defaults to FAST_LLM
+        from the config.
+    parallel_final_report : bool
+        If True, the final report's analysis of each top hypothesis is
+        drafted in its own concurrent call, and one assembly call writes the
+        overview and conclusions around them.
+    review_cards : bool
+        If True, reflection ends by writing a compact review card for each
+        reviewed hypothesis, and tournament and final report prompts use the
+        card instead of the full review.
+    review_card_llm : BaseChatModel
+        The language model that writes review cards. Defaults to FAST_LLM
+        from the config.
+    supervisor_fast_path : bool
+        If True, fixed rules choose the next action in unambiguous states
+        (unranked hypotheses right after generation, enough newly ranked
+        hypotheses for a meta-review) and the supervisor LLM is only called
+        when the rules defer.
 
     """
 
@@ -93,6 +196,32 @@ class CoscientistConfig:
         specialist_fields: list[str] | None = None,
         timeout_per_hypothesis: float = 300.0,
         max_turns: int = 10,
+        streaming_pipeline: bool = False,
+        pipeline_queue_size: int = 2,
+        condense_reports: bool = False,
+        literature_review_token_budget: int = 20000,
+        assumption_research_token_budget: int = 12000,
+        literature_retrieval: bool = False,
+        literature_retrieval_top_k: int = 12,
+        subtopic_dedup_threshold: float = 0.9,
+        early_start_min_reports: int | None = None,
+        straggler_deadline: float = 600.0,
+        straggler_timeout: float = 1800.0,
+        generation_concurrency: int = 4,
+        batch_generation_size: int = 1,
+        transcript_window: int | None = None,
+        transcript_summary_every: int = 3,
+        transcript_summary_llm: BaseChatModel = None,
+        parallel_drafting: bool = False,
+        drafting_rounds: int = 2,
+        incremental_meta_review: bool = False,
+        debate_token_budget: int | None = None,
+        debate_chunk_tokens: int = 12000,
+        debate_summary_llm: BaseChatModel = None,
+        parallel_final_report: bool = False,
+        review_cards: bool = False,
+        review_card_llm: BaseChatModel = None,
+        supervisor_fast_path: bool = False,
     ):
         """
         Initialize Coscientist configuration.
@@ -124,6 +253,54 @@ class CoscientistConfig:
         self.timeout_per_hypothesis = timeout_per_hypothesis
         self.max_turns = max_turns
 
+        # Pipeline settings
+        self.streaming_pipeline = streaming_pipeline
+        self.pipeline_queue_size = pipeline_queue_size
+
+        # Report condensation settings
+        self.condense_reports = condense_reports
+        self.literature_review_token_budget = literature_review_token_budget
+        self.assumption_research_token_budget = assumption_research_token_budget
+
+        # Literature retrieval settings
+        self.literature_retrieval = literature_retrieval
+        self.literature_retrieval_top_k = literature_retrieval_top_k
+        self.subtopic_dedup_threshold = subtopic_dedup_threshold
+
+        # Early start settings
+        self.early_start_min_reports = early_start_min_reports
+        self.straggler_deadline = straggler_deadline
+        self.straggler_timeout = straggler_timeout
+
+        # Generation settings
+        self.generation_concurrency = generation_concurrency
+        self.batch_generation_size = batch_generation_size
+
+        # Multi-turn transcript settings
+        self.transcript_window = transcript_window
+        self.transcript_summary_every = transcript_summary_every
+        self.transcript_summary_llm = transcript_summary_llm or _CONFIG_LLMS['FAST_LLM']
+
+        # Collaborative generation settings
+        self.parallel_drafting = parallel_drafting
+        self.drafting_rounds = drafting_rounds
+
+        # Meta-review settings
+        self.incremental_meta_review = incremental_meta_review
+        self.debate_token_budget = debate_token_budget
+        self.debate_chunk_tokens = debate_chunk_tokens
+        self.debate_summary_llm = debate_summary_llm or _CONFIG_LLMS['FAST_LLM']
+
+        # Final report settings
+        self.parallel_final_report = parallel_final_report
+
+        # Review card settings
+        self.review_cards = review_cards
+        self.review_card_llm = review_card_llm or _CONFIG_LLMS['FAST_LLM']
+
+        # Supervisor settings
+        self.supervisor_fast_path = supervisor_fast_path
+
 
 class CoscientistFramework:
     """
@@ -141,6 +318,19 @@ class CoscientistFramework:
 
         self.config = config
         self.state_manager = state_manager
+        self._reflection_checkpointer = None
+        self._report_digests = None
+        self._debate_summarizer = None
+        self._literature_index = None
+        # Early start: set once enough subtopic reports are in; subtopics that
+        # missed the soft deadline keep running here until the next expansion
+        self.literature_review_ready: asyncio.Event | None = None
+        self.straggler_research: dict[str, asyncio.Task] = {}
+        # Calls, hypotheses, tokens and seconds per generation mode
+        self.generation_stats: dict[str, Counter] = defaultdict(Counter)
+        self._generation_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
         
         # Initialize research provider at framework level
         # This will be used by ALL agents (literature_review, reflection, etc.)
@@ -236,48 +426,232 @@ class CoscientistFramework:
         runs them through deep verification, and adds the reviewed hypotheses
         to the state manager.
         """
+        # Finish reflections that were interrupted mid-run (e.g. by a crash)
+        # from their last checkpointed node before starting new ones.
+        for hypothesis in self.state_manager.in_flight_reflections:
+            logging.info(f"Resuming interrupted reflection for hypothesis {hypothesis.uid}")
+            final_reflection_state = self._reflect(
+                ReflectionState(hypothesis_to_review=hypothesis)
+            )
+            self._finish_reflection(final_reflection_state)
+
         while not self.state_manager.reflection_queue_is_empty:
             # This pops from the reflection queue until it's empty
             initial_reflection_state = self.state_manager.next_reflection_state()
-            llm_name = random.choice(self.list_reflection_llm_names())
-            reflection_agent = build_deep_verification_agent(
-                llm=self.config.reflection_agent_llms[llm_name],
-                review_llm=self.config.meta_review_agent_llm,
-                parallel=False,
-                checkpointer=None,
-            )
-            tracker = self._create_agent_tracker("reflection")
-            final_reflection_state = reflection_agent.invoke(
-                initial_reflection_state,
-                config={"callbacks": [tracker]}
+            final_reflection_state = self._reflect(initial_reflection_state)
+            self._finish_reflection(final_reflection_state)
+
+    async def _aresume_reflections(self) -> None:
+        """
+        Finish interrupted reflections from their last checkpointed node.
+
+        Each reflection runs in a worker thread, so the event loop stays free,
+        while the state manager is only updated on the loop.
+        """
+        for hypothesis in self.state_manager.in_flight_reflections:
+            logging.info(f"Resuming interrupted reflection for hypothesis {hypothesis.uid}")
+            final_reflection_state = await asyncio.to_thread(
+                self._reflect, ReflectionState(hypothesis_to_review=hypothesis)
             )
-            if final_reflection_state["passed_initial_filter"]:
-                self.state_manager.add_reviewed_hypothesis(
-                    final_reflection_state["reviewed_hypothesis"]
-                )
-                self.state_manager.advance_reviewed_hypothesis()
+            self._finish_reflection(final_reflection_state)
 
-    def _generate_new_hypothesis(self, timeout: float = 300.0) -> None:
+    async def _adrain_reflection_queue(self) -> None:
+        """
+        Reflect on every hypothesis in the reflection queue, one at a time,
+        in worker threads.
         """
-        Run the hypothesis generation for a given mode and config.
+        while not self.state_manager.reflection_queue_is_empty:
+            initial_reflection_state = self.state_manager.next_reflection_state()
+            final_reflection_state = await asyncio.to_thread(
+                self._reflect, initial_reflection_state
+            )
+            self._finish_reflection(final_reflection_state)
+
+    def _finish_reflection(self, final_reflection_state: ReflectionState) -> None:
+        """
+        Move a reflected hypothesis into the tournament (if it passed the
+        desk reject filter) and mark its reflection as complete.
+        """
+        if final_reflection_state["passed_initial_filter"]:
+            self.state_manager.add_reviewed_hypothesis(
+                final_reflection_state["reviewed_hypothesis"]
+            )
+            self.state_manager.advance_reviewed_hypothesis()
+        self.state_manager.complete_reflection(
+            final_reflection_state["hypothesis_to_review"].uid
+        )
+
+    @property
+    def reflection_checkpointer(self) -> SqliteSaver:
+        """
+        SQLite checkpointer for reflection runs, stored in the goal directory.
+
+        Every reflection node is checkpointed under the hypothesis UID, so an
+        interrupted reflection continues from its last completed node instead
+        of re-running the expensive assumption research.
+        """
+        if self._reflection_checkpointer is None:
+            path = os.path.join(
+                self.state_manager._state._output_dir, "reflection_checkpoints.sqlite"
+            )
+            # Reflections run in worker threads; SqliteSaver serializes access itself.
+            self._reflection_checkpointer = SqliteSaver(
+                sqlite3.connect(path, check_same_thread=False)
+            )
+        return self._reflection_checkpointer
+
+    @property
+    def report_digests(self) -> ReportDigestCache | None:
+        """Digest cache in the goal directory, or None if condensation is off."""
+        if not self.config.condense_reports:
+            return None
+        if self._report_digests is None:
+            self._report_digests = ReportDigestCache(self.state_manager._state._output_dir)
+        return self._report_digests
+
+    @property
+    def debate_summarizer(self) -> DebateSummarizer | None:
+        """Debate summariser for meta-reviews, or None if it is off."""
+        if self.config.debate_token_budget is None:
+            return None
+        if self._debate_summarizer is None:
+            self._debate_summarizer = DebateSummarizer(
+                self.state_manager._state._output_dir,
+                self.config.debate_summary_llm,
+                token_budget=self.config.debate_token_budget,
+                chunk_tokens=self.config.debate_chunk_tokens,
+            )
+        return self._debate_summarizer
+
+    @property
+    def transcript_window(self) -> TranscriptWindow | None:
+        """Transcript window for multi-turn agents, if enabled."""
+        if self.config.transcript_window is None:
+            return None
+        return TranscriptWindow(
+            keep_last=self.config.transcript_window,
+            summary_llm=self.config.transcript_summary_llm,
+            summarize_every=self.config.transcript_summary_every,
+        )
+
+    @property
+    def literature_index(self) -> LiteratureIndex | None:
+        """Passage index in the goal directory, or None if retrieval is off."""
+        if not self.config.literature_retrieval:
+            return None
+        if self._literature_index is None:
+            self._literature_index = LiteratureIndex(
+                self.state_manager._state._output_dir,
+                self.config.proximity_agent_embedding_model,
+            )
+        return self._literature_index
+
+    def _reflect(self, initial_reflection_state: ReflectionState) -> ReflectionState:
+        """
+        Run deep verification for a single hypothesis, resuming from the last
+        checkpointed node if this hypothesis was reflected on before.
+
+        This does not touch the state manager, so it can safely run in a
+        worker thread.
+        """
+        llm_name = random.choice(self.list_reflection_llm_names())
+        reflection_agent = build_deep_verification_agent(
+            llm=self.config.reflection_agent_llms[llm_name],
+            review_llm=self.config.meta_review_agent_llm,
+            parallel=False,
+            checkpointer=self.reflection_checkpointer,
+            research_provider=self.research_provider,
+            report_digests=self.report_digests,
+            research_token_budget=self.config.assumption_research_token_budget,
+            review_card_llm=self.config.review_card_llm if self.config.review_cards else None,
+        )
+        tracker = self._create_agent_tracker("reflection")
+        run_config = {
+            "callbacks": [tracker],
+            "configurable": {
+                "thread_id": initial_reflection_state["hypothesis_to_review"].uid
+            },
+        }
+
+        checkpoint = reflection_agent.get_state(run_config)
+        if not checkpoint.values:
+            return reflection_agent.invoke(initial_reflection_state, config=run_config)
+        if checkpoint.next:
+            # Passing None continues the thread from its last checkpoint
+            return reflection_agent.invoke(None, config=run_config)
+        # The graph finished before the crash; only the state update was lost
+        return checkpoint.values
+
+    def _plan_generations(self, n_hypotheses: int) -> list[tuple[str, int]]:
+        """
+        Split a number of hypotheses into generation calls.
+
+        Each call gets a random generation mode. When batch generation is
+        enabled, independent calls become batch calls of up to
+        `config.batch_generation_size` hypotheses.
 
         Parameters
         ----------
-        timeout : float
-            Timeout in seconds for hypothesis generation. Default is 300 (5 minutes).
+        n_hypotheses : int
+            Number of hypotheses to generate.
+
+        Returns
+        -------
+        list[tuple[str, int]]
+            The mode and number of hypotheses of each generation call.
         """
         # TODO: The mode and roles should be selected by the supervisor agent.
+        plan = []
+        remaining = n_hypotheses
+        while remaining > 0:
+            mode = random.choice(self.list_generation_modes())
+            size = 1
+            if mode == "independent" and self.config.batch_generation_size > 1:
+                size = min(self.config.batch_generation_size, remaining)
+                if size > 1:
+                    mode = "batch"
+            plan.append((mode, size))
+            remaining -= size
+        return plan
+
+    def _setup_generation(
+        self, mode: str | None = None, n_hypotheses: int = 1
+    ) -> tuple[str, StateGraph, dict]:
+        """
+        Pick roles for a generation mode, then build the generation agent
+        and its initial state.
+
+        Parameters
+        ----------
+        mode : str | None
+            The generation mode. If None, a mode is picked at random.
+        n_hypotheses : int
+            Number of hypotheses for a batch generation.
+
+        Returns
+        -------
+        tuple[str, StateGraph, dict]
+            The mode, the compiled generation agent and its initial state.
+        """
         # Randomly pick a mode, a reasoning type, and a specialist field.
-        mode = random.choice(self.list_generation_modes())
-        if mode == "independent":
+        mode = mode or random.choice(self.list_generation_modes())
+        if mode in ("independent", "batch"):
             llm_name = random.choice(self.list_generation_llm_names())
             reasoning_type = random.choice(self.list_reasoning_types())
             specialist_field = random.choice(self.list_specialist_fields())
-            config = IndependentConfig(
-                llm=self.config.generation_agent_llms[llm_name],
-                reasoning_type=getattr(ReasoningType, reasoning_type),
-                field=specialist_field,
-            )
+            if mode == "batch":
+                config = BatchConfig(
+                    llm=self.config.generation_agent_llms[llm_name],
+                    reasoning_type=getattr(ReasoningType, reasoning_type),
+                    field=specialist_field,
+                    n_hypotheses=n_hypotheses,
+                )
+            else:
+                config = IndependentConfig(
+                    llm=self.config.generation_agent_llms[llm_name],
+                    reasoning_type=getattr(ReasoningType, reasoning_type),
+                    field=specialist_field,
+                )
             first_agent_name = None
         elif mode == "collaborative":
             llm_names = np.random.choice(self.list_generation_llm_names(), 2).tolist()
@@ -302,39 +676,172 @@ class CoscientistFramework:
                     for name, llm_name in zip(agent_names, llm_names)
                 },
                 max_turns=self.config.max_turns,
+                transcript_window=self.transcript_window,
+                parallel_drafting=self.config.parallel_drafting,
+                drafting_rounds=self.config.drafting_rounds,
             )
             first_agent_name = agent_names[0]
 
+        # Retrieve only the literature relevant to the chosen fields and reasoning
+        literature_context = None
+        if self.literature_index is not None:
+            if mode in ("independent", "batch"):
+                fields, reasonings = [specialist_field], [reasoning_type]
+            else:
+                fields, reasonings = specialist_fields, reasoning_types
+            query = (
+                f"{self.state_manager._state.goal}\n"
+                f"Fields: {', '.join(sorted(set(fields)))}\n"
+                f"Reasoning: {', '.join(sorted(set(reasonings)))}"
+            )
+            literature_context = self.literature_index.context_for(
+                query,
+                self.config.literature_review_token_budget,
+                self.config.literature_retrieval_top_k,
+            )
+
         # TODO: Make this async
         generation_agent = build_generation_agent(mode, config)
         initial_generation_state = self.state_manager.next_generation_state(
-            mode, first_agent_name
+            mode,
+            first_agent_name,
+            report_digests=self.report_digests,
+            token_budget=self.config.literature_review_token_budget,
+            literature_context=literature_context,
         )
+        return mode, generation_agent, initial_generation_state
 
-        # Note: Since this is a sync method being called from async context,
-        # we can't use asyncio.wait_for here. The timeout should be implemented
-        # in the agent itself or by making this method async.
-        logging.info(f"Starting hypothesis generation with mode: {mode}")
-        
-        # Add agent state tracking
-        from coscientist.agent_state_tracker import create_tracker
-        tracker = create_tracker(
-            output_dir=self.state_manager._state._output_dir,
-            agent_name=f"generation_{mode}"
+    @property
+    def generation_slots(self) -> asyncio.Semaphore:
+        """
+        Concurrency limit shared by all generation and evolution calls on the
+        running loop.
+        """
+        loop = asyncio.get_running_loop()
+        slots = self._generation_slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(self.config.generation_concurrency)
+            self._generation_slots[loop] = slots
+        return slots
+
+    async def _agenerate_hypotheses(
+        self, mode: str | None = None, n_hypotheses: int = 1, timeout: float = 300.0
+    ) -> list[ParsedHypothesis]:
+        """
+        Set up and run one generation call under the shared concurrency limit.
+
+        The generation agent runs with `ainvoke`, so when the timeout fires
+        the in-flight LLM calls are cancelled rather than left running in a
+        worker thread. Failures and timeouts are recorded in the state
+        manager instead of raised. Token usage and latency of successful
+        calls are added to `generation_stats`.
+
+        Parameters
+        ----------
+        mode : str | None
+            The generation mode. If None, a mode is picked at random.
+        n_hypotheses : int
+            Number of hypotheses, for batch generation.
+        timeout : float
+            Timeout in seconds per hypothesis, not counting the time spent
+            waiting for a free slot.
+
+        Returns
+        -------
+        list[ParsedHypothesis]
+            The generated hypotheses; empty if the generation failed.
+        """
+        timeout = timeout * n_hypotheses
+        async with self.generation_slots:
+            started_at = time.monotonic()
+            try:
+                mode, generation_agent, initial_generation_state = await asyncio.to_thread(
+                    self._setup_generation, mode, n_hypotheses
+                )
+                logging.info(f"Starting hypothesis generation with mode: {mode}")
+                tracker = self._create_agent_tracker(f"generation_{mode}")
+                final_generation_state = await asyncio.wait_for(
+                    generation_agent.ainvoke(
+                        initial_generation_state, config={"callbacks": [tracker]}
+                    ),
+                    timeout=timeout,
+                )
+                if mode == "batch":
+                    hypotheses = final_generation_state["hypotheses"]
+                else:
+                    hypotheses = [final_generation_state["hypothesis"]]
+                if final_generation_state.get("turn_usage"):
+                    log_progress(
+                        self.state_manager._state._output_dir,
+                        "TRANSCRIPT_USAGE",
+                        f"{mode} generation: "
+                        + summarize_turn_usage(final_generation_state["turn_usage"]),
+                    )
+                self.generation_stats[mode].update(
+                    calls=1,
+                    hypotheses=len(hypotheses),
+                    input_tokens=tracker.input_tokens,
+                    output_tokens=tracker.output_tokens,
+                    seconds=time.monotonic() - started_at,
+                )
+                return hypotheses
+            except asyncio.TimeoutError:
+                error = f"timed out after {timeout} seconds"
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+
+        self.state_manager.record_generation_failure(
+            mode or "setup", error, time.monotonic() - started_at
         )
-        
-        try:
-            final_generation_state = generation_agent.invoke(
-                initial_generation_state,
-                config={"callbacks": [tracker]}
+        log_progress(
+            self.state_manager._state._output_dir,
+            "GENERATION_FAILED",
+            f"{mode or 'setup'} generation {error}",
+        )
+        return []
+
+    def _log_generation_stats(self) -> None:
+        """
+        Log tokens and latency per hypothesis for each generation mode, and
+        how often hypotheses were parsed without an LLM call.
+        """
+        for mode, stats in sorted(self.generation_stats.items()):
+            n = stats["hypotheses"]
+            if not n:
+                continue
+            log_progress(
+                self.state_manager._state._output_dir,
+                "GENERATION_STATS",
+                f"{mode}: {n} hypotheses in {stats['calls']} calls, "
+                f"{stats['input_tokens'] / n:.0f} input and "
+                f"{stats['output_tokens'] / n:.0f} output tokens and "
+                f"{stats['seconds'] / n:.1f}s per hypothesis",
             )
-            self.state_manager.add_generated_hypothesis(
-                final_generation_state["hypothesis"]
+        parse_stats = hypothesis_parse_stats()
+        if not parse_stats["markdown"] + parse_stats["json"] + parse_stats["llm"]:
+            return
+        log_progress(
+            self.state_manager._state._output_dir,
+            "HYPOTHESIS_PARSING",
+            f"{parse_stats['fast_path_rate']:.0%} parsed without an LLM call "
+            f"(markdown {parse_stats['markdown']}, json {parse_stats['json']}, "
+            f"llm {parse_stats['llm']})",
+        )
+
+    def _log_prompt_stats(self) -> None:
+        """
+        Log a histogram of rendered prompt sizes for each prompt template, and
+        how many prompts had to be compressed to fit their model's context.
+        """
+        for name, stats in prompt_token_stats().items():
+            histogram = ", ".join(
+                f"<={bucket}: {count}" for bucket, count in stats["histogram"].items()
+            )
+            log_progress(
+                self.state_manager._state._output_dir,
+                "PROMPT_TOKENS",
+                f"{name}: {histogram}; {stats['compressed']} compressed",
             )
-            logging.info("Hypothesis generation completed successfully")
-        except Exception as e:
-            logging.error(f"Hypothesis generation failed: {e}")
-            raise
 
     async def start(self, n_hypotheses: int = 8, max_subtopics: int = 5) -> None:
         """
@@ -356,26 +863,46 @@ class CoscientistFramework:
             )
 
         # Perform the initial literature review.
+        literature_review_task = None
         if not self.state_manager.has_literature_review:
-            literature_review_agent = build_literature_review_agent(
-                self.config.literature_review_agent_llm,
-                framework=self  # Pass framework for research provider access
-            )
-            initial_lit_review_state = self.state_manager.next_literature_review_state(
-                max_subtopics=max_subtopics  # Now configurable
+            literature_review_task = asyncio.create_task(
+                self._run_initial_literature_review(max_subtopics)
             )
-            tracker = self._create_agent_tracker("literature_review")
-            final_lit_review_state = await literature_review_agent.ainvoke(
-                initial_lit_review_state,
-                config={"callbacks": [tracker]}
+            if self.config.early_start_min_reports:
+                # Start generating as soon as enough reports are in
+                self.literature_review_ready = asyncio.Event()
+                ready_task = asyncio.create_task(self.literature_review_ready.wait())
+                await asyncio.wait(
+                    {literature_review_task, ready_task},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                ready_task.cancel()
+                if literature_review_task.done():
+                    literature_review_task.result()  # Raise research failures
+                else:
+                    log_progress(
+                        self.state_manager._state._output_dir,
+                        "EARLY_START",
+                        "Generating hypotheses while the literature review finishes",
+                    )
+            else:
+                await literature_review_task
+
+        try:
+            _ = await self.generate_new_hypotheses(
+                n_hypotheses=max(0, n_hypotheses - self.state_manager.total_hypotheses),
+                timeout_per_hypothesis=self.config.timeout_per_hypothesis,
             )
-            self.state_manager.update_literature_review(final_lit_review_state)
+        except BaseException:
+            # Do not leave an early-started review running unobserved
+            if literature_review_task is not None:
+                literature_review_task.cancel()
+                await asyncio.gather(literature_review_task, return_exceptions=True)
+            raise
 
-        # TODO: Make this async
-        _ = await self.generate_new_hypotheses(
-            n_hypotheses=max(0, n_hypotheses - self.state_manager.total_hypotheses),
-            timeout_per_hypothesis=self.config.timeout_per_hypothesis,
-        )
+        # The rest of the review is bounded by the straggler deadline
+        if literature_review_task is not None:
+            await literature_review_task
 
         # Run the EloTournament
         # The top k for the bracket should the nearest power of
@@ -404,39 +931,196 @@ class CoscientistFramework:
         timeout_per_hypothesis : float
             Timeout in seconds for each hypothesis generation. Default is 300 (5 minutes).
         """
-        for i in range(n_hypotheses):
-            try:
-                logging.info(f"Generating hypothesis {i+1}/{n_hypotheses}")
-                # Run the sync method in an executor with timeout
-                await asyncio.wait_for(
-                    asyncio.to_thread(self._generate_new_hypothesis),
-                    timeout=timeout_per_hypothesis,
-                )
-                self.state_manager.advance_hypothesis(kind="generated")
-            except asyncio.TimeoutError:
-                logging.error(
-                    f"Hypothesis generation {i+1}/{n_hypotheses} timed out after "
-                    f"{timeout_per_hypothesis} seconds. Skipping."
-                )
-            except Exception as e:
-                logging.error(
-                    f"Hypothesis generation {i+1}/{n_hypotheses} failed: {e}. Skipping."
+        if self.config.streaming_pipeline:
+            await self._run_hypothesis_pipeline(n_hypotheses, timeout_per_hypothesis)
+            return
+
+        # Generations run concurrently up to config.generation_concurrency; each
+        # hypothesis is added to the state on the event loop as soon as it exists
+        tasks = [
+            asyncio.create_task(self._agenerate_hypotheses(mode, size, timeout_per_hypothesis))
+            for mode, size in self._plan_generations(n_hypotheses)
+        ]
+        n_generated = 0
+        try:
+            for next_hypotheses in asyncio.as_completed(tasks):
+                for hypothesis in await next_hypotheses:
+                    self.state_manager.add_generated_hypothesis(hypothesis)
+                    self.state_manager.advance_hypothesis(kind="generated")
+                    n_generated += 1
+        finally:
+            # Cancelling this call cancels the generations still in flight
+            for task in tasks:
+                task.cancel()
+        logging.info(f"Generated {n_generated}/{n_hypotheses} hypotheses")
+        self._log_generation_stats()
+
+        # Now run through the review queue and perform deep verification, in
+        # worker threads so straggling literature research keeps running
+        await self._aresume_reflections()
+        await self._adrain_reflection_queue()
+        self.state_manager.update_proximity_graph_edges()
+
+    async def _run_hypothesis_pipeline(
+        self, n_hypotheses: int, timeout_per_hypothesis: float = 300.0
+    ) -> None:
+        """
+        Generate hypotheses as a streaming pipeline: generate -> reflect -> rank.
+
+        Each stage runs as its own task and hands hypotheses to the next stage
+        through a bounded queue, so reflection of one hypothesis overlaps the
+        generation of the next, and reviewed hypotheses are seeded into the
+        tournament (with their round-robin matches) as soon as they exist.
+
+        Generation runs on the event loop with `ainvoke` and other LLM calls
+        run in worker threads, while every state manager update happens on
+        the event loop, so the state is never mutated (or pickled)
+        concurrently.
+
+        Parameters
+        ----------
+        n_hypotheses : int
+            Number of hypotheses to generate.
+        timeout_per_hypothesis : float
+            Timeout in seconds for each hypothesis generation.
+        """
+        from coscientist.proximity_agent import create_embedding
+
+        output_dir = self.state_manager._state._output_dir
+        queue_size = self.config.pipeline_queue_size
+        to_reflect: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        to_rank: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        started_at = time.monotonic()
+        first_ranked_at = None
+
+        async def generate_stage() -> None:
+            # Generations run concurrently up to config.generation_concurrency,
+            # and each hypothesis moves on as soon as its call finishes
+            tasks = [
+                asyncio.create_task(
+                    self._agenerate_hypotheses(mode, size, timeout_per_hypothesis)
                 )
+                for mode, size in self._plan_generations(n_hypotheses)
+            ]
+            try:
+                for next_hypotheses in asyncio.as_completed(tasks):
+                    for hypothesis in await next_hypotheses:
+                        try:
+                            embedding = await asyncio.to_thread(
+                                create_embedding, hypothesis.hypothesis
+                            )
+                        except Exception as e:
+                            logging.error(
+                                f"Embedding hypothesis {hypothesis.uid} failed: {e}. Skipping."
+                            )
+                            continue
+
+                        self.state_manager.add_generated_hypothesis(hypothesis)
+                        self.state_manager.advance_hypothesis(
+                            kind="generated", embedding=embedding
+                        )
+                        await to_reflect.put(hypothesis.uid)
+            finally:
+                for task in tasks:
+                    task.cancel()
+            await to_reflect.put(None)
+
+        async def reflect_stage() -> None:
+            while (uid := await to_reflect.get()) is not None:
+                # Pop this hypothesis, not whatever else is queued before it
+                initial_reflection_state = self.state_manager.next_reflection_state(uid)
+                try:
+                    final_reflection_state = await asyncio.to_thread(
+                        self._reflect, initial_reflection_state
+                    )
+                except Exception as e:
+                    logging.error(f"Reflection failed for hypothesis {uid}: {e}. Skipping.")
+                    continue
+                if final_reflection_state["passed_initial_filter"]:
+                    await to_rank.put(final_reflection_state["reviewed_hypothesis"])
+                else:
+                    self.state_manager.complete_reflection(uid)
+            await to_rank.put(None)
+
+        async def rank_stage() -> None:
+            nonlocal first_ranked_at
+            tournament = self.state_manager._state.tournament
+            llm = self.config.meta_review_agent_llm
+            while (reviewed_hypothesis := await to_rank.get()) is not None:
+                self.state_manager.add_reviewed_hypothesis(reviewed_hypothesis)
+                self.state_manager.advance_reviewed_hypothesis()
+                uid = reviewed_hypothesis.uid
+                self.state_manager.complete_reflection(uid)
+                for opponent_uid in tournament.pending_round_robin_opponents(uid):
+                    try:
+                        winner, debate = await asyncio.to_thread(
+                            tournament.judge_match, uid, opponent_uid, llm
+                        )
+                    except Exception as e:
+                        logging.error(
+                            f"Match {uid} vs {opponent_uid} failed: {e}. Skipping."
+                        )
+                        continue
+                    tournament.record_match(uid, opponent_uid, winner, debate)
+                    if first_ranked_at is None:
+                        first_ranked_at = time.monotonic() - started_at
+                        log_progress(
+                            output_dir,
+                            "PIPELINE",
+                            f"First ranked hypothesis after {first_ranked_at:.0f}s",
+                        )
+
+        # Reflections interrupted by a crash go first, and hypotheses that were
+        # queued before this call are reflected once the pipeline is done
+        await self._aresume_reflections()
+        await asyncio.gather(generate_stage(), reflect_stage(), rank_stage())
+        await self._adrain_reflection_queue()
 
-        # Now run through the review queue and perform deep verification
-        self.process_reflection_queue()
         self.state_manager.update_proximity_graph_edges()
+        self._log_generation_stats()
+        log_progress(
+            output_dir,
+            "PIPELINE",
+            f"Streamed {n_hypotheses} hypotheses in {time.monotonic() - started_at:.0f}s",
+        )
 
     async def evolve_hypotheses(self, n_hypotheses: int = 4) -> None:
         """
         Takes the top (n_hypotheses // 2) hypotheses and evolves them. Also
-        randomly selects (n_hypotheses // 2) hypotheses to evolve.
+        randomly selects (n_hypotheses // 2) hypotheses to evolve. Hypotheses
+        already evolved against the current meta-review are skipped, as is
+        the out-of-the-box evolution when the top hypotheses are unchanged.
         """
         assert n_hypotheses >= 2, "Must evolve at least two hypotheses"
         assert self.state_manager.is_started, "Coscientist system must be started first"
-        evolution_candidate_uids = (
-            self.state_manager.get_tournament_hypotheses_for_evolution()
-        )
+        output_dir = self.state_manager._state._output_dir
+
+        # Skip hypotheses that were already evolved against the current
+        # meta-review; evolving them again would repeat the same LLM call
+        evolution_keys = {}
+        skipped = 0
+        for uid in self.state_manager.get_tournament_hypotheses_for_evolution():
+            key = self.state_manager.evolution_key(
+                "evolve_from_feedback",
+                [self.state_manager.get_hypothesis_by_uid(uid, "tournament")],
+            )
+            if self.state_manager.evolution_was_tried(key):
+                skipped += 1
+            else:
+                evolution_keys[uid] = key
+        evolution_candidate_uids = list(evolution_keys)
+        if skipped:
+            log_progress(
+                output_dir,
+                "EVOLUTION_MEMO",
+                f"Skipped {skipped} hypotheses already evolved against the current meta-review",
+            )
+        if len(evolution_candidate_uids) < 2:
+            logging.warning(
+                f"Only {len(evolution_candidate_uids)} hypotheses have not been evolved "
+                "against the current meta-review. Skipping evolution."
+            )
+            return
         if len(evolution_candidate_uids) < n_hypotheses:
             logging.warning(
                 f"Only {len(evolution_candidate_uids)} hypotheses are qualified for evolution. "
@@ -453,57 +1137,99 @@ class CoscientistFramework:
             replace=False,
         ).tolist()
 
-        # Evolve the top ranked and random hypotheses based on feedback
-        for uid in top_ranked_uids + random_uids:
-            initial_evolution_state = self.state_manager.next_evolution_state(
-                mode="evolve_from_feedback", uid_to_evolve=uid
-            )
-            llm_name = random.choice(self.list_evolution_llm_names())
-            evolution_agent = build_evolution_agent(
-                mode="evolve_from_feedback",
-                llm=self.config.evolution_agent_llms[llm_name],
-            )
-            tracker = self._create_agent_tracker("evolution_evolve")
-            final_evolution_state = evolution_agent.invoke(
-                initial_evolution_state,
-                config={"callbacks": [tracker]}
-            )
-            self.state_manager.add_evolved_hypothesis(
-                final_evolution_state["evolved_hypothesis"]
+        # Evolve the top ranked and random hypotheses based on feedback and,
+        # since it only needs the known top k, run one round of evolving the
+        # top ranked hypotheses into something new at the same time
+        evolutions = [
+            (
+                "evolve_from_feedback",
+                self.state_manager.next_evolution_state(
+                    mode="evolve_from_feedback", uid_to_evolve=uid
+                ),
+                evolution_keys[uid],
             )
-            self.state_manager.advance_hypothesis(kind="evolved")
-
-        # Run one round instance of evolving the top ranked hypotheses
-        # into something new
-        out_of_box_initial_state = self.state_manager.next_evolution_state(
+            for uid in top_ranked_uids + random_uids
+        ]
+        out_of_the_box_state = self.state_manager.next_evolution_state(
             mode="out_of_the_box",
             top_k=n_hypotheses // 2,
         )
-        llm_name = random.choice(self.list_evolution_llm_names())
-        evolution_agent = build_evolution_agent(
-            mode="out_of_the_box", llm=self.config.evolution_agent_llms[llm_name]
-        )
-        tracker = self._create_agent_tracker("evolution_oob")
-        out_of_box_state = evolution_agent.invoke(
-            out_of_box_initial_state,
-            config={"callbacks": [tracker]}
+        out_of_the_box_key = self.state_manager.evolution_key(
+            "out_of_the_box", out_of_the_box_state["top_hypotheses"]
         )
-        self.state_manager.add_evolved_hypothesis(
-            out_of_box_state["evolved_hypothesis"]
+        if self.state_manager.evolution_was_tried(out_of_the_box_key):
+            log_progress(
+                output_dir,
+                "EVOLUTION_MEMO",
+                "Skipped out-of-the-box evolution, the top hypotheses are unchanged",
+            )
+        else:
+            evolutions.append(
+                ("out_of_the_box", out_of_the_box_state, out_of_the_box_key)
+            )
+        # A failed evolution is recorded without affecting the others
+        started_at = time.monotonic()
+        results = await asyncio.gather(
+            *[
+                self._aevolve(mode, initial_evolution_state)
+                for mode, initial_evolution_state, _ in evolutions
+            ],
+            return_exceptions=True,
         )
 
-        # Move the evolved hypotheses to the reflection queue
-        self.state_manager.advance_hypothesis(kind="evolved")
+        # Add the results in selection order, whatever order they finished in,
+        # and move them to the reflection queue
+        for result, (mode, _, evolution_key) in zip(results, evolutions):
+            if isinstance(result, BaseException):
+                error = f"{type(result).__name__}: {result}"
+                self.state_manager.record_generation_failure(
+                    mode, error, time.monotonic() - started_at
+                )
+                log_progress(output_dir, "EVOLUTION_FAILED", f"{mode} evolution {error}")
+                continue
+            self.state_manager.add_evolved_hypothesis(result, evolution_key)
+            self.state_manager.advance_hypothesis(kind="evolved")
 
         # TODO: Do we have to worry about reflecting on hypotheses that are
         # already in the reflection queue but weren't advanced yet?
         # Do we always want to run reflection immediately after a hypothesis
         # is generated?
-        self.process_reflection_queue()
+        await self._aresume_reflections()
+        await self._adrain_reflection_queue()
 
         # Move the reviewed hypothesis to the EloTournament.
         self.state_manager.update_proximity_graph_edges()
 
+    async def _aevolve(self, mode: str, initial_evolution_state: dict) -> ParsedHypothesis:
+        """
+        Run one evolution agent under the shared generation concurrency limit.
+
+        Parameters
+        ----------
+        mode : str
+            "evolve_from_feedback" or "out_of_the_box"
+        initial_evolution_state : dict
+            Initial state from `next_evolution_state`
+
+        Returns
+        -------
+        ParsedHypothesis
+            The evolved hypothesis
+        """
+        async with self.generation_slots:
+            llm_name = random.choice(self.list_evolution_llm_names())
+            evolution_agent = build_evolution_agent(
+                mode=mode, llm=self.config.evolution_agent_llms[llm_name]
+            )
+            tracker = self._create_agent_tracker(
+                "evolution_evolve" if mode == "evolve_from_feedback" else "evolution_oob"
+            )
+            final_evolution_state = await evolution_agent.ainvoke(
+                initial_evolution_state,
+                config={"callbacks": [tracker]}
+            )
+            return final_evolution_state["evolved_hypothesis"]
+
     async def expand_literature_review(self) -> None:
         """
         Expands the literature review by adding more subtopics.
@@ -513,7 +1239,8 @@ class CoscientistFramework:
             max_subtopics=5
         )
         literature_review_agent = build_literature_review_agent(
-            self.config.literature_review_agent_llm
+            self.config.literature_review_agent_llm,
+            framework=self
         )
         tracker = self._create_agent_tracker("literature_review_expand")
         final_lit_review_state = await literature_review_agent.ainvoke(
@@ -521,6 +1248,45 @@ class CoscientistFramework:
             config={"callbacks": [tracker]}
         )
         self.state_manager.update_literature_review(final_lit_review_state)
+        await self._process_literature_review()
+
+    async def _run_initial_literature_review(self, max_subtopics: int) -> None:
+        """Run the first literature review and store its result."""
+        literature_review_agent = build_literature_review_agent(
+            self.config.literature_review_agent_llm,
+            framework=self  # Pass framework for research provider access
+        )
+        initial_lit_review_state = self.state_manager.next_literature_review_state(
+            max_subtopics=max_subtopics  # Now configurable
+        )
+        tracker = self._create_agent_tracker("literature_review")
+        final_lit_review_state = await literature_review_agent.ainvoke(
+            initial_lit_review_state,
+            config={"callbacks": [tracker]}
+        )
+        self.state_manager.update_literature_review(final_lit_review_state)
+        await self._process_literature_review()
+
+    async def _process_literature_review(self) -> None:
+        """
+        Log research counts, then digest and index subtopic reports that have
+        not been processed yet if condensation or retrieval is enabled.
+        """
+        literature_review = self.state_manager._state.literature_review
+        reports = literature_review["subtopic_reports"]
+        log_progress(
+            self.state_manager._state._output_dir,
+            "LIT_REVIEW",
+            f"{len(reports)} subtopics researched, skipped research: "
+            f"{literature_review.get('skipped_research', {})}",
+        )
+        if self.report_digests is not None:
+            await self.report_digests.acondense(
+                reports, self.config.literature_review_agent_llm
+            )
+        if self.literature_index is not None:
+            n_passages = await asyncio.to_thread(self.literature_index.add_reports, reports)
+            logging.info(f"Indexed {n_passages} new literature review passages")
 
     async def run_tournament(self, k_bracket: int = 8) -> None:
         num_hypotheses = self.state_manager.num_tournament_hypotheses
@@ -533,28 +1299,54 @@ class CoscientistFramework:
             2 ** math.floor(math.log2(num_hypotheses)),
         )
         self.state_manager.run_tournament(
-            llm=self.config.meta_review_agent_llm, k_bracket=k_bracket
+            llm=self.config.meta_review_agent_llm,
+            k_bracket=k_bracket,
+            transcript_window=self.transcript_window,
         )
 
     async def run_meta_review(self, k_bracket: int = 8) -> None:
+        incremental = self.config.incremental_meta_review
         initial_meta_review_state = self.state_manager.next_meta_review_state(
-            top_k=k_bracket
+            top_k=k_bracket, incremental=incremental
+        )
+        debate_summarizer = self.debate_summarizer
+        if debate_summarizer is not None:
+            calls, cache_hits = debate_summarizer.calls, debate_summarizer.cache_hits
+        meta_review_agent = build_meta_review_agent(
+            self.config.meta_review_agent_llm,
+            incremental=incremental,
+            debate_summarizer=debate_summarizer,
         )
-        meta_review_agent = build_meta_review_agent(self.config.meta_review_agent_llm)
         tracker = self._create_agent_tracker("meta_review")
-        final_meta_review_state = meta_review_agent.invoke(
+        final_meta_review_state = await meta_review_agent.ainvoke(
             initial_meta_review_state,
             config={"callbacks": [tracker]}
         )
+        if debate_summarizer is not None:
+            log_progress(
+                self.state_manager._state._output_dir,
+                "DEBATE_SUMMARIES",
+                f"{debate_summarizer.calls - calls} summary calls, "
+                f"{debate_summarizer.cache_hits - cache_hits} summaries reused from the cache",
+            )
+        if incremental:
+            n_matches = len(initial_meta_review_state["tournament"].match_history)
+            log_progress(
+                self.state_manager._state._output_dir,
+                "META_REVIEW",
+                f"Reviewed {n_matches - initial_meta_review_state.get('match_watermark', 0)} "
+                f"of {n_matches} matches, {tracker.input_tokens} input tokens",
+            )
         self.state_manager.update_meta_review(final_meta_review_state)
 
     async def finish(self) -> None:
         initial_final_report_state = self.state_manager.next_final_report_state(top_k=3)
         final_report_agent = build_final_report_agent(
-            self.config.final_report_agent_llm
+            self.config.final_report_agent_llm,
+            parallel_sections=self.config.parallel_final_report,
         )
         tracker = self._create_agent_tracker("final_report")
-        final_report_state = final_report_agent.invoke(
+        final_report_state = await final_report_agent.ainvoke(
             initial_final_report_state,
             config={"callbacks": [tracker]}
         )
@@ -595,7 +1387,14 @@ class CoscientistFramework:
             _ = await self.start(n_hypotheses=4)
             log_progress(output_dir, "DONE", f"Literature review complete, {len(self.state_manager._state.generated_hypotheses)} hypotheses generated")
 
-        supervisor_agent = build_supervisor_agent(self.config.supervisor_agent_llm)
+        supervisor_agent = build_supervisor_agent(
+            self.config.supervisor_agent_llm,
+            fast_path=self.config.supervisor_fast_path,
+        )
+        # Decisions made by the rules and by the LLM, and time spent on the latter
+        rule_decisions = 0
+        llm_decisions = 0
+        llm_decision_seconds = 0.0
 
         current_action = None
         iteration = 0
@@ -606,13 +1405,20 @@ class CoscientistFramework:
 
             initial_supervisor_state = self.state_manager.next_supervisor_state()
             tracker = self._create_agent_tracker("supervisor")
+            decision_start = time.monotonic()
             final_supervisor_state = supervisor_agent.invoke(
                 initial_supervisor_state,
                 config={"callbacks": [tracker]}
             )
             current_action = final_supervisor_state["action"]
-            logging.info(f"Supervisor decided action: {current_action}")
-            log_progress(output_dir, "ACTION", f"{current_action}")
+            decided_by = final_supervisor_state.get("decided_by", "llm")
+            if decided_by == "rules":
+                rule_decisions += 1
+            else:
+                llm_decisions += 1
+                llm_decision_seconds += time.monotonic() - decision_start
+            logging.info(f"Supervisor decided action: {current_action} ({decided_by})")
+            log_progress(output_dir, "ACTION", f"{current_action} ({decided_by})")
             
             # Log current status
             num_reviewed = len(self.state_manager._state.reviewed_hypotheses)
@@ -627,6 +1433,18 @@ class CoscientistFramework:
             self.state_manager.add_action(current_action)
             _ = await getattr(self, current_action)()
 
+        self._log_prompt_stats()
+        if rule_decisions:
+            # Time saved is estimated from the mean latency of the LLM decisions
+            mean_llm_seconds = llm_decision_seconds / llm_decisions if llm_decisions else 0.0
+            log_progress(
+                output_dir,
+                "SUPERVISOR_FAST_PATH",
+                f"{rule_decisions}/{rule_decisions + llm_decisions} decisions skipped the LLM "
+                f"({rule_decisions / (rule_decisions + llm_decisions):.0%}), "
+                f"~{rule_decisions * mean_llm_seconds:.0f}s saved "
+                f"at {mean_llm_seconds:.1f}s per LLM decision",
+            )
         if iteration >= max_iterations:
             logging.warning(
                 f"Reached maximum iterations ({max_iterations}). "
@@ -9,11 +9,18 @@ from dataclasses import dataclass
 from typing import TypedDict, Union
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph
 
 from coscientist import multiturn
-from coscientist.common import load_prompt, parse_hypothesis_markdown, parse_hypothesis_with_llm, validate_llm_response
-from coscientist.custom_types import ParsedHypothesis
+from coscientist.common import (
+    aparse_hypothesis_tiered,
+    load_prompt,
+    parse_hypothesis_markdown,
+    parse_hypothesis_tiered,
+    validate_llm_response,
+)
+from coscientist.custom_types import HypothesisBatch, ParsedHypothesis
 from coscientist.reasoning_types import ReasoningType
 
 
@@ -29,6 +36,13 @@ class CollaborativeState(IndependentState, multiturn.MultiTurnState):
     pass
 
 
+class BatchState(TypedDict):
+    goal: str
+    literature_review: str
+    meta_review: str
+    hypotheses: list[ParsedHypothesis]
+
+
 @dataclass
 class IndependentConfig:
     """Configuration for independent generation mode."""
@@ -47,20 +61,41 @@ class CollaborativeConfig:
     agent_reasoning_types: dict[str, ReasoningType]
     llms: dict[str, BaseChatModel]
     max_turns: int = 10
+    transcript_window: multiturn.TranscriptWindow | None = None
+    # If True, agents draft at the same time for `drafting_rounds` rounds,
+    # then the first agent merges the drafts; max_turns is not used
+    parallel_drafting: bool = False
+    drafting_rounds: int = 2
+
+
+@dataclass
+class BatchConfig:
+    """Configuration for batch generation mode."""
+
+    field: str
+    reasoning_type: ReasoningType
+    llm: BaseChatModel
+    n_hypotheses: int
 
 
 def build_generation_agent(
     mode: str,
-    config: Union[IndependentConfig, CollaborativeConfig],
+    config: Union[IndependentConfig, CollaborativeConfig, BatchConfig],
 ) -> StateGraph:
     """
-    Unified builder function for generation agents that supports both independent and collaborative modes.
+    Unified builder function for generation agents that supports independent,
+    collaborative and batch modes.
+
+    Independent and collaborative agents put a single ParsedHypothesis in
+    the `hypothesis` state field. Batch agents put `config.n_hypotheses`
+    distinct hypotheses, generated as a structured list by one LLM call, in
+    the `hypotheses` state field.
 
     Parameters
     ----------
     mode : str
-        The mode of operation, either "independent" or "collaborative".
-    config : Union[IndependentConfig, CollaborativeConfig]
+        The mode of operation: "independent", "collaborative" or "batch".
+    config : Union[IndependentConfig, CollaborativeConfig, BatchConfig]
         Configuration object containing all necessary parameters for the selected mode.
 
     Returns
@@ -82,6 +117,15 @@ def build_generation_agent(
     elif mode == "collaborative":
         if not isinstance(config, CollaborativeConfig):
             raise ValueError("config must be a CollaborativeConfig instance")
+        if config.parallel_drafting:
+            return _build_parallel_drafting_agent(
+                config.agent_names,
+                config.agent_fields,
+                config.agent_reasoning_types,
+                config.llms,
+                config.drafting_rounds,
+                config.transcript_window,
+            )
         # Use the simplified multi-turn system
         return _build_collaborative_generation_agent(
             config.agent_names,
@@ -89,21 +133,22 @@ def build_generation_agent(
             config.agent_reasoning_types,
             config.llms,
             config.max_turns,
+            config.transcript_window,
+        )
+    elif mode == "batch":
+        if not isinstance(config, BatchConfig):
+            raise ValueError("config must be a BatchConfig instance")
+        return _build_batch_generation_agent(
+            config.field, config.reasoning_type, config.llm, config.n_hypotheses
         )
     else:
-        raise ValueError("mode must be either 'independent' or 'collaborative'")
+        raise ValueError("mode must be one of 'independent', 'collaborative' or 'batch'")
 
 
-def _independent_generation_node(
-    state: IndependentState,
-    field: str,
-    reasoning_type: ReasoningType,
-    llm: BaseChatModel,
-) -> IndependentState:
-    """
-    Represents the action of a single generation agent using the independent_generation.md template.
-    The output is expected to be markdown with sections: Evidence, Hypothesis, Reasoning, Assumptions Table.
-    """
+def _independent_generation_prompt(
+    state: IndependentState, field: str, reasoning_type: ReasoningType
+) -> str:
+    """Build the independent_generation.md prompt for a generation call."""
     import logging
     logger = logging.getLogger(__name__)
 
@@ -123,9 +168,17 @@ def _independent_generation_node(
         reasoning_type=reasoning_type.value,
     )
     logger.info(f"Prompt length: {len(prompt) if isinstance(prompt, str) else len(str(prompt))}")
+    return prompt
 
-    response = llm.invoke(prompt)
 
+def _independent_generation_result(
+    state: IndependentState,
+    field: str,
+    reasoning_type: ReasoningType,
+    prompt: str,
+    response,
+) -> IndependentState:
+    """Validate the LLM response of a generation call and store it in the state."""
     # Use shared validation function
     response_content = validate_llm_response(
         response=response,
@@ -142,6 +195,55 @@ def _independent_generation_node(
     return {**state, "_raw_result": response_content}
 
 
+def _independent_generation_node(
+    state: IndependentState,
+    field: str,
+    reasoning_type: ReasoningType,
+    llm: BaseChatModel,
+) -> IndependentState:
+    """
+    Represents the action of a single generation agent using the independent_generation.md template.
+    The output is expected to be markdown with sections: Evidence, Hypothesis, Reasoning, Assumptions Table.
+    """
+    prompt = _independent_generation_prompt(state, field, reasoning_type)
+    response = llm.invoke(prompt)
+    return _independent_generation_result(state, field, reasoning_type, prompt, response)
+
+
+async def _aindependent_generation_node(
+    state: IndependentState,
+    field: str,
+    reasoning_type: ReasoningType,
+    llm: BaseChatModel,
+) -> IndependentState:
+    """
+    Async version of `_independent_generation_node`. Cancelling it cancels
+    the in-flight LLM call.
+    """
+    prompt = _independent_generation_prompt(state, field, reasoning_type)
+    response = await llm.ainvoke(prompt)
+    return _independent_generation_result(state, field, reasoning_type, prompt, response)
+
+
+def _llm_parsing_node(llm: BaseChatModel, raw_text_fn) -> RunnableLambda:
+    """
+    Node that parses a generation result into a ParsedHypothesis, falling
+    back to the LLM only when the text cannot be parsed locally.
+
+    The async version calls the LLM parser with `ainvoke`, so a generation
+    timeout also cancels an in-flight parse.
+    """
+
+    def parse(state):
+        return {**state, "hypothesis": parse_hypothesis_tiered(llm, raw_text_fn(state))}
+
+    async def aparse(state):
+        hypothesis = await aparse_hypothesis_tiered(llm, raw_text_fn(state))
+        return {**state, "hypothesis": hypothesis}
+
+    return RunnableLambda(parse, afunc=aparse)
+
+
 def _parsing_node(state: IndependentState) -> IndependentState:
     """
     Parse the raw markdown result into a structured ParsedHypothesis object.
@@ -172,18 +274,18 @@ def _build_independent_generation_agent(
         A compiled LangGraph for the generation agent.
     """
     graph = StateGraph(IndependentState)
+    # Both sync and async versions, so the agent supports invoke and ainvoke
     graph.add_node(
         "generator",
-        lambda state: _independent_generation_node(state, field, reasoning_type, llm),
-    )
-    # Use robust LLM-based parsing instead of brittle regex
-    graph.add_node(
-        "parser",
-        lambda state: {
-            **state,
-            "hypothesis": parse_hypothesis_with_llm(llm, state["_raw_result"])
-        }
+        RunnableLambda(
+            lambda state: _independent_generation_node(state, field, reasoning_type, llm),
+            afunc=lambda state: _aindependent_generation_node(
+                state, field, reasoning_type, llm
+            ),
+        ),
     )
+    # Parse locally, with the robust LLM-based parser as a fallback
+    graph.add_node("parser", _llm_parsing_node(llm, lambda state: state["_raw_result"]))
 
     graph.add_edge("generator", "parser")
     graph.add_edge("parser", END)
@@ -192,6 +294,76 @@ def _build_independent_generation_agent(
     return graph.compile()
 
 
+def _batch_generation_prompt(
+    state: BatchState, field: str, reasoning_type: ReasoningType, n_hypotheses: int
+) -> str:
+    """Build the batch_generation.md prompt for a batch generation call."""
+    return load_prompt(
+        "batch_generation",
+        goal=state["goal"],
+        field=field,
+        literature_review=state["literature_review"],
+        meta_review=state.get("meta_review", "Not Available"),
+        reasoning_type=reasoning_type.value,
+        n_hypotheses=n_hypotheses,
+    )
+
+
+def _batch_result(state: BatchState, batch: HypothesisBatch, n_hypotheses: int) -> BatchState:
+    """Give each hypothesis of a batch a fresh uid and store the batch in the state."""
+    # Any uid or parent_uid filled in by the LLM is discarded
+    hypotheses = [
+        ParsedHypothesis(
+            hypothesis=h.hypothesis, predictions=h.predictions, assumptions=h.assumptions
+        )
+        for h in batch.hypotheses[:n_hypotheses]
+    ]
+    return {**state, "hypotheses": hypotheses}
+
+
+def _build_batch_generation_agent(
+    field: str, reasoning_type: ReasoningType, llm: BaseChatModel, n_hypotheses: int
+):
+    """
+    Builds a LangGraph that generates several hypotheses with one LLM call.
+
+    The goal, literature review and meta-review are sent once for all
+    `n_hypotheses` hypotheses, and the hypotheses come back as structured
+    output, so no separate parsing call is needed.
+
+    Parameters
+    ----------
+    field : str
+        Field or domain of expertise.
+    reasoning_type : ReasoningType
+        Reasoning type for the agent.
+    llm : BaseChatModel
+        The language model to use.
+    n_hypotheses : int
+        Number of hypotheses to generate.
+
+    Returns
+    -------
+    StateGraph
+        A compiled LangGraph for the batch generation agent.
+    """
+    structured_llm = llm.with_structured_output(HypothesisBatch)
+
+    def generate(state: BatchState) -> BatchState:
+        prompt = _batch_generation_prompt(state, field, reasoning_type, n_hypotheses)
+        return _batch_result(state, structured_llm.invoke(prompt), n_hypotheses)
+
+    async def agenerate(state: BatchState) -> BatchState:
+        prompt = _batch_generation_prompt(state, field, reasoning_type, n_hypotheses)
+        return _batch_result(state, await structured_llm.ainvoke(prompt), n_hypotheses)
+
+    graph = StateGraph(BatchState)
+    graph.add_node("generator", RunnableLambda(generate, afunc=agenerate))
+    graph.add_edge("generator", END)
+    graph.set_entry_point("generator")
+    return graph.compile()
+
+
 def _collaborative_parsing_node(state: CollaborativeState) -> CollaborativeState:
     """
     Parse the final result from collaborative generation into a structured ParsedHypothesis object.
@@ -207,6 +379,7 @@ def _build_collaborative_generation_agent(
     agent_reasoning_types: dict[str, ReasoningType],
     llms: dict[str, BaseChatModel],
     max_turns: int = 10,
+    transcript_window: multiturn.TranscriptWindow | None = None,
 ) -> StateGraph:
     """Build collaborative generation agent with structured output parsing."""
 
@@ -218,6 +391,7 @@ def _build_collaborative_generation_agent(
             llm=llms[agent_name],
             prompt_name="collaborative_generation",
             prompt_keys_from_state=["goal", "literature_review", "meta_review"],
+            transcript_window=transcript_window,
             # kwargs for the prompt
             field=agent_fields[agent_name],
             reasoning_type=agent_reasoning_types[agent_name].value,
@@ -238,17 +412,14 @@ def _build_collaborative_generation_agent(
     # Add moderator node
     base_graph.add_node("moderator", moderator_fn)
 
-    # Add robust LLM-based parsing node (use first agent's LLM for parsing)
+    # Add tiered parsing node (use first agent's LLM for the LLM fallback)
     parsing_llm = llms[agent_names[0]]
     base_graph.add_node(
         "parser",
-        lambda state: {
-            **state,
-            "hypothesis": parse_hypothesis_with_llm(
-                parsing_llm,
-                "\n".join([f"{name}: {msg}" for name, msg in state["transcript"]])
-            )
-        }
+        _llm_parsing_node(
+            parsing_llm,
+            lambda state: "\n".join([f"{name}: {msg}" for name, msg in state["transcript"]]),
+        ),
     )
 
     # Define edges: agents -> moderator
@@ -275,6 +446,64 @@ def _build_collaborative_generation_agent(
     return base_graph.compile()
 
 
+def _build_parallel_drafting_agent(
+    agent_names: list[str],
+    agent_fields: dict[str, str],
+    agent_reasoning_types: dict[str, ReasoningType],
+    llms: dict[str, BaseChatModel],
+    drafting_rounds: int = 2,
+    transcript_window: multiturn.TranscriptWindow | None = None,
+) -> StateGraph:
+    """
+    Build a collaborative generation agent in which all agents draft at once.
+
+    In each round every agent writes or revises a draft at the same time,
+    seeing the drafts of earlier rounds. After `drafting_rounds` rounds the
+    first agent merges the drafts into the final report, which is then
+    parsed. Wall time grows with the number of rounds, not with rounds
+    times agents.
+    """
+
+    def agent_node_fn(agent_name: str, prompt_name: str):
+        return multiturn.create_agent_node_fn(
+            agent_name=agent_name,
+            llm=llms[agent_name],
+            prompt_name=prompt_name,
+            prompt_keys_from_state=["goal", "literature_review", "meta_review"],
+            transcript_window=transcript_window,
+            # kwargs for the prompt
+            field=agent_fields[agent_name],
+            reasoning_type=agent_reasoning_types[agent_name].value,
+        )
+
+    drafting_round_fn = multiturn.create_parallel_round_node_fn(
+        {name: agent_node_fn(name, "parallel_drafting") for name in agent_names},
+        transcript_window,
+    )
+    merger_name = agent_names[0]
+
+    graph = StateGraph(CollaborativeState)
+    graph.add_node("drafting_round", drafting_round_fn)
+    graph.add_node("moderator", multiturn.create_round_moderator_node_fn(drafting_rounds))
+    graph.add_node("merge", agent_node_fn(merger_name, "collaborative_merge"))
+    # Only the merge turn has the final report
+    graph.add_node(
+        "parser", _llm_parsing_node(llms[merger_name], lambda state: state["transcript"][-1][1])
+    )
+
+    graph.add_edge("drafting_round", "moderator")
+    graph.add_conditional_edges(
+        "moderator",
+        lambda state: "merge" if state["finished"] else "drafting_round",
+        {"merge": "merge", "drafting_round": "drafting_round"},
+    )
+    graph.add_edge("merge", "parser")
+    graph.add_edge("parser", END)
+
+    graph.set_entry_point("drafting_round")
+    return graph.compile()
+
+
 def _termination_fn(msg: str) -> bool:
     """
     Check if the message contains all required sections to prevent parser assertions.
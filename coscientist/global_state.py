@@ -1,4 +1,5 @@
 import glob
+import hashlib
 import os
 import pickle
 import shutil
@@ -7,17 +8,25 @@ from functools import wraps
 from pathlib import Path
 from typing import Literal, Optional, Union
 
+import numpy as np
 from langchain_core.language_models import BaseChatModel
 
 from coscientist.custom_types import ParsedHypothesis, ReviewedHypothesis
 from coscientist.evolution_agent import EvolveFromFeedbackState, OutOfTheBoxState
 from coscientist.final_report_agent import FinalReportState
-from coscientist.generation_agent import CollaborativeState, IndependentState
+from coscientist.generation_agent import (
+    BatchState,
+    CollaborativeState,
+    IndependentState,
+)
 from coscientist.literature_review_agent import LiteratureReviewState
 from coscientist.meta_review_agent import MetaReviewTournamentState
+from coscientist.multiturn import TranscriptWindow
 from coscientist.proximity_agent import ProximityGraph
 from coscientist.ranking_agent import EloTournament
 from coscientist.reflection_agent import ReflectionState
+from coscientist.report_digests import ReportDigestCache, select_report_context
+from coscientist.research_backend import is_failed_report
 from coscientist.supervisor_agent import SupervisorDecisionState
 
 # Global configuration for output directory
@@ -101,6 +110,16 @@ class CoscientistState:
         self.meta_reviews = []
         self.proximity_graph = None
         self.reflection_queue = []
+        # Hypotheses popped from the reflection queue whose reflection has not
+        # finished yet. Their progress lives in the reflection checkpointer.
+        self.reflections_in_flight = {}
+        # Generation attempts that failed or timed out, one record per attempt
+        self.generation_failures = []
+        # Lineage index over parent_uid: parent -> children, child -> ancestors
+        # (nearest first), and evolution key -> uid of the evolved hypothesis
+        self.lineage_children = {}
+        self.lineage_ancestors = {}
+        self.evolution_memo = {}
         self.supervisor_decisions = []
         self.final_report = None
 
@@ -587,17 +606,123 @@ class CoscientistStateManager:
 
     @_maybe_save(n=1)
     def add_evolved_hypothesis(
-        self, evolved_hypothesis: Union[EvolveFromFeedbackState, OutOfTheBoxState]
+        self,
+        evolved_hypothesis: Union[EvolveFromFeedbackState, OutOfTheBoxState],
+        evolution_key: str | None = None,
     ) -> None:
         """
-        Add an evolved hypothesis to the collection.
+        Add an evolved hypothesis to the collection and the lineage index.
 
         Parameters
         ----------
         evolved_hypothesis : Union[EvolveFromFeedbackState, OutOfTheBoxState]
             The evolved hypothesis state to add
+        evolution_key : str | None
+            Key from `evolution_key` of the evolution that produced the
+            hypothesis. If given, the evolution is marked as tried.
         """
         self._state.evolved_hypotheses.append(evolved_hypothesis)
+        self._index_lineage(evolved_hypothesis)
+        if evolution_key is not None:
+            self._state.evolution_memo[evolution_key] = evolved_hypothesis.uid
+
+    def _index_lineage(self, hypothesis: ParsedHypothesis) -> None:
+        """Add a hypothesis to the lineage index if it has a parent."""
+        parent_uid = hypothesis.parent_uid
+        if parent_uid is None or hypothesis.uid in self._state.lineage_ancestors:
+            return
+        self._state.lineage_children.setdefault(parent_uid, []).append(hypothesis.uid)
+        self._state.lineage_ancestors[hypothesis.uid] = (
+            parent_uid,
+        ) + self._state.lineage_ancestors.get(parent_uid, ())
+
+    def children_of(self, uid: str) -> list[str]:
+        """
+        UIDs of the hypotheses evolved directly from a hypothesis.
+
+        Parameters
+        ----------
+        uid : str
+            The UID of the parent hypothesis
+
+        Returns
+        -------
+        list[str]
+            Child UIDs, in the order they were evolved
+        """
+        return list(self._state.lineage_children.get(uid, []))
+
+    def ancestors_of(self, uid: str) -> list[str]:
+        """
+        UIDs of the hypotheses a hypothesis was evolved from.
+
+        Parameters
+        ----------
+        uid : str
+            The UID of the hypothesis
+
+        Returns
+        -------
+        list[str]
+            Ancestor UIDs, parent first; empty for generated hypotheses
+        """
+        return list(self._state.lineage_ancestors.get(uid, ()))
+
+    def evolution_key(
+        self,
+        mode: Literal["evolve_from_feedback", "out_of_the_box"],
+        parents: list[ParsedHypothesis],
+    ) -> str:
+        """
+        Key identifying an evolution by its inputs.
+
+        The key combines the mode, the content of the parent hypotheses and,
+        for evolve_from_feedback, the latest meta-review, so the same parent
+        is evolved again once the meta-review has changed.
+
+        Parameters
+        ----------
+        mode : Literal["evolve_from_feedback", "out_of_the_box"]
+            The evolution mode
+        parents : list[ParsedHypothesis]
+            The hypothesis to evolve, or the top hypotheses for out_of_the_box
+
+        Returns
+        -------
+        str
+            A sha256 hex digest
+        """
+        digest = hashlib.sha256(mode.encode())
+        for parent in parents:
+            content = "\n".join(
+                [parent.hypothesis, *parent.predictions, *parent.assumptions]
+            )
+            digest.update(hashlib.sha256(content.encode()).digest())
+        if mode == "evolve_from_feedback" and self._state.meta_reviews:
+            digest.update(hashlib.sha256(self.meta_review.encode()).digest())
+        return digest.hexdigest()
+
+    def evolution_was_tried(self, evolution_key: str) -> bool:
+        """Whether an evolution with this key already produced a hypothesis."""
+        return evolution_key in self._state.evolution_memo
+
+    @_maybe_save(n=1)
+    def record_generation_failure(self, mode: str, error: str, elapsed: float) -> None:
+        """
+        Record a hypothesis generation attempt that failed or timed out.
+
+        Parameters
+        ----------
+        mode : str
+            The generation mode of the attempt
+        error : str
+            Why the attempt failed
+        elapsed : float
+            Seconds the attempt ran before it failed
+        """
+        self._state.generation_failures.append(
+            {"mode": mode, "error": error, "elapsed": elapsed}
+        )
 
     @_maybe_save(n=1)
     def add_action(self, action: str) -> None:
@@ -634,6 +759,23 @@ class CoscientistStateManager:
         """
         self._state.literature_review = literature_review
 
+    def publish_partial_literature_review(
+        self, literature_review: LiteratureReviewState
+    ) -> None:
+        """
+        Make a literature review that is still running visible to generation.
+
+        Unlike `update_literature_review` this does not save a checkpoint, so
+        it is safe to call while generation threads are updating the state;
+        the final review is saved by `update_literature_review`.
+
+        Parameters
+        ----------
+        literature_review : LiteratureReviewState
+            The literature review so far
+        """
+        self._state.literature_review = literature_review
+
     @_maybe_save(n=1)
     def update_meta_review(self, meta_review: MetaReviewTournamentState) -> None:
         """
@@ -682,7 +824,11 @@ class CoscientistStateManager:
         self._state.final_report = final_report
 
     @_maybe_save(n=3)
-    def advance_hypothesis(self, kind: Literal["generated", "evolved"]) -> None:
+    def advance_hypothesis(
+        self,
+        kind: Literal["generated", "evolved"],
+        embedding: Optional[np.ndarray] = None,
+    ) -> None:
         """
         Move a hypothesis from generation/evolution to the reflection queue.
 
@@ -693,6 +839,9 @@ class CoscientistStateManager:
         ----------
         kind : Literal["generated", "evolved"]
             The type of hypothesis to advance - either "generated" or "evolved"
+        embedding : Optional[np.ndarray]
+            Precomputed embedding of the hypothesis being advanced. If None, the
+            proximity graph computes it.
 
         Raises
         ------
@@ -723,7 +872,7 @@ class CoscientistStateManager:
         assert (
             self._state.proximity_graph is not None
         ), "Proximity graph is not initialized"
-        self._state.proximity_graph.add_hypothesis(parsed_hypothesis)
+        self._state.proximity_graph.add_hypothesis(parsed_hypothesis, embedding=embedding)
 
     @_maybe_save(n=1)
     def advance_reviewed_hypothesis(self) -> None:
@@ -747,12 +896,19 @@ class CoscientistStateManager:
         self._state.tournament.add_hypothesis(reviewed_hypothesis_state)
 
     @_maybe_save(n=1)
-    def run_tournament(self, llm: BaseChatModel, k_bracket: int = 16) -> None:
+    def run_tournament(
+        self,
+        llm: BaseChatModel,
+        k_bracket: int = 16,
+        transcript_window: TranscriptWindow | None = None,
+    ) -> None:
         """
         Run the tournament.
         """
         assert self._state.tournament is not None, "Tournament is not initialized"
-        self._state.tournament.run_tournament(llm=llm, k_bracket=k_bracket)
+        self._state.tournament.run_tournament(
+            llm=llm, k_bracket=k_bracket, transcript_window=transcript_window
+        )
 
     def _setup(self) -> None:
         """
@@ -767,6 +923,27 @@ class CoscientistStateManager:
         if self._state.proximity_graph is None:
             self._state.proximity_graph = ProximityGraph()
 
+        # States pickled before in-flight reflections were tracked
+        if not hasattr(self._state, "reflections_in_flight"):
+            self._state.reflections_in_flight = {}
+        if not hasattr(self._state, "generation_failures"):
+            self._state.generation_failures = []
+
+        # States pickled before the lineage index existed
+        if not hasattr(self._state, "lineage_children"):
+            self._state.lineage_children = {}
+            self._state.lineage_ancestors = {}
+            self._state.evolution_memo = {}
+            for hypothesis in (
+                list(self._state.tournament.hypotheses.values())
+                + self._state.reflection_queue
+                + list(self._state.reflections_in_flight.values())
+                + self._state.generated_hypotheses
+                + self._state.reviewed_hypotheses
+                + self._state.evolved_hypotheses
+            ):
+                self._index_lineage(hypothesis)
+
     def next_literature_review_state(
         self, max_subtopics: int = 5
     ) -> LiteratureReviewState:
@@ -786,9 +963,11 @@ class CoscientistStateManager:
         if self._state.literature_review is not None:
             subtopics = self._state.literature_review.get("subtopics", [])
             subtopic_reports = self._state.literature_review.get("subtopic_reports", [])
+            skipped_research = self._state.literature_review.get("skipped_research", {})
         else:
             subtopics = []
             subtopic_reports = []
+            skipped_research = {}
 
         if self._state.meta_reviews:
             meta_review = self._state.meta_reviews[-1]["result"]
@@ -801,27 +980,40 @@ class CoscientistStateManager:
             subtopics=subtopics,
             subtopic_reports=subtopic_reports,
             meta_review=meta_review,
+            skipped_research=skipped_research,
         )
 
     def next_generation_state(
         self,
-        mode: Literal["independent", "collaborative"],
+        mode: Literal["independent", "collaborative", "batch"],
         first_agent_name: str | None = None,
-    ) -> Union[IndependentState, CollaborativeState]:
+        report_digests: ReportDigestCache | None = None,
+        token_budget: int | None = None,
+        literature_context: str | None = None,
+    ) -> Union[IndependentState, CollaborativeState, BatchState]:
         """
         Create an initial state for the generation agent.
 
         Parameters
         ----------
-        mode : Literal["independent", "collaborative"]
+        mode : Literal["independent", "collaborative", "batch"]
             The type of generation state to create
         first_agent_name : str | None
             The name of the first agent in the collaborative mode. If None, the
             mode must be "independent".
+        report_digests : ReportDigestCache | None
+            Cached report digests. If given with `token_budget`, the longest
+            subtopic reports are replaced by their digests until the literature
+            review fits the budget.
+        token_budget : int | None
+            Token budget for the literature review in the generation prompt
+        literature_context : str | None
+            Literature retrieved for this generation call. Used instead of the
+            subtopic reports when given and non-empty.
 
         Returns
         -------
-        Union[IndependentState, CollaborativeState]
+        Union[IndependentState, CollaborativeState, BatchState]
             Initial state with goal and literature_review set, meta_review included if available
         """
         # Get literature review content
@@ -831,9 +1023,21 @@ class CoscientistStateManager:
             )
 
         # Join subtopic reports into a single literature review string
-        literature_review_content = "\n\n".join(
-            self._state.literature_review["subtopic_reports"]
-        )
+        # Skip placeholders for subtopics whose research is still running or
+        # failed, and error reports kept by older states
+        subtopic_reports = [
+            report
+            for report in self._state.literature_review["subtopic_reports"]
+            if report and not is_failed_report(report)
+        ]
+        if literature_context:
+            literature_review_content = literature_context
+        elif report_digests is not None and token_budget is not None:
+            literature_review_content = select_report_context(
+                subtopic_reports, token_budget, report_digests.get
+            )
+        else:
+            literature_review_content = "\n\n".join(subtopic_reports)
 
         # Create base state with required fields
         base_state = {
@@ -847,6 +1051,8 @@ class CoscientistStateManager:
 
         if mode == "independent":
             return IndependentState(**base_state)
+        elif mode == "batch":
+            return BatchState(**base_state)
         elif mode == "collaborative":
             # Add MultiTurnState fields for collaborative mode
             collaborative_state = CollaborativeState(
@@ -859,15 +1065,44 @@ class CoscientistStateManager:
             return collaborative_state
         else:
             raise ValueError(
-                f"Invalid mode '{mode}'. Must be 'independent' or 'collaborative'"
+                f"Invalid mode '{mode}'. Must be 'independent', 'collaborative' or 'batch'"
             )
 
-    def next_reflection_state(self) -> ReflectionState:
+    @property
+    def in_flight_reflections(self) -> list[ParsedHypothesis]:
+        """
+        Hypotheses whose reflection was started but never completed, e.g.
+        because the process crashed mid-reflection.
+        """
+        return list(self._state.reflections_in_flight.values())
+
+    @_maybe_save(n=1)
+    def complete_reflection(self, uid: str) -> None:
+        """
+        Mark the reflection of a hypothesis as finished.
+
+        Parameters
+        ----------
+        uid : str
+            The UID of the hypothesis whose reflection finished
+        """
+        self._state.reflections_in_flight.pop(uid, None)
+
+    @_maybe_save(n=1)
+    def next_reflection_state(self, uid: Optional[str] = None) -> ReflectionState:
         """
         Create an initial state for the reflection agent.
 
         Pops a hypothesis from the reflection queue and creates a ReflectionState
         with that hypothesis and default initial values for all other fields.
+        The hypothesis is tracked as in flight until `complete_reflection` is
+        called, so it can be resumed after a crash.
+
+        Parameters
+        ----------
+        uid : Optional[str]
+            UID of the hypothesis to pop. If None, the first hypothesis in
+            the queue is popped.
 
         Returns
         -------
@@ -878,14 +1113,23 @@ class CoscientistStateManager:
         ------
         IndexError
             If the reflection queue is empty
+        KeyError
+            If no hypothesis with the given UID is in the reflection queue
         """
         if not self._state.reflection_queue:
             raise IndexError(
                 "No hypotheses available in reflection queue. Please advance a hypothesis first."
             )
 
-        # Pop the first hypothesis from the queue
-        hypothesis_to_review = self._state.reflection_queue.pop(0)
+        if uid is None:
+            # Pop the first hypothesis from the queue
+            hypothesis_to_review = self._state.reflection_queue.pop(0)
+        else:
+            uids = [h.uid for h in self._state.reflection_queue]
+            if uid not in uids:
+                raise KeyError(f"Hypothesis {uid} is not in the reflection queue")
+            hypothesis_to_review = self._state.reflection_queue.pop(uids.index(uid))
+        self._state.reflections_in_flight[hypothesis_to_review.uid] = hypothesis_to_review
 
         return ReflectionState(hypothesis_to_review=hypothesis_to_review)
 
@@ -980,7 +1224,9 @@ class CoscientistStateManager:
                 f"Invalid mode '{mode}'. Must be 'evolve_from_feedback' or 'out_of_the_box'"
             )
 
-    def next_meta_review_state(self, top_k: int) -> MetaReviewTournamentState:
+    def next_meta_review_state(
+        self, top_k: int, incremental: bool = False
+    ) -> MetaReviewTournamentState:
         """
         Create an initial state for the meta-review agent.
 
@@ -988,6 +1234,9 @@ class CoscientistStateManager:
         ----------
         top_k : int
             Number of top hypotheses to include in the meta-review analysis
+        incremental : bool
+            If True, include the previous meta-review and the match watermark
+            it was written at, for an incremental meta-review
 
         Returns
         -------
@@ -1006,11 +1255,18 @@ class CoscientistStateManager:
 
         # Compute the cosine similarity between all hypotheses
         # before meta-review
-        return MetaReviewTournamentState(
+        state = MetaReviewTournamentState(
             goal=self._state.goal,
             tournament=self._state.tournament,
             top_k=top_k,
         )
+        if incremental and self._state.meta_reviews:
+            previous = self._state.meta_reviews[-1]
+            state["previous_review"] = previous["result"]
+            # Meta-reviews saved without a watermark covered an unknown
+            # number of matches, so start again from the first match
+            state["match_watermark"] = previous.get("match_watermark", 0)
+        return state
 
     def next_final_report_state(self, top_k: int = 3) -> FinalReportState:
         """
@@ -0,0 +1,141 @@
+"""
+Per-run vector index over the literature review.
+
+Subtopic reports are split into passages and embedded once, when they are
+added after a literature review or expansion. Generation calls then receive
+only the passages most relevant to their specialist field and reasoning
+type, up to a token budget, instead of every report in full. The index is
+stored in the goal directory so a resumed run does not re-embed anything.
+"""
+
+import json
+import os
+import threading
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from coscientist.local_corpus import split_passages
+from coscientist.report_digests import estimate_tokens, report_hash
+
+
+class LiteratureIndex:
+    """
+    Embedded passages of the run's subtopic reports.
+
+    Parameters
+    ----------
+    output_dir : str
+        Goal directory; the index is stored in its `literature_index` folder
+    embedding_model : Embeddings
+        Model used to embed passages and queries
+    passage_words : int
+        Target passage length in words
+    """
+
+    DIRNAME = "literature_index"
+
+    def __init__(
+        self, output_dir: str, embedding_model: Embeddings, passage_words: int = 250
+    ):
+        self.directory = os.path.join(output_dir, self.DIRNAME)
+        self.embedding_model = embedding_model
+        self.passage_words = passage_words
+        self._lock = threading.Lock()
+        # Query embeddings, reused across calls with the same field and reasoning type
+        self._query_embeddings: dict[str, np.ndarray] = {}
+
+        self.passages: list[dict[str, str]] = []
+        self.embeddings = np.zeros((0, 0))
+        chunks_path = os.path.join(self.directory, "passages.json")
+        if os.path.exists(chunks_path):
+            with open(chunks_path, "r") as f:
+                self.passages = json.load(f)
+            self.embeddings = np.load(os.path.join(self.directory, "embeddings.npy"))
+
+    @property
+    def report_hashes(self) -> set[str]:
+        """Hashes of the reports already in the index."""
+        return {passage["report_hash"] for passage in self.passages}
+
+    def add_reports(self, reports: list[str]) -> int:
+        """
+        Embed and index reports that are not in the index yet.
+
+        Parameters
+        ----------
+        reports : list[str]
+            Subtopic reports; reports already indexed are skipped
+
+        Returns
+        -------
+        int
+            Number of passages added
+        """
+        with self._lock:
+            known = self.report_hashes
+            new_passages = []
+            for report in reports:
+                digest = report_hash(report)
+                if not report or digest in known:
+                    continue
+                known.add(digest)
+                new_passages.extend(
+                    {"report_hash": digest, "text": text}
+                    for text in split_passages(report, self.passage_words)
+                )
+            if not new_passages:
+                return 0
+
+            vectors = np.array(
+                self.embedding_model.embed_documents([p["text"] for p in new_passages])
+            )
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+            self.embeddings = (
+                np.vstack([self.embeddings, vectors]) if self.passages else vectors
+            )
+            self.passages.extend(new_passages)
+            self._save()
+            return len(new_passages)
+
+    def context_for(self, query: str, token_budget: int, top_k: int = 12) -> str:
+        """
+        Literature context for a generation call.
+
+        Parameters
+        ----------
+        query : str
+            What the generation call is about, e.g. goal, field and reasoning type
+        token_budget : int
+            Maximum estimated tokens of returned passages
+        top_k : int
+            Maximum number of passages
+
+        Returns
+        -------
+        str
+            The most relevant passages, in the order they appear in the
+            literature review, joined by blank lines
+        """
+        with self._lock:
+            if not self.passages:
+                return ""
+            if query not in self._query_embeddings:
+                vector = np.array(self.embedding_model.embed_query(query))
+                self._query_embeddings[query] = vector / (np.linalg.norm(vector) + 1e-12)
+            scores = self.embeddings @ self._query_embeddings[query]
+
+            chosen, used = [], 0
+            for idx in np.argsort(-scores)[:top_k]:
+                tokens = estimate_tokens(self.passages[idx]["text"])
+                if used + tokens > token_budget:
+                    continue
+                chosen.append(int(idx))
+                used += tokens
+            return "\n\n".join(self.passages[idx]["text"] for idx in sorted(chosen))
+
+    def _save(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        np.save(os.path.join(self.directory, "embeddings.npy"), self.embeddings)
+        with open(os.path.join(self.directory, "passages.json"), "w") as f:
+            json.dump(self.passages, f)
@@ -8,18 +8,23 @@ Implementation uses LangGraph to:
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
-from typing import TypedDict
+import time
+from typing import Callable, TypedDict
 
+import numpy as np
 from gpt_researcher import GPTResearcher
 from gpt_researcher.utils.enum import Tone
 from langchain_core.language_models.chat_models import BaseChatModel
 from langgraph.graph import END, StateGraph
 
 from coscientist.common import load_prompt, validate_llm_response
-from coscientist.research_backend import create_research_provider
+from coscientist.research_backend import create_research_provider, is_failed_report
+from coscientist.research_scheduler import ResearchPriority
 from coscientist.config_loader import load_researcher_config
 
 
@@ -31,6 +36,7 @@ class LiteratureReviewState(TypedDict):
     subtopics: list[str]
     subtopic_reports: list[str]
     meta_review: str
+    skipped_research: dict[str, int]
 
 
 def parse_topic_decomposition(markdown_text: str) -> list[str]:
@@ -52,13 +58,162 @@ def parse_topic_decomposition(markdown_text: str) -> list[str]:
     return [section.strip() for section in sections[1:]]
 
 
+def deduplicate_subtopics(
+    new_subtopics: list[str],
+    existing_subtopics: list[str],
+    embed_documents: Callable[[list[str]], list[list[float]]],
+    threshold: float = 0.9,
+) -> tuple[list[str], list[str]]:
+    """
+    Drop new subtopics that are near-duplicates of existing subtopics or of
+    each other, by cosine similarity of their embeddings.
+
+    Parameters
+    ----------
+    new_subtopics : list[str]
+        Subtopics proposed by topic decomposition
+    existing_subtopics : list[str]
+        Subtopics already in the literature review
+    embed_documents : Callable[[list[str]], list[list[float]]]
+        Embeds a batch of texts, e.g. `Embeddings.embed_documents`
+    threshold : float
+        Similarity at or above which a new subtopic counts as a duplicate
+
+    Returns
+    -------
+    tuple[list[str], list[str]]
+        The distinct new subtopics and the skipped duplicates
+    """
+    if not new_subtopics:
+        return [], []
+
+    vectors = np.array(embed_documents(existing_subtopics + new_subtopics), dtype=float)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+    accepted = list(vectors[: len(existing_subtopics)])
+
+    kept, skipped = [], []
+    for subtopic, vector in zip(new_subtopics, vectors[len(existing_subtopics):]):
+        if accepted and max(float(vector @ other) for other in accepted) >= threshold:
+            skipped.append(subtopic)
+            continue
+        kept.append(subtopic)
+        accepted.append(vector)
+    return kept, skipped
+
+
+# Folder in the goal directory holding each subtopic report as it completes
+SUBTOPIC_REPORTS_DIRNAME = "subtopic_reports"
+# File in the goal directory listing every subtopic of the latest decomposition
+SUBTOPIC_DECOMPOSITION_FILENAME = "subtopic_decomposition.json"
+
+
+def _subtopic_key(subtopic: str) -> str:
+    return hashlib.sha256(subtopic.encode()).hexdigest()[:12]
+
+
+def _subtopic_report_path(output_dir: str, subtopic: str) -> str:
+    return os.path.join(output_dir, SUBTOPIC_REPORTS_DIRNAME, f"{_subtopic_key(subtopic)}.json")
+
+
+def _write_json(path: str, data) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename so a crash never leaves a half-written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _save_subtopic_report(output_dir: str, subtopic: str, report: str) -> None:
+    """
+    Save a finished subtopic report in the goal directory, so a crash before
+    the literature review state is saved does not lose it.
+    """
+    _write_json(
+        _subtopic_report_path(output_dir, subtopic),
+        {"subtopic": subtopic, "report": report},
+    )
+
+
+def _save_subtopic_decomposition(output_dir: str, subtopics: list[str]) -> None:
+    """
+    Save every subtopic of a decomposition in the goal directory before
+    research starts, so a crash does not lose subtopics that have neither a
+    saved report nor a registered background task yet.
+    """
+    _write_json(os.path.join(output_dir, SUBTOPIC_DECOMPOSITION_FILENAME), subtopics)
+
+
+def _saved_subtopic_decomposition(output_dir: str) -> list[str]:
+    """Subtopics of the latest saved decomposition, or [] if there is none."""
+    path = os.path.join(output_dir, SUBTOPIC_DECOMPOSITION_FILENAME)
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _saved_subtopic_reports(output_dir: str) -> dict[str, str]:
+    """Subtopic -> report for every report saved in the goal directory."""
+    directory = os.path.join(output_dir, SUBTOPIC_REPORTS_DIRNAME)
+    if not os.path.isdir(directory):
+        return {}
+    reports = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "r") as f:
+                entry = json.load(f)
+            reports[entry["subtopic"]] = entry["report"]
+    return reports
+
+
+def _resumable_subtopics(state: LiteratureReviewState, framework=None) -> list[str]:
+    """
+    Subtopics of an earlier process that are missing from the state: every
+    subtopic of its saved decomposition, including those whose research never
+    started, then any other subtopic with a saved report or with background
+    research that was started and never collected, as recorded in the
+    research provider's task registry.
+    """
+    if framework is None:
+        return []
+
+    known = set(state.get("subtopics") or [])
+    subtopics = []
+    if hasattr(framework, "state_manager"):
+        output_dir = framework.state_manager._state._output_dir
+        for subtopic in _saved_subtopic_decomposition(output_dir) + list(
+            _saved_subtopic_reports(output_dir)
+        ):
+            if subtopic not in known and subtopic not in subtopics:
+                subtopics.append(subtopic)
+
+    provider = getattr(framework, "research_provider", None)
+    if provider is not None and hasattr(provider, "unfinished_tasks"):
+        for task in provider.unfinished_tasks().values():
+            subtopic = (task.get("metadata") or {}).get("subtopic")
+            if subtopic and subtopic not in known and subtopic not in subtopics:
+                subtopics.append(subtopic)
+    return subtopics
+
+
 def _topic_decomposition_node(
     state: LiteratureReviewState,
     llm: BaseChatModel,
+    framework=None,
 ) -> LiteratureReviewState:
     """
-    Node that decomposes the research goal into focused subtopics.
+    Node that decomposes the research goal into focused subtopics. If a
+    previous run decomposed the goal but crashed before its state was saved,
+    those subtopics are reused and decomposition is skipped. With a framework,
+    new subtopics that duplicate existing ones are dropped before research,
+    and the decomposition is saved to the goal directory.
     """
+    resumed = _resumable_subtopics(state, framework)
+    if resumed:
+        logging.info(f"Resuming {len(resumed)} subtopics of a previous run, skipping decomposition")
+        return {"subtopics": (state.get("subtopics") or []) + resumed}
+
     prompt = load_prompt(
         "topic_decomposition",
         goal=state["goal"],
@@ -83,13 +238,31 @@ def _topic_decomposition_node(
     if not subtopics:
         raise ValueError("Failed to parse any topics from decomposition response")
 
-    if state.get("subtopics", False):
-        subtopics = state["subtopics"] + subtopics
-
-    return {"subtopics": subtopics}
-
-
-async def _write_subtopic_report(subtopic: str, main_goal: str, output_dir: str = None) -> str:
+    existing = state.get("subtopics") or []
+    skipped_research = dict(state.get("skipped_research") or {})
+    if framework is not None and hasattr(framework, "config"):
+        subtopics, duplicates = deduplicate_subtopics(
+            subtopics,
+            existing,
+            framework.config.proximity_agent_embedding_model.embed_documents,
+            framework.config.subtopic_dedup_threshold,
+        )
+        if duplicates:
+            logging.info(f"Skipping {len(duplicates)} duplicate subtopics: {duplicates}")
+        skipped_research["duplicate_subtopics"] = (
+            skipped_research.get("duplicate_subtopics", 0) + len(duplicates)
+        )
+    if framework is not None and hasattr(framework, "state_manager"):
+        _save_subtopic_decomposition(
+            framework.state_manager._state._output_dir, existing + subtopics
+        )
+
+    return {"subtopics": existing + subtopics, "skipped_research": skipped_research}
+
+
+async def _write_subtopic_report(
+    subtopic: str, main_goal: str, output_dir: str = None, provider=None
+) -> str:
     """
     Conduct research for a single subtopic using configurable backend.
 
@@ -100,42 +273,51 @@ async def _write_subtopic_report(subtopic: str, main_goal: str, output_dir: str
     main_goal : str
         The main research goal for context
     output_dir : str, optional
-        Output directory for progress logging
+        Output directory for progress logging. Finished reports are saved
+        there and reused instead of researching the subtopic again.
+    provider : ResearchProvider, optional
+        Research provider to use. Sharing one provider across subtopics lets
+        background tasks be polled together; a new one is created if omitted.
 
     Returns
     -------
     str
-        The research report
+        The research report, or "" if the research failed so that the next
+        expansion researches the subtopic again
     """
-    # Load configuration and create research provider
-    config = load_researcher_config()
-    provider = create_research_provider(config, output_dir or ".")
+    if output_dir is not None and os.path.exists(_subtopic_report_path(output_dir, subtopic)):
+        logging.info(f"Reusing saved report for subtopic '{subtopic}'")
+        with open(_subtopic_report_path(output_dir, subtopic), "r") as f:
+            return json.load(f)["report"]
+
+    if provider is None:
+        provider = create_research_provider(load_researcher_config(), output_dir or ".")
     
     # Create query combining subtopic and main goal
     query = f"Research: {subtopic}\n\nContext: {main_goal}"
-    task_id = f"lit_review_{hash(subtopic)}"
+    task_id = f"lit_review_{_subtopic_key(subtopic)}"
     
     try:
-        if provider.supports_background_mode():
-            # Start background research
-            response_id = await provider.conduct_research(query, task_id)
-            
-            # Poll for completion
-            polling_interval = config.get("OPENAI_DEEP_RESEARCH_POLLING_INTERVAL", 30)
-            while True:
-                result = await provider.get_result(task_id)
-                if result:
-                    return result
-                await asyncio.sleep(polling_interval)
-        else:
-            # Blocking mode (GPT-Researcher or Perplexity)
-            return await provider.conduct_research(query, task_id)
-            
+        # Waits on the provider's shared poller in background mode. The
+        # subtopic is stored with the task so a restart can resume it.
+        report = await provider.research(
+            query,
+            task_id,
+            metadata={"subtopic": subtopic},
+            priority=ResearchPriority.LITERATURE_REVIEW,
+        )
     except asyncio.TimeoutError:
-        return f"# Research Timeout\n\nResearch for subtopic '{subtopic}' timed out."
+        logging.error(f"Research timed out for subtopic '{subtopic}'")
+        return ""
     except Exception as e:
         logging.error(f"Research failed for subtopic '{subtopic}': {e}")
-        return f"# Research Error\n\nError researching subtopic '{subtopic}': {str(e)}"
+        return ""
+    if is_failed_report(report):
+        logging.error(f"Research failed for subtopic '{subtopic}': {report}")
+        return ""
+    if output_dir is not None:
+        _save_subtopic_report(output_dir, subtopic, report)
+    return report
 
 
 async def _parallel_research_node(
@@ -143,48 +325,86 @@ async def _parallel_research_node(
     framework=None
 ) -> LiteratureReviewState:
     """
-    Node that conducts parallel research for all subtopics using configured backend.
+    Node that conducts parallel research, using the configured backend, for
+    the subtopics that do not have a report yet.
     """
     from coscientist.progress_events import phase_start, phase_complete, task_start, task_complete
     
     subtopics = state["subtopics"]
     main_goal = state["goal"]
+
+    # Reports are aligned with subtopics; an empty report means not researched
+    # yet, still running or failed. Error reports are from older states.
+    subtopic_reports = list(state.get("subtopic_reports") or [])
+    subtopic_reports += [""] * (len(subtopics) - len(subtopic_reports))
+    pending = [
+        i
+        for i, report in enumerate(subtopic_reports)
+        if not report or is_failed_report(report)
+    ]
+    skipped_research = dict(state.get("skipped_research") or {})
+    skipped_research["existing_reports"] = (
+        skipped_research.get("existing_reports", 0) + len(subtopics) - len(pending)
+    )
     
     # Get output directory for progress tracking
     output_dir = "."
     if framework and hasattr(framework, 'state_manager'):
         output_dir = framework.state_manager._state._output_dir
+    if framework is not None and hasattr(framework, 'research_provider'):
+        provider = framework.research_provider
+    else:
+        provider = create_research_provider(load_researcher_config(), output_dir)
     
     # Log phase start
-    phase_start("literature_review", f"Researching {len(subtopics)} subtopics", output_dir)
+    phase_start(
+        "literature_review",
+        f"Researching {len(pending)} subtopics ({len(subtopics) - len(pending)} already have reports)",
+        output_dir,
+    )
     
     # Create research tasks
     research_tasks = []
-    for i, topic in enumerate(subtopics):
+    for i in pending:
         task_id = f"subtopic_{i+1}"
-        task_start("literature_review", task_id, topic, output_dir)
-        research_tasks.append(_write_subtopic_report(topic, main_goal, output_dir))
+        task_start("literature_review", task_id, subtopics[i], output_dir)
+        research_tasks.append(_write_subtopic_report(subtopics[i], main_goal, output_dir, provider))
     
     # Execute all research tasks in parallel
     try:
-        subtopic_reports = await asyncio.gather(*research_tasks, return_exceptions=True)
+        early_start = framework is not None and getattr(
+            framework.config, "early_start_min_reports", None
+        )
+        if early_start:
+            new_reports = await _research_with_early_start(
+                research_tasks, pending, {**state, "subtopic_reports": subtopic_reports}, framework
+            )
+        else:
+            new_reports = await asyncio.gather(*research_tasks, return_exceptions=True)
         
         # Log completion
-        for i, (topic, report) in enumerate(zip(subtopics, subtopic_reports)):
+        for n, (i, report) in enumerate(zip(pending, new_reports)):
             task_id = f"subtopic_{i+1}"
-            progress = int((i+1)/len(subtopics)*100)
-            task_complete("literature_review", task_id, "Complete", output_dir, progress=progress)
+            progress = int((n+1)/len(pending)*100)
+            status = "Complete" if report else "Failed or still running, retried on next expansion"
+            task_complete("literature_review", task_id, status, output_dir, progress=progress)
         
         # Check if any research failed - FAIL FAST, don't continue with garbage
-        exceptions = [r for r in subtopic_reports if isinstance(r, Exception)]
+        exceptions = [r for r in new_reports if isinstance(r, Exception)]
         if exceptions:
-            error_msg = f"Research failed for {len(exceptions)}/{len(subtopics)} subtopics: {exceptions[0]}"
+            error_msg = f"Research failed for {len(exceptions)}/{len(pending)} subtopics: {exceptions[0]}"
             logging.error(error_msg)
             phase_complete("literature_review", f"FAILED: {error_msg}", output_dir)
             raise RuntimeError(error_msg) from exceptions[0]
         
-        # All research succeeded
-        phase_complete("literature_review", f"All {len(subtopics)} subtopics researched", output_dir)
+        # Failed subtopics and stragglers are left for the next expansion
+        stragglers = sum(1 for report in new_reports if not report)
+        phase_complete(
+            "literature_review",
+            f"{len(pending) - stragglers} subtopics researched, "
+            f"{stragglers} failed or still running",
+            output_dir,
+        )
         
     except Exception as e:
         logging.error(f"Parallel research failed: {e}")
@@ -192,10 +412,94 @@ async def _parallel_research_node(
         raise  # Re-raise to STOP EXECUTION immediately
     
     # Success path only
-    if state.get("subtopic_reports", False):
-        subtopic_reports = state["subtopic_reports"] + subtopic_reports
+    for i, report in zip(pending, new_reports):
+        subtopic_reports[i] = report
+
+    return {"subtopic_reports": subtopic_reports, "skipped_research": skipped_research}
 
-    return {"subtopic_reports": subtopic_reports}
+
+async def _research_with_early_start(
+    research_tasks: list,
+    pending: list[int],
+    state: LiteratureReviewState,
+    framework,
+) -> list:
+    """
+    Run subtopic research, publishing each report to the state manager as it
+    arrives so generation can start before the slowest subtopic finishes.
+
+    Once `framework.config.early_start_min_reports` reports are in, the
+    framework's `literature_review_ready` event (if any) is set and the
+    remaining subtopics get `framework.config.straggler_deadline` more
+    seconds. Subtopics still running after that are left running in
+    `framework.straggler_research`, keyed by subtopic, and are collected by
+    the next expansion instead of being researched again. A straggler that
+    is still running `framework.config.straggler_timeout` seconds later is
+    cancelled so it releases its research slot, and the next expansion
+    researches it again.
+
+    Returns
+    -------
+    list
+        Reports (or exceptions) aligned with `pending`; "" for stragglers
+    """
+    subtopics = state["subtopics"]
+    subtopic_reports = list(state["subtopic_reports"])
+    min_reports = min(framework.config.early_start_min_reports, len(pending))
+
+    index_of = {}
+    for coro, i in zip(research_tasks, pending):
+        task = framework.straggler_research.pop(subtopics[i], None)
+        if task is None or task.cancelled():
+            task = asyncio.ensure_future(coro)
+        else:
+            coro.close()  # Collect the straggler instead of researching again
+        index_of[task] = i
+
+    results: dict[int, object] = {}
+    running = set(index_of)
+    deadline = None
+    while running:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        done, running = await asyncio.wait(
+            running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        if not done:
+            break  # Soft deadline passed
+
+        for task in done:
+            i = index_of[task]
+            if task.cancelled():
+                results[i] = ""  # Straggler timed out; research it again next time
+                continue
+            results[i] = task.exception() or task.result()
+            if isinstance(results[i], Exception):
+                # Fail fast, as when waiting for all subtopics
+                for other in running:
+                    other.cancel()
+                return [results.get(j, "") for j in pending]
+            subtopic_reports[i] = results[i]
+
+        # Later reports feed into subsequent generation calls
+        framework.state_manager.publish_partial_literature_review(
+            {**state, "subtopic_reports": list(subtopic_reports)}
+        )
+        # Placeholders for failed research and cancelled stragglers do not
+        # count toward an early start
+        usable = sum(1 for result in results.values() if result)
+        if deadline is None and usable >= min_reports:
+            deadline = time.monotonic() + framework.config.straggler_deadline
+            ready = getattr(framework, "literature_review_ready", None)
+            if ready is not None:
+                ready.set()
+
+    loop = asyncio.get_running_loop()
+    for task in running:
+        framework.straggler_research[subtopics[index_of[task]]] = task
+        loop.call_later(framework.config.straggler_timeout, task.cancel)
+    if running:
+        logging.info(f"{len(running)} subtopics passed the soft deadline, folding into next expansion")
+    return [results.get(i, "") for i in pending]
 
 
 def build_literature_review_agent(llm: BaseChatModel, framework=None) -> StateGraph:
@@ -219,7 +523,7 @@ def build_literature_review_agent(llm: BaseChatModel, framework=None) -> StateGr
     # Add nodes
     graph.add_node(
         "topic_decomposition",
-        lambda state: _topic_decomposition_node(state, llm),
+        lambda state: _topic_decomposition_node(state, llm, framework),
     )
 
     # Wrap async function properly for LangGraph
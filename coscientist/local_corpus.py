@@ -0,0 +1,236 @@
+"""
+Offline research over a local directory of papers and notes.
+
+The corpus is split into passages and indexed with BM25. Each posting stores
+the passage's full BM25 term weight, so a query only sums precomputed weights
+over the postings of its terms. This keeps search fast enough for hundreds of
+queries per second. The index is saved to disk as JSON, along with a
+fingerprint of the corpus files, and is rebuilt only when those files change.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Any
+
+CORPUS_EXTENSIONS = (".txt", ".md", ".markdown", ".rst")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were which with what how why".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Lowercase word tokens with stopwords and single characters removed.
+
+    Parameters
+    ----------
+    text : str
+        Text to tokenize
+
+    Returns
+    -------
+    list[str]
+        Tokens in order of appearance
+    """
+    return [
+        token
+        for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+def split_passages(text: str, passage_words: int) -> list[str]:
+    """Split text into passages of about `passage_words` words on paragraph breaks."""
+    passages, current, current_words = [], [], 0
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        n_words = len(paragraph.split())
+        if current and current_words + n_words > passage_words:
+            passages.append("\n\n".join(current))
+            current, current_words = [], 0
+        current.append(paragraph)
+        current_words += n_words
+    if current:
+        passages.append("\n\n".join(current))
+    return passages
+
+
+def corpus_fingerprint(corpus_dir: str) -> dict[str, list[float]]:
+    """
+    Relative path -> [mtime, size] for every indexable file in the corpus.
+
+    Parameters
+    ----------
+    corpus_dir : str
+        Root directory of the corpus
+
+    Returns
+    -------
+    dict[str, list[float]]
+        Fingerprint used to decide whether a saved index is stale
+    """
+    fingerprint = {}
+    for root, _, files in os.walk(corpus_dir):
+        for name in sorted(files):
+            if not name.lower().endswith(CORPUS_EXTENSIONS):
+                continue
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            fingerprint[os.path.relpath(path, corpus_dir)] = [stat.st_mtime, stat.st_size]
+    return fingerprint
+
+
+class LocalCorpusIndex:
+    """
+    BM25 inverted index over passages of a local corpus.
+
+    Parameters
+    ----------
+    passages : list[dict[str, str]]
+        Passages as {"source": relative path, "text": passage text}
+    postings : dict[str, list[list]]
+        Term -> [[passage index, BM25 weight], ...]
+    fingerprint : dict[str, list[float]]
+        Corpus fingerprint at build time
+    """
+
+    def __init__(
+        self,
+        passages: list[dict[str, str]],
+        postings: dict[str, list[list]],
+        fingerprint: dict[str, list[float]],
+    ):
+        self.passages = passages
+        self.postings = postings
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(
+        cls,
+        corpus_dir: str,
+        passage_words: int = 200,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> "LocalCorpusIndex":
+        """
+        Index every text file under `corpus_dir`.
+
+        Parameters
+        ----------
+        corpus_dir : str
+            Root directory of the corpus
+        passage_words : int
+            Target passage length in words
+        k1 : float
+            BM25 term frequency saturation
+        b : float
+            BM25 length normalisation
+
+        Returns
+        -------
+        LocalCorpusIndex
+            The built index
+        """
+        fingerprint = corpus_fingerprint(corpus_dir)
+        passages, term_counts = [], []
+        for rel_path in fingerprint:
+            with open(os.path.join(corpus_dir, rel_path), "r", errors="ignore") as f:
+                text = f.read()
+            for passage in split_passages(text, passage_words):
+                passages.append({"source": rel_path, "text": passage})
+                term_counts.append(Counter(tokenize(passage)))
+
+        n_passages = len(passages)
+        lengths = [sum(counts.values()) for counts in term_counts]
+        avg_length = (sum(lengths) / n_passages) if n_passages else 0.0
+        document_frequency = Counter(term for counts in term_counts for term in counts)
+
+        postings: dict[str, list[list]] = defaultdict(list)
+        for idx, counts in enumerate(term_counts):
+            norm = k1 * (1 - b + b * lengths[idx] / avg_length) if avg_length else k1
+            for term, tf in counts.items():
+                df = document_frequency[term]
+                idf = math.log(1 + (n_passages - df + 0.5) / (df + 0.5))
+                postings[term].append([idx, round(idf * tf * (k1 + 1) / (tf + norm), 6)])
+
+        return cls(passages, dict(postings), fingerprint)
+
+    @classmethod
+    def load(cls, index_path: str) -> "LocalCorpusIndex":
+        """Load an index saved with `save`."""
+        with open(index_path, "r") as f:
+            data = json.load(f)
+        return cls(data["passages"], data["postings"], data["fingerprint"])
+
+    def save(self, index_path: str) -> None:
+        """Save the index as JSON."""
+        os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "passages": self.passages,
+                    "postings": self.postings,
+                    "fingerprint": self.fingerprint,
+                },
+                f,
+            )
+        os.replace(tmp_path, index_path)
+
+    @classmethod
+    def load_or_build(cls, corpus_dir: str, index_path: str) -> "LocalCorpusIndex":
+        """
+        Load the saved index, rebuilding and saving it if the corpus changed.
+
+        Parameters
+        ----------
+        corpus_dir : str
+            Root directory of the corpus
+        index_path : str
+            Where the index is stored
+
+        Returns
+        -------
+        LocalCorpusIndex
+            An index that matches the current corpus
+        """
+        if os.path.exists(index_path):
+            index = cls.load(index_path)
+            if index.fingerprint == corpus_fingerprint(corpus_dir):
+                return index
+        index = cls.build(corpus_dir)
+        index.save(index_path)
+        return index
+
+    def search(self, query: str, top_k: int = 8) -> list[dict[str, Any]]:
+        """
+        Rank passages against a query with BM25.
+
+        Parameters
+        ----------
+        query : str
+            Free-text query
+        top_k : int
+            Number of passages to return
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Best passages first, as {"source", "text", "score"}
+        """
+        scores: dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            for idx, weight in self.postings.get(term, ()):
+                scores[idx] += weight
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [{**self.passages[idx], "score": score} for idx, score in best]
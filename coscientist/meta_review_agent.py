@@ -19,13 +19,16 @@ overview can match the style of a review paper or a grant proposal
 - Decides topics for additional research to follow up on.
 """
 
-from typing import TypedDict
+import logging
+from typing import NotRequired, Optional, TypedDict
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph
 
-from coscientist.common import load_prompt, validate_llm_response
+from coscientist.common import load_prompt, prompt_token_budget, validate_llm_response
 from coscientist.custom_types import ReviewedHypothesis
+from coscientist.debate_summaries import DebateSummarizer
 from coscientist.ranking_agent import EloTournament
 
 
@@ -38,9 +41,18 @@ class MetaReviewTournamentState(TypedDict):
     tournament: EloTournament
     top_k: int
     result: str
+    # Number of matches in the tournament's match_history covered by the
+    # meta-review. Set on output; on input it marks where new matches start.
+    match_watermark: NotRequired[int]
+    # The previous meta-review, updated in place by incremental meta-reviews
+    previous_review: NotRequired[str]
 
 
-def build_meta_review_agent(llm: BaseChatModel) -> StateGraph:
+def build_meta_review_agent(
+    llm: BaseChatModel,
+    incremental: bool = False,
+    debate_summarizer: Optional[DebateSummarizer] = None,
+) -> StateGraph:
     """
     Builds and configures a LangGraph for meta-review analysis.
 
@@ -48,6 +60,13 @@ def build_meta_review_agent(llm: BaseChatModel) -> StateGraph:
     ----------
     llm : BaseChatModel
         The language model to use for meta-review generation.
+    incremental : bool
+        If True, the previous meta-review is updated with only the matches
+        played after `match_watermark`, so the prompt does not grow with the
+        full match history.
+    debate_summarizer : Optional[DebateSummarizer]
+        If given, debates over its token budget are replaced by map-reduce
+        summaries before the meta-review call.
 
     Returns
     -------
@@ -58,7 +77,7 @@ def build_meta_review_agent(llm: BaseChatModel) -> StateGraph:
 
     graph.add_node(
         "meta_review",
-        lambda state: _meta_review_node(state, llm),
+        _meta_review_node(llm, incremental, debate_summarizer),
     )
 
     graph.add_edge("meta_review", END)
@@ -107,47 +126,138 @@ def _get_top_hypotheses_data(
     return sorted_hypotheses[:top_k]
 
 
-def _meta_review_node(
-    state: MetaReviewTournamentState,
-    llm: BaseChatModel,
-) -> MetaReviewTournamentState:
-    """
-    Meta-review node that synthesizes tournament data into a comprehensive meta-analysis.
-    """
-    tournament = state["tournament"]
-
-    # Build ratings text - hypotheses sorted by ELO rating (highest to lowest)
-    sorted_hypotheses = tournament.get_sorted_hypotheses()
-    ratings_entries = []
-    for hyp_id, rating in sorted_hypotheses:
-        hypothesis = tournament.hypotheses[hyp_id]
-        ratings_entries.append(_format_hypothesis_with_rating(hypothesis, rating))
-    ratings_text = "\n".join(ratings_entries)
-
-    # Build debates text from match history
+def _format_debates(matches: list, start: int = 1) -> list[str]:
+    """Helper function to format match results as numbered debates."""
     debates_entries = []
-    for i, match_result in enumerate(tournament.match_history.values(), 1):
+    for i, match_result in enumerate(matches, start):
         debate_header = (
             f"Debate {i}: Hypothesis {match_result.uid1} vs Hypothesis {match_result.uid2} "
             f"(Winner: {match_result.winner})"
         )
         debates_entries.append(f"{debate_header}\n{match_result.debate}")
-    debates_text = "\n\n".join(debates_entries)
+    return debates_entries
 
-    prompt = load_prompt(
-        "meta_review_tournament",
-        goal=state["goal"],
-        ratings=ratings_text,
-        debates=debates_text,
-    )
-    response = llm.invoke(prompt)
+
+def _meta_review_request(
+    state: MetaReviewTournamentState, incremental: bool
+) -> Optional[dict]:
+    """
+    Prompt name, prompt arguments and debates for a meta-review, or None if
+    an incremental meta-review has no new matches to read.
+
+    Incremental meta-reviews only include the top k ratings and the ratings
+    of hypotheses in new matches, so the prompt size depends on the matches
+    since the last meta-review rather than on the whole tournament.
+    """
+    tournament = state["tournament"]
+    sorted_hypotheses = tournament.get_sorted_hypotheses()
+    previous_review = state.get("previous_review")
+
+    # Nothing to update yet; the first meta-review covers every match
+    if not incremental or not previous_review:
+        # Build ratings text - hypotheses sorted by ELO rating (highest to lowest)
+        ratings_entries = []
+        for hyp_id, rating in sorted_hypotheses:
+            hypothesis = tournament.hypotheses[hyp_id]
+            ratings_entries.append(_format_hypothesis_with_rating(hypothesis, rating))
+        return {
+            "name": "meta_review_tournament",
+            "kwargs": {"goal": state["goal"], "ratings": "\n".join(ratings_entries)},
+            "debates": _format_debates(list(tournament.match_history.values())),
+            "context": {"goal": state["goal"], "num_hypotheses": len(sorted_hypotheses)},
+        }
+
+    watermark = state.get("match_watermark", 0)
+    new_matches = list(tournament.match_history.values())[watermark:]
+    if not new_matches:
+        return None
+
+    involved = {uid for match in new_matches for uid in (match.uid1, match.uid2)}
+    ratings_entries = [
+        _format_hypothesis_with_rating(tournament.hypotheses[hyp_id], rating)
+        for rank, (hyp_id, rating) in enumerate(sorted_hypotheses)
+        if rank < state["top_k"] or hyp_id in involved
+    ]
+    return {
+        "name": "meta_review_incremental",
+        "kwargs": {
+            "goal": state["goal"],
+            "previous_review": previous_review,
+            "ratings": "\n".join(ratings_entries),
+        },
+        "debates": _format_debates(new_matches, start=watermark + 1),
+        "context": {"goal": state["goal"], "num_new_matches": len(new_matches)},
+    }
+
+
+def _finish_meta_review(
+    state: MetaReviewTournamentState, request: dict, prompt: str, response
+) -> MetaReviewTournamentState:
+    """
+    Validate the meta-review and record the matches it covered.
+    """
     response_content = validate_llm_response(
         response=response,
-        agent_name="meta_review_tournament",
+        agent_name=request["name"],
         prompt=prompt,
-        context={"goal": state["goal"], "num_hypotheses": len(sorted_hypotheses)}
+        context=request["context"],
     )
-    return {**state, "result": response_content}
+    return {
+        **state,
+        "result": response_content,
+        "match_watermark": len(state["tournament"].match_history),
+    }
+
+
+def _meta_review_node(
+    llm: BaseChatModel,
+    incremental: bool,
+    debate_summarizer: Optional[DebateSummarizer],
+) -> RunnableLambda:
+    """
+    Meta-review node that synthesizes tournament data into a comprehensive
+    meta-analysis, with sync and async versions.
+
+    The async version summarises oversized debates with concurrent calls.
+    """
+
+    def unchanged(state):
+        logging.info("No matches since the last meta-review, keeping it unchanged")
+        return {**state, "result": state["previous_review"]}
+
+    def node(state):
+        request = _meta_review_request(state, incremental)
+        if request is None:
+            return unchanged(state)
+        if debate_summarizer is not None:
+            debates = debate_summarizer.summarize(request["debates"])
+        else:
+            debates = "\n\n".join(request["debates"])
+        prompt = load_prompt(
+            request["name"],
+            token_budget=prompt_token_budget(llm),
+            debates=debates,
+            **request["kwargs"],
+        )
+        return _finish_meta_review(state, request, prompt, llm.invoke(prompt))
+
+    async def anode(state):
+        request = _meta_review_request(state, incremental)
+        if request is None:
+            return unchanged(state)
+        if debate_summarizer is not None:
+            debates = await debate_summarizer.asummarize(request["debates"])
+        else:
+            debates = "\n\n".join(request["debates"])
+        prompt = load_prompt(
+            request["name"],
+            token_budget=prompt_token_budget(llm),
+            debates=debates,
+            **request["kwargs"],
+        )
+        return _finish_meta_review(state, request, prompt, await llm.ainvoke(prompt))
+
+    return RunnableLambda(node, afunc=anode)
 
 
 def _top_hypotheses_review_node(
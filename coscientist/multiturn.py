@@ -1,10 +1,17 @@
-from typing import Any, Callable, Optional, Type, TypedDict
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, NotRequired, Optional, Type, TypedDict
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableLambda
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from langgraph.graph import END, StateGraph
 
 from coscientist.common import load_prompt, validate_llm_response
 
+logger = logging.getLogger(__name__)
+
 
 class MultiTurnState(TypedDict):
     """Generalized state for multi-turn agent conversations."""
@@ -13,6 +20,164 @@ class MultiTurnState(TypedDict):
     turn: int
     next_agent: str
     finished: bool
+    # Rolling summary of transcript[:summarized_turns], used with a TranscriptWindow
+    transcript_summary: NotRequired[str]
+    summarized_turns: NotRequired[int]
+    # Prompt size and token usage of every LLM call, in call order
+    turn_usage: NotRequired[list[dict[str, Any]]]
+
+
+@dataclass
+class TranscriptWindow:
+    """
+    Show agents only the most recent turns verbatim, plus a rolling summary
+    of earlier turns, instead of the full transcript.
+
+    Attributes
+    ----------
+    keep_last : int
+        Number of most recent turns always shown verbatim.
+    summary_llm : BaseChatModel
+        Model that writes the rolling summary; a cheap model is enough.
+    summarize_every : int
+        The summary is refreshed once this many turns have fallen out of the
+        window, so between refreshes up to keep_last + summarize_every - 1
+        turns are shown verbatim.
+    """
+
+    keep_last: int
+    summary_llm: BaseChatModel
+    summarize_every: int = 3
+
+
+def _join_turns(turns: list[tuple[str, str]]) -> str:
+    return "\n".join([f"{name}: {msg}" for name, msg in turns])
+
+
+def render_transcript(state: MultiTurnState, window: TranscriptWindow | None = None) -> str:
+    """
+    Render the transcript for an agent prompt.
+
+    Parameters
+    ----------
+    state : MultiTurnState
+        The conversation state
+    window : TranscriptWindow | None
+        If given, turns covered by the rolling summary are replaced by it
+
+    Returns
+    -------
+    str
+        The transcript as it should appear in the prompt
+    """
+    if window is None:
+        return _join_turns(state["transcript"])
+    summary = state.get("transcript_summary", "")
+    recent = _join_turns(state["transcript"][state.get("summarized_turns", 0) :])
+    if not summary:
+        return recent
+    return f"Summary of earlier turns:\n{summary}\n\nRecent turns:\n{recent}"
+
+
+def _usage_record(name: str, turn: int, prompt: str, llm_response) -> dict[str, Any]:
+    """Prompt size and token usage of one LLM call."""
+    usage = getattr(llm_response, "usage_metadata", None) or {}
+    record = {
+        "agent": name,
+        "turn": turn,
+        "prompt_chars": len(prompt),
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+    }
+    logger.info(
+        f"[multiturn] turn {turn} {name}: {record['prompt_chars']} prompt chars, "
+        f"{record['input_tokens']} input / {record['output_tokens']} output tokens"
+    )
+    return record
+
+
+def summarize_turn_usage(turn_usage: list[dict[str, Any]]) -> str:
+    """
+    One-line summary of per-turn token usage, for tuning the transcript window.
+
+    Parameters
+    ----------
+    turn_usage : list[dict[str, Any]]
+        The `turn_usage` field of a finished conversation
+
+    Returns
+    -------
+    str
+        Input tokens of every agent turn, and the number and cost of
+        summary refreshes
+    """
+    turns = [u for u in turn_usage if u["agent"] != "summary"]
+    summaries = [u for u in turn_usage if u["agent"] == "summary"]
+    per_turn = ", ".join(str(u["input_tokens"]) for u in turns)
+    summary_tokens = sum(u["input_tokens"] + u["output_tokens"] for u in summaries)
+    return (
+        f"{len(turns)} turns, input tokens per turn: [{per_turn}], "
+        f"{sum(u['input_tokens'] for u in turns)} total; "
+        f"{len(summaries)} summary refreshes, {summary_tokens} tokens"
+    )
+
+
+def _pending_summary(state: MultiTurnState, window: TranscriptWindow) -> tuple[int, int] | None:
+    """Range of turns to fold into the summary, or None if no refresh is due."""
+    start = state.get("summarized_turns", 0)
+    end = len(state["transcript"]) - window.keep_last
+    if end - start >= window.summarize_every:
+        return start, end
+    return None
+
+
+def _summary_prompt(state: MultiTurnState, start: int, end: int) -> str:
+    return load_prompt(
+        "transcript_summary",
+        summary=state.get("transcript_summary", "") or "Nothing yet.",
+        turns=_join_turns(state["transcript"][start:end]),
+    )
+
+
+def _with_summary(
+    state: MultiTurnState, end: int, prompt: str, llm_response
+) -> MultiTurnState:
+    summary = validate_llm_response(
+        response=llm_response,
+        agent_name="multiturn_transcript_summary",
+        prompt=prompt,
+        context={"turn": state.get("turn", 0), "summarized_turns": end},
+    )
+    return {
+        **state,
+        "transcript_summary": summary,
+        "summarized_turns": end,
+        "turn_usage": state.get("turn_usage", [])
+        + [_usage_record("summary", state.get("turn", 0), prompt, llm_response)],
+    }
+
+
+def refresh_summary(state: MultiTurnState, window: TranscriptWindow) -> MultiTurnState:
+    """
+    Fold turns that fell out of the window into the rolling summary, if a
+    refresh is due.
+    """
+    pending = _pending_summary(state, window)
+    if pending is None:
+        return state
+    start, end = pending
+    prompt = _summary_prompt(state, start, end)
+    return _with_summary(state, end, prompt, window.summary_llm.invoke(prompt))
+
+
+async def arefresh_summary(state: MultiTurnState, window: TranscriptWindow) -> MultiTurnState:
+    """Async version of `refresh_summary`."""
+    pending = _pending_summary(state, window)
+    if pending is None:
+        return state
+    start, end = pending
+    prompt = _summary_prompt(state, start, end)
+    return _with_summary(state, end, prompt, await window.summary_llm.ainvoke(prompt))
 
 
 def create_agent_node_fn(
@@ -20,29 +185,35 @@ def create_agent_node_fn(
     llm: BaseChatModel,
     prompt_name: str,
     prompt_keys_from_state: list[str],
+    transcript_window: TranscriptWindow | None = None,
     **prompt_kwargs: dict[str, Any],
-) -> Callable[[MultiTurnState], MultiTurnState]:
-    """Create an agent node function."""
+) -> RunnableLambda:
+    """
+    Create an agent node function.
+
+    The node has sync and async versions, so the graph supports both invoke
+    and ainvoke. Cancelling the async version cancels the in-flight LLM call.
+    With a `transcript_window`, the prompt gets the recent turns plus a
+    rolling summary instead of the full transcript. Prompt size and token
+    usage of every call are appended to the `turn_usage` state field.
+    """
     assert (
         "transcript" not in prompt_kwargs
     ), "transcript will be added from state and should not be in prompt_kwargs"
 
-    def agent_fn(state):
+    def build_prompt(state) -> str:
         # Build prompt args from state
         # Add transcript
-        transcript_str = "\n".join(
-            [f"{name}: {msg}" for name, msg in state["transcript"]]
-        )
-        prompt_kwargs["transcript"] = transcript_str
+        transcript_str = render_transcript(state, transcript_window)
+        kwargs = {**prompt_kwargs, "transcript": transcript_str}
 
         # Add prompt keys from state
         for key in prompt_keys_from_state:
-            prompt_kwargs[key] = state.get(key, "Not Available")
+            kwargs[key] = state.get(key, "Not Available")
 
-        # Generate response
-        prompt = load_prompt(prompt_name, **prompt_kwargs)
-        llm_response = llm.invoke(prompt)
+        return load_prompt(prompt_name, **kwargs)
 
+    def add_response(state, prompt, llm_response):
         # Validate response with catastrophic failure on empty
         validated_content = validate_llm_response(
             response=llm_response,
@@ -56,9 +227,26 @@ def create_agent_node_fn(
             }
         )
 
-        return {**state, "transcript": state["transcript"] + [(agent_name, validated_content)]}
+        return {
+            **state,
+            "transcript": state["transcript"] + [(agent_name, validated_content)],
+            "turn_usage": state.get("turn_usage", [])
+            + [_usage_record(agent_name, state.get("turn", 0), prompt, llm_response)],
+        }
+
+    def agent_fn(state):
+        if transcript_window is not None:
+            state = refresh_summary(state, transcript_window)
+        prompt = build_prompt(state)
+        return add_response(state, prompt, llm.invoke(prompt))
+
+    async def aagent_fn(state):
+        if transcript_window is not None:
+            state = await arefresh_summary(state, transcript_window)
+        prompt = build_prompt(state)
+        return add_response(state, prompt, await llm.ainvoke(prompt))
 
-    return agent_fn
+    return RunnableLambda(agent_fn, afunc=aagent_fn)
 
 
 def create_moderator_node_fn(
@@ -90,6 +278,70 @@ def create_moderator_node_fn(
     return moderator_fn
 
 
+def create_parallel_round_node_fn(
+    agent_node_fns: dict[str, RunnableLambda],
+    transcript_window: TranscriptWindow | None = None,
+) -> RunnableLambda:
+    """
+    Create a node in which every agent takes a turn at the same time.
+
+    All agents see the same transcript, i.e. the turns of previous rounds
+    but not each other's turn in this round. Their turns are appended in the
+    order of `agent_node_fns`, so the transcript does not depend on which
+    agent finished first. In the async version the agents' LLM calls run
+    concurrently; in the sync version they run in worker threads.
+
+    Parameters
+    ----------
+    agent_node_fns : dict[str, RunnableLambda]
+        Agent nodes from `create_agent_node_fn`, by agent name
+    transcript_window : TranscriptWindow | None
+        The window the agent nodes were created with. The rolling summary is
+        refreshed once per round here, rather than by every agent.
+    """
+    agent_fns = list(agent_node_fns.values())
+
+    def merge_turns(state, outputs):
+        n_turns = len(state["transcript"])
+        n_usage = len(state.get("turn_usage", []))
+        return {
+            **state,
+            "transcript": state["transcript"]
+            + [output["transcript"][n_turns] for output in outputs],
+            "turn_usage": state.get("turn_usage", [])
+            + [record for output in outputs for record in output["turn_usage"][n_usage:]],
+        }
+
+    def round_fn(state):
+        if transcript_window is not None:
+            state = refresh_summary(state, transcript_window)
+        with ContextThreadPoolExecutor(max_workers=len(agent_fns)) as pool:
+            outputs = list(pool.map(lambda agent_fn: agent_fn.invoke(state), agent_fns))
+        return merge_turns(state, outputs)
+
+    async def around_fn(state):
+        if transcript_window is not None:
+            state = await arefresh_summary(state, transcript_window)
+        # A failing agent cancels the others
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(agent_fn.ainvoke(state)) for agent_fn in agent_fns]
+        return merge_turns(state, [task.result() for task in tasks])
+
+    return RunnableLambda(round_fn, afunc=around_fn)
+
+
+def create_round_moderator_node_fn(
+    max_rounds: int,
+) -> Callable[[MultiTurnState], MultiTurnState]:
+    """Create a moderator that finishes the conversation after `max_rounds` rounds."""
+
+    def moderator_fn(state: MultiTurnState) -> MultiTurnState:
+        turn = state["turn"] + 1
+        return {**state, "turn": turn, "finished": turn >= max_rounds}
+
+    return moderator_fn
+
+
 def build_multi_turn_agent(
     state_type: Type[MultiTurnState],
     agent_node_fns: dict[str, Callable[[MultiTurnState], MultiTurnState]],
@@ -24,9 +24,15 @@ class ProximityGraph:
     def __init__(self):
         self.graph = nx.Graph()
 
-    def add_hypothesis(self, hypothesis: ParsedHypothesis):
-        """Add a hypothesis to the graph."""
-        embedding = create_embedding(hypothesis.hypothesis)
+    def add_hypothesis(
+        self, hypothesis: ParsedHypothesis, embedding: np.ndarray | None = None
+    ):
+        """
+        Add a hypothesis to the graph. A precomputed embedding can be passed
+        in so the (blocking) embedding call can happen off the caller's thread.
+        """
+        if embedding is None:
+            embedding = create_embedding(hypothesis.hypothesis)
         self.graph.add_node(
             hypothesis.uid, hypothesis=hypothesis.hypothesis, embedding=embedding
         )
@@ -26,7 +26,7 @@ from typing import Optional  # Add Optional
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from coscientist import multiturn
-from coscientist.common import load_prompt, validate_llm_response
+from coscientist.common import load_prompt, prompt_token_budget, validate_llm_response
 from coscientist.custom_types import RankingMatchResult, ReviewedHypothesis
 
 # Constants
@@ -46,6 +46,7 @@ def _build_debate_agent(
     agent_names: list[str],
     llms: dict[str, BaseChatModel],
     max_turns: int = 10,
+    transcript_window: Optional[multiturn.TranscriptWindow] = None,
 ) -> DebateState:
     """Build collaborative generation agent."""
 
@@ -63,6 +64,7 @@ def _build_debate_agent(
                 "review_1",
                 "review_2",
             ],
+            transcript_window=transcript_window,
         )
 
     # Create moderator and post-processor
@@ -144,6 +146,7 @@ class EloTournament:
         hypo2: ReviewedHypothesis,
         prompt_name: str,
         llm: BaseChatModel,
+        transcript_window: Optional[multiturn.TranscriptWindow] = None,
     ) -> tuple[int, str]:
         """
         Uses the LLM with a specific prompt to determine the winner between two hypotheses.
@@ -156,6 +159,9 @@ class EloTournament:
             The second hypothesis.
         prompt_name : str
             The name of the prompt template to use (e.g., 'tournament').
+        transcript_window : Optional[multiturn.TranscriptWindow]
+            Windowed transcript for simulated debates; the full transcript
+            is used if None.
 
         Returns
         -------
@@ -168,13 +174,15 @@ class EloTournament:
             "goal": self.goal,
             "hypothesis_1": hypo1.hypothesis,
             "hypothesis_2": hypo2.hypothesis,
-            "review_1": hypo1.verification_result,
-            "review_2": hypo2.verification_result,
+            "review_1": hypo1.prompt_review,
+            "review_2": hypo2.prompt_review,
         }
 
         # Load and format the prompt
         if prompt_name == "tournament":
-            formatted_prompt = load_prompt(prompt_name, **prompt_input)
+            formatted_prompt = load_prompt(
+                prompt_name, token_budget=prompt_token_budget(llm), **prompt_input
+            )
             response = llm.invoke(formatted_prompt)
             response_text = validate_llm_response(
                 response=response,
@@ -188,7 +196,10 @@ class EloTournament:
             )
         elif prompt_name == "simulated_debate":
             agent = _build_debate_agent(
-                agent_names=["scientist"], llms={"scientist": llm}, max_turns=10
+                agent_names=["scientist"],
+                llms={"scientist": llm},
+                max_turns=10,
+                transcript_window=transcript_window,
             )
             initial_state = DebateState(
                 transcript=[],
@@ -227,26 +238,64 @@ class EloTournament:
 
         # Use itertools.combinations to get unique pairs
         for id1, id2 in list(itertools.combinations(hypo_ids, 2)):
-            hypo1 = self.hypotheses[id1]
-            hypo2 = self.hypotheses[id2]
-            rating1 = self.ratings[id1]
-            rating2 = self.ratings[id2]
-
             pair = tuple(sorted((id1, id2))) + (stage,)
             previous_outcome = self.match_history.get(pair, None)
             if previous_outcome is None:
                 # If no history, run the match
-                winner, debate = self._determine_winner(hypo1, hypo2, "tournament", llm)
+                winner, debate = self.judge_match(id1, id2, llm)
+                self.record_match(id1, id2, winner, debate, stage=stage)
+
+    def pending_round_robin_opponents(self, uid: str) -> list[str]:
+        """
+        Returns the hypotheses that `uid` has not yet played in the round-robin stage.
+
+        Used to seed a newly added hypothesis into the tournament incrementally,
+        without replaying matches that are already in the match history.
+        """
+        return [
+            other_id
+            for other_id in self.hypotheses
+            if other_id != uid
+            and tuple(sorted((uid, other_id))) + (1,) not in self.match_history
+        ]
+
+    def judge_match(
+        self,
+        id1: str,
+        id2: str,
+        llm: BaseChatModel,
+        prompt_name: str = "tournament",
+    ) -> tuple[int, str]:
+        """
+        Judges a single match without touching ratings or match history.
 
-                self.match_history[pair] = RankingMatchResult(
-                    uid1=id1, uid2=id2, winner=winner, debate=debate
-                )
-                new_rating1, new_rating2 = update_elo(rating1, rating2, winner)
+        This only reads the two hypotheses, so it is safe to run in a worker
+        thread while the tournament itself is updated on the caller's side.
+        """
+        return self._determine_winner(
+            self.hypotheses[id1], self.hypotheses[id2], prompt_name, llm
+        )
 
-                self.ratings[id1] = new_rating1
-                self.ratings[id2] = new_rating2
+    def record_match(
+        self, id1: str, id2: str, winner: int, debate: str, stage: int = 1
+    ) -> None:
+        """Records a match result and updates the ELO ratings of both hypotheses."""
+        pair = tuple(sorted((id1, id2))) + (stage,)
+        self.match_history[pair] = RankingMatchResult(
+            uid1=id1, uid2=id2, winner=winner, debate=debate
+        )
+        new_rating1, new_rating2 = update_elo(
+            self.ratings[id1], self.ratings[id2], winner
+        )
+        self.ratings[id1] = new_rating1
+        self.ratings[id2] = new_rating2
 
-    def run_bracket_stage(self, llm: BaseChatModel, k: int = 16) -> Optional[str]:
+    def run_bracket_stage(
+        self,
+        llm: BaseChatModel,
+        k: int = 16,
+        transcript_window: Optional[multiturn.TranscriptWindow] = None,
+    ) -> Optional[str]:
         """
         Runs the single-elimination bracket stage for the top k hypotheses.
         Uses SIMULATED_DEBATE_PROMPT for matches.
@@ -256,6 +305,8 @@ class EloTournament:
         ----------
         k : int, optional
             The number of top hypotheses to include in the bracket (must be power of 2).
+        transcript_window : Optional[multiturn.TranscriptWindow]
+            Windowed transcript for the simulated debates.
 
         Returns
         -------
@@ -297,7 +348,7 @@ class EloTournament:
                 if previous_outcome is None:
                     # Pair hasn't played, run the LLM
                     winner, debate = self._determine_winner(
-                        hypo1, hypo2, "simulated_debate", llm
+                        hypo1, hypo2, "simulated_debate", llm, transcript_window
                     )
 
                     winner_id = id1 if winner == 1 else id2
@@ -318,7 +369,12 @@ class EloTournament:
             current_round_ids = next_round_ids
             round_num += 1
 
-    def run_tournament(self, llm: BaseChatModel, k_bracket: int = 16) -> Optional[str]:
+    def run_tournament(
+        self,
+        llm: BaseChatModel,
+        k_bracket: int = 16,
+        transcript_window: Optional[multiturn.TranscriptWindow] = None,
+    ) -> Optional[str]:
         """
         Runs the full two-stage tournament.
 
@@ -326,6 +382,8 @@ class EloTournament:
         ----------
         k_bracket : int, optional
             The number of top hypotheses for the bracket stage.
+        transcript_window : Optional[multiturn.TranscriptWindow]
+            Windowed transcript for the simulated debates of the bracket stage.
 
         Returns
         -------
@@ -333,7 +391,7 @@ class EloTournament:
             The ID of the final winning hypothesis from the bracket stage, or None.
         """
         self.run_round_robin_stage(llm)
-        self.run_bracket_stage(llm, k=k_bracket)
+        self.run_bracket_stage(llm, k=k_bracket, transcript_window=transcript_window)
         self._past_tournament_ratings.append(list(self.ratings.values()))
 
     def get_win_loss_records(self) -> dict[str, dict[str, int]]:
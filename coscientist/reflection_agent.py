@@ -21,7 +21,6 @@ for the observations to review.
 """
 
 import asyncio
-import logging
 import os
 import re
 from typing import Optional, TypedDict
@@ -32,8 +31,9 @@ from langchain_core.language_models.chat_models import BaseChatModel
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 
-from coscientist.common import load_prompt, validate_llm_response
+from coscientist.common import load_prompt, prompt_token_budget, validate_llm_response
 from coscientist.custom_types import ParsedHypothesis, ReviewedHypothesis
+from coscientist.report_digests import ReportDigestCache, select_report_context
 
 
 class ReflectionState(TypedDict):
@@ -228,7 +228,11 @@ def assumption_decomposer_node(
 
 
 def deep_verification_node(
-    state: ReflectionState, llm: BaseChatModel
+    state: ReflectionState,
+    llm: BaseChatModel,
+    report_digests: Optional[ReportDigestCache] = None,
+    digest_llm: Optional[BaseChatModel] = None,
+    token_budget: int = 12000,
 ) -> ReflectionState:
     """
     Performs deep verification of a hypothesis using the deep_verification.md prompt.
@@ -239,6 +243,13 @@ def deep_verification_node(
         The current state of the reflection process
     llm: BaseChatModel
         The language model to use for verification
+    report_digests: Optional[ReportDigestCache]
+        If given, the longest assumption research reports are replaced by
+        cached digests (written with `digest_llm`) until they fit `token_budget`
+    digest_llm: Optional[BaseChatModel]
+        The language model that condenses reports, defaults to `llm`
+    token_budget: int
+        Token budget for assumption research in the verification prompt
 
     Returns
     -------
@@ -256,20 +267,30 @@ def deep_verification_node(
         "_causal_reasoning" in state
     ), f"Missing '_causal_reasoning'. Available keys: {available_keys}"
 
-    # Combine assumption research results into a single string
-    # TRUNCATE to prevent prompt from being too large
-    raw_assumption_research = "\n\n".join(state["_assumption_research_results"].values())
-    
-    # Limit total length to ~50,000 chars to avoid Gemini token limits
-    MAX_RESEARCH_LENGTH = 50000
-    if len(raw_assumption_research) > MAX_RESEARCH_LENGTH:
-        logging.warning(f"Assumption research too large ({len(raw_assumption_research)} chars), truncating to {MAX_RESEARCH_LENGTH}")
-        assumption_research = raw_assumption_research[:MAX_RESEARCH_LENGTH] + "\n\n... [truncated]"
+    # Combine assumption research results into a single string. If it does
+    # not fit the model's context, load_prompt falls back to cached digests
+    # and then truncates.
+    research_reports = list(state["_assumption_research_results"].values())
+    digests = None
+    if report_digests is not None:
+        condense_llm = digest_llm or llm
+        assumption_research = select_report_context(
+            research_reports,
+            token_budget,
+            lambda report: report_digests.get_or_create(report, condense_llm),
+        )
+        digests = {
+            "assumption_research": "\n\n".join(
+                report_digests.get(report) or report for report in research_reports
+            )
+        }
     else:
-        assumption_research = raw_assumption_research
+        assumption_research = "\n\n".join(research_reports)
 
     prompt = load_prompt(
         "deep_verification",
+        token_budget=prompt_token_budget(llm),
+        digests=digests,
         hypothesis=state["hypothesis_to_review"].hypothesis,
         reasoning=state["_causal_reasoning"],
         assumption_research=assumption_research,
@@ -299,12 +320,57 @@ def deep_verification_node(
     }
 
 
+def review_card_node(state: ReflectionState, llm: BaseChatModel) -> ReflectionState:
+    """
+    Writes a compact review card for the reviewed hypothesis using the
+    review_card.md prompt.
+
+    The card stands in for the full review in tournament and final report
+    prompts, where a hypothesis's review is read once per match it plays.
+
+    Parameters
+    ----------
+    state: ReflectionState
+        The current state of the reflection process
+    llm: BaseChatModel
+        The language model to use for the card
+
+    Returns
+    -------
+    ReflectionState
+        Updated state with the review card set on reviewed_hypothesis
+    """
+    reviewed_hypothesis = state["reviewed_hypothesis"]
+    prompt = load_prompt(
+        "review_card",
+        hypothesis=reviewed_hypothesis.hypothesis,
+        review=reviewed_hypothesis.verification_result,
+    )
+    response = llm.invoke(prompt)
+    response_content = validate_llm_response(
+        response=response,
+        agent_name="reflection_review_card",
+        prompt=prompt,
+        context={"hypothesis_uid": reviewed_hypothesis.uid}
+    )
+
+    return {
+        "reviewed_hypothesis": reviewed_hypothesis.model_copy(
+            update={"review_card": response_content}
+        ),
+    }
+
+
 def build_deep_verification_agent(
     llm: BaseChatModel,
     review_llm: BaseChatModel,
     parallel: bool = False,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     breakpoints: Optional[list[str]] = None,
+    research_provider=None,
+    report_digests: Optional[ReportDigestCache] = None,
+    research_token_budget: int = 12000,
+    review_card_llm: Optional[BaseChatModel] = None,
 ):
     """
     Builds and configures a multinode LangGraph for comprehensive deep verification with research.
@@ -327,6 +393,17 @@ def build_deep_verification_agent(
         Checkpointer to save and restore graph state for debugging and resumption
     breakpoints: Optional[list[str]], default=None
         List of node names to set as breakpoints (execution will pause before these nodes)
+    research_provider: Optional[ResearchProvider], default=None
+        Research provider for assumption research, normally the framework's.
+        A new provider is created per query if omitted.
+    report_digests: Optional[ReportDigestCache], default=None
+        Digest cache used to condense assumption research reports for the
+        final verification prompt. Reports are passed in full if omitted.
+    research_token_budget: int, default=12000
+        Token budget for assumption research in the final verification prompt
+    review_card_llm: Optional[BaseChatModel], default=None
+        If given, a review_card node after deep verification writes a compact
+        review card with this model and stores it on the reviewed hypothesis
 
     Returns
     -------
@@ -356,19 +433,22 @@ def build_deep_verification_agent(
     if parallel:
         graph.add_node(
             "assumption_researcher",
-            lambda state: _parallel_assumption_research_node(state),
+            lambda state: _parallel_assumption_research_node(state, research_provider),
         )
     else:
         graph.add_node(
             "assumption_researcher",
-            lambda state: _sequential_assumption_research_node(state),
+            lambda state: _sequential_assumption_research_node(state, research_provider),
         )
 
     graph.add_node(
         "hypothesis_simulation", lambda state: hypothesis_simulation_node(state, llm)
     )
     graph.add_node(
-        "deep_verification", lambda state: deep_verification_node(state, review_llm)
+        "deep_verification",
+        lambda state: deep_verification_node(
+            state, review_llm, report_digests, llm, research_token_budget
+        ),
     )
 
     # Set entry point to desk reject
@@ -393,8 +473,15 @@ def build_deep_verification_agent(
     graph.add_edge("hypothesis_simulation", "sync_parallel_results")
     graph.add_edge("sync_parallel_results", "deep_verification")
 
-    # Final verification connects to end
-    graph.add_edge("deep_verification", END)
+    # Final verification connects to end, through the review card if enabled
+    if review_card_llm is not None:
+        graph.add_node(
+            "review_card", lambda state: review_card_node(state, review_card_llm)
+        )
+        graph.add_edge("deep_verification", "review_card")
+        graph.add_edge("review_card", END)
+    else:
+        graph.add_edge("deep_verification", END)
 
     # Compile with optional checkpointer and breakpoints
     compile_kwargs = {}
@@ -406,7 +493,9 @@ def build_deep_verification_agent(
     return graph.compile(**compile_kwargs)
 
 
-async def _write_assumption_research_report(assumption_evaluation_query: str) -> str:
+async def _write_assumption_research_report(
+    assumption_evaluation_query: str, research_provider=None
+) -> str:
     """
     Conduct research for a single sub-assumption using Perplexity (via research backend).
 
@@ -414,6 +503,8 @@ async def _write_assumption_research_report(assumption_evaluation_query: str) ->
     ----------
     assumption_evaluation_query : str
         The research query
+    research_provider : ResearchProvider, optional
+        Provider to research with; a new one is created if omitted
 
     Returns
     -------
@@ -421,22 +512,28 @@ async def _write_assumption_research_report(assumption_evaluation_query: str) ->
         The research report
     """
     # Import here to avoid circular deps
-    from coscientist.research_backend import create_research_provider
-    from coscientist.config_loader import load_researcher_config
-    
-    config = load_researcher_config()
-    output_dir = os.path.dirname(__file__)
-    research_provider = create_research_provider(config, output_dir)
+    from coscientist.research_scheduler import ResearchPriority
+
+    if research_provider is None:
+        from coscientist.research_backend import create_research_provider
+        from coscientist.config_loader import load_researcher_config
+
+        config = load_researcher_config()
+        output_dir = os.path.dirname(__file__)
+        research_provider = create_research_provider(config, output_dir)
     
     # Generate a unique task ID for this research
     import uuid
     task_id = f"assumption_research_{uuid.uuid4().hex[:8]}"
     
     try:
-        # Conduct research with timeout (Perplexity is fast, ~30s)
-        report = await asyncio.wait_for(
-            research_provider.conduct_research(assumption_evaluation_query, task_id),
-            timeout=180.0
+        # Conduct research with timeout (Perplexity is fast, ~30s). The timeout
+        # starts once the call holds a research slot, not while it is queued.
+        report = await research_provider.research(
+            assumption_evaluation_query,
+            task_id,
+            priority=ResearchPriority.ASSUMPTION_RESEARCH,
+            timeout=180.0,
         )
         return report
     except asyncio.TimeoutError:
@@ -447,6 +544,7 @@ async def _write_assumption_research_report(assumption_evaluation_query: str) ->
 
 def _parallel_assumption_research_node(
     state: ReflectionState,
+    research_provider=None,
 ) -> ReflectionState:
     """
     Node that conducts parallel research for all assumptions and sub-assumptions using GPTResearcher.
@@ -465,7 +563,7 @@ def _parallel_assumption_research_node(
             for i, sub_assumption in enumerate(sub_assumptions):
                 query += f"Sub-assumption {i}: {sub_assumption} "
 
-            task = _write_assumption_research_report(query)
+            task = _write_assumption_research_report(query, research_provider)
             research_tasks.append(task)
 
         # Execute all research tasks in parallel with hard timeout
@@ -474,9 +572,11 @@ def _parallel_assumption_research_node(
             timeout=900.0  # 15 minutes hard deadline
         )
 
-    # Run the async operations synchronously
+    # Run the async operations synchronously, on the shared research loop
+    from coscientist.research_backend import run_research
+
     try:
-        research_results = asyncio.run(_conduct_research())
+        research_results = run_research(_conduct_research())
     except Exception as e:
         raise RuntimeError(f"Failed to conduct research for assumptions: {str(e)}")
 
@@ -490,10 +590,13 @@ def _parallel_assumption_research_node(
 
 def _sequential_assumption_research_node(
     state: ReflectionState,
+    research_provider=None,
 ) -> ReflectionState:
     """
     Node that conducts sequential research for all assumptions and sub-assumptions using GPTResearcher.
     """
+    from coscientist.research_backend import run_research
+
     parsed_assumptions = state["_parsed_assumptions"]
     assumption_research_results = {}
 
@@ -508,7 +611,7 @@ def _sequential_assumption_research_node(
             query += f"Sub-assumption {i}: {sub_assumption} "
 
         # Run research for this assumption
-        result = asyncio.run(_write_assumption_research_report(query))
+        result = run_research(_write_assumption_research_report(query, research_provider))
         assumption_research_results[assumption] = result
 
     return {"_assumption_research_results": assumption_research_results}
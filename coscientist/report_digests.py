@@ -0,0 +1,161 @@
+"""
+Compact, citation-preserving digests of research reports.
+
+Subtopic and assumption research reports can run to tens of thousands of
+characters each. A digest of each report is stored in the goal directory
+next to the run's other artifacts, keyed by the SHA-256 of the full report,
+so no report is ever summarised twice. Prompt builders then choose between
+the full text and the digest so that the reports fit a token budget.
+"""
+
+import asyncio
+import hashlib
+import os
+from typing import Callable, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+
+from coscientist.common import estimate_tokens, load_prompt, validate_llm_response
+
+
+def report_hash(report: str) -> str:
+    """SHA-256 hex digest identifying a report's exact text."""
+    return hashlib.sha256(report.encode("utf-8")).hexdigest()
+
+
+class ReportDigestCache:
+    """
+    Digests of research reports, cached as one markdown file per report hash.
+
+    Parameters
+    ----------
+    output_dir : str
+        Goal directory; digests are stored in its `report_digests` folder
+    """
+
+    DIRNAME = "report_digests"
+
+    def __init__(self, output_dir: str):
+        self.directory = os.path.join(output_dir, self.DIRNAME)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, report: str) -> str:
+        return os.path.join(self.directory, f"{report_hash(report)}.md")
+
+    def get(self, report: str) -> Optional[str]:
+        """
+        Cached digest for a report.
+
+        Parameters
+        ----------
+        report : str
+            Full report text
+
+        Returns
+        -------
+        Optional[str]
+            The digest, or None if the report has not been condensed yet
+        """
+        path = self._path(report)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return f.read()
+
+    def get_or_create(self, report: str, llm: BaseChatModel) -> str:
+        """
+        Cached digest for a report, condensing it with `llm` on a cache miss.
+
+        Parameters
+        ----------
+        report : str
+            Full report text
+        llm : BaseChatModel
+            Model used to write the digest
+
+        Returns
+        -------
+        str
+            The digest
+        """
+        digest = self.get(report)
+        if digest is not None:
+            return digest
+
+        prompt = load_prompt("report_digest", report=report)
+        response = llm.invoke(prompt)
+        digest = validate_llm_response(
+            response=response,
+            agent_name="report_digest",
+            prompt=prompt,
+            context={"report_length": len(report)},
+        )
+
+        # Write then rename so concurrent readers never see a partial digest
+        path = self._path(report)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(digest)
+        os.replace(tmp_path, path)
+        return digest
+
+    async def acondense(self, reports: list[str], llm: BaseChatModel) -> list[str]:
+        """
+        Digest every report, condensing uncached reports concurrently.
+
+        Parameters
+        ----------
+        reports : list[str]
+            Full report texts; duplicates are condensed once
+        llm : BaseChatModel
+            Model used to write the digests
+
+        Returns
+        -------
+        list[str]
+            Digests in the same order as `reports`
+        """
+        unique = list(dict.fromkeys(r for r in reports if r))
+        digests = await asyncio.gather(
+            *[asyncio.to_thread(self.get_or_create, report, llm) for report in unique]
+        )
+        by_report = dict(zip(unique, digests))
+        return [by_report.get(report, report) for report in reports]
+
+
+def select_report_context(
+    reports: list[str],
+    token_budget: int,
+    digest: Callable[[str], Optional[str]],
+) -> str:
+    """
+    Join reports into prompt context that fits a token budget.
+
+    Reports stay in their original order. The longest reports are swapped
+    for their digests first, and only until the total fits the budget, so
+    short reports and reports under budget keep their full text.
+
+    Parameters
+    ----------
+    reports : list[str]
+        Full report texts
+    token_budget : int
+        Target size of the joined context in estimated tokens
+    digest : Callable[[str], Optional[str]]
+        Returns a report's digest, or None if none is available
+
+    Returns
+    -------
+    str
+        The reports, some replaced by digests, joined by blank lines
+    """
+    texts = list(reports)
+    total = sum(estimate_tokens(text) for text in texts)
+    for i in sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True):
+        if total <= token_budget:
+            break
+        condensed = digest(texts[i])
+        if condensed and len(condensed) < len(texts[i]):
+            total -= estimate_tokens(texts[i]) - estimate_tokens(condensed)
+            texts[i] = condensed
+    return "\n\n".join(texts)
@@ -3,22 +3,341 @@ Configurable research backend supporting multiple providers:
 - OpenAI Deep Research (o3/o4-mini)
 - Perplexity API
 - GPT-Researcher (legacy fallback)
+- Local corpus (offline BM25 search over a directory of papers and notes)
 """
 
 import asyncio
+import json
 import logging
+import os
+import threading
 import time
+import weakref
+from collections import Counter, deque
 from enum import Enum
-from typing import Optional, Protocol, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Optional, Protocol, TypeVar
+
+from coscientist.research_scheduler import ResearchPriority, get_research_scheduler
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Providers return these in place of a report when a research call fails
+FAILED_REPORT_PREFIXES = ("# Research Error", "# Research Timeout")
+
+
+def is_failed_report(report: str) -> bool:
+    """Whether a report records a failed or timed out research call."""
+    return report.startswith(FAILED_REPORT_PREFIXES)
+
+# Connection pool shared by every OpenAI-compatible research provider. httpx
+# connections are bound to the event loop that opened them, so there is one
+# pool per running loop: the framework's loop and the long-lived research
+# loop that synchronous callers (reflection) submit research to.
+_DEFAULT_MAX_CONNECTIONS = 20
+_HTTP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_http_client(max_connections: int = _DEFAULT_MAX_CONNECTIONS):
+    """
+    Get the pooled httpx.AsyncClient for the running event loop.
+
+    Parameters
+    ----------
+    max_connections : int
+        Pool size, only used when the pool for this loop is first created.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        The shared HTTP client for the running loop
+    """
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(3600.0, connect=30.0),
+        )
+        _HTTP_CLIENTS[loop] = client
+    return client
+
+
+_RESEARCH_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_RESEARCH_LOOP_LOCK = threading.Lock()
+
+
+def _research_loop() -> asyncio.AbstractEventLoop:
+    """Get the long-lived research event loop, starting its thread on first use."""
+    global _RESEARCH_LOOP
+    with _RESEARCH_LOOP_LOCK:
+        if _RESEARCH_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="research-loop", daemon=True
+            ).start()
+            _RESEARCH_LOOP = loop
+    return _RESEARCH_LOOP
+
+
+def run_research(coro: Awaitable[T]) -> T:
+    """
+    Run a research coroutine from synchronous code and wait for its result.
+
+    Unlike `asyncio.run`, which creates (and leaves behind) a new loop, and so
+    a new connection pool, for every call, all calls share one long-lived
+    loop. Its HTTP and AsyncOpenAI clients are reused across calls.
+
+    Parameters
+    ----------
+    coro : Awaitable
+        The coroutine to run
+
+    Returns
+    -------
+    Any
+        The coroutine's result
+    """
+    loop = _research_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("run_research cannot be called from the research loop")
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        # The caller was interrupted; do not leave the research running
+        future.cancel()
+        raise
+
+
+class _AsyncOpenAIClients:
+    """
+    Lazily creates one AsyncOpenAI client per event loop, all backed by the
+    shared connection pool.
+    """
+
+    def __init__(self, max_connections: int = _DEFAULT_MAX_CONNECTIONS, **client_kwargs):
+        self.max_connections = max_connections
+        self.client_kwargs = client_kwargs
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self):
+        from openai import AsyncOpenAI
+
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = AsyncOpenAI(
+                http_client=_shared_http_client(self.max_connections),
+                **self.client_kwargs,
+            )
+            self._clients[loop] = client
+        return client
+
+
+# Statuses after which a background response will not change any more.
+_TERMINAL_STATUSES = {"completed", "failed", "cancelled", "incomplete"}
+
+
+class BackgroundTaskPoller:
+    """
+    Single polling loop for every active background research task on an
+    event loop.
+
+    Each tracked response is retrieved at most once per tick. The delay before
+    a task's next poll grows with its age (``backoff`` times the time since it
+    started, clamped to ``[min_interval, max_interval]``), so short tasks are
+    picked up quickly while long deep-research runs are not hammered. Callers
+    await a per-task future that resolves with the terminal response.
+
+    Parameters
+    ----------
+    retrieve : Callable[[str], Awaitable[Any]]
+        Coroutine function fetching the current response for a response id
+    min_interval : float
+        Shortest delay between two polls of the same task, in seconds
+    max_interval : float
+        Longest delay between two polls of the same task, in seconds
+    backoff : float
+        Fraction of a task's age to wait before polling it again
+    on_response : Callable[[str, Any], None], optional
+        Called with ``(response_id, response)`` after every successful retrieve
+    """
+
+    def __init__(
+        self,
+        retrieve: Callable[[str], Awaitable[Any]],
+        min_interval: float = 10.0,
+        max_interval: float = 120.0,
+        backoff: float = 0.1,
+        on_response: Optional[Callable[[str, Any], None]] = None,
+    ):
+        self._retrieve = retrieve
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._on_response = on_response
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._runner: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        # Retrieve calls made per response id, kept after the task finishes
+        self.polls: Dict[str, int] = {}
+
+    def interval_for(self, age: float) -> float:
+        """Delay before the next poll of a task that has been running `age` seconds."""
+        return min(self.max_interval, max(self.min_interval, age * self.backoff))
+
+    def track(self, response_id: str, started_at: Optional[float] = None) -> asyncio.Future:
+        """
+        Start polling a background response.
+
+        Parameters
+        ----------
+        response_id : str
+            Id of the background response
+        started_at : float, optional
+            Wall-clock time the task started, defaults to now
+
+        Returns
+        -------
+        asyncio.Future
+            Resolves with the terminal response. Tracking the same id twice
+            returns the same future.
+        """
+        if response_id in self._tasks:
+            return self._tasks[response_id]["future"]
+
+        loop = asyncio.get_running_loop()
+        self._tasks[response_id] = {
+            "future": loop.create_future(),
+            "started_at": started_at or time.time(),
+            # First poll is always soon, even for a task re-attached after a restart
+            "next_poll": time.time() + self.min_interval,
+        }
+        self.polls.setdefault(response_id, 0)
+        if self._runner is None or self._runner.done():
+            self._runner = loop.create_task(self._run())
+        self._wakeup.set()
+        return self._tasks[response_id]["future"]
+
+    async def _run(self) -> None:
+        while self._tasks:
+            now = time.time()
+            due = [rid for rid, task in self._tasks.items() if task["next_poll"] <= now]
+            if due:
+                responses = await asyncio.gather(
+                    *[self._retrieve(rid) for rid in due], return_exceptions=True
+                )
+                for response_id, response in zip(due, responses):
+                    self._handle(response_id, response)
+
+            if not self._tasks:
+                break
+            wake_at = min(task["next_poll"] for task in self._tasks.values())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=max(0.0, wake_at - time.time())
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def _handle(self, response_id: str, response: Any) -> None:
+        task = self._tasks[response_id]
+        self.polls[response_id] += 1
+        if task["future"].done():
+            # The waiter went away (e.g. cancelled); stop polling for it
+            del self._tasks[response_id]
+            return
+
+        if isinstance(response, Exception):
+            logger.error(f"Error polling background response {response_id}: {response}")
+        else:
+            if self._on_response is not None:
+                self._on_response(response_id, response)
+            if getattr(response, "status", None) in _TERMINAL_STATUSES:
+                task["future"].set_result(response)
+                del self._tasks[response_id]
+                return
+
+        task["next_poll"] = time.time() + self.interval_for(time.time() - task["started_at"])
+
+
+class ResearchTaskRegistry:
+    """
+    JSON file in the goal directory listing background research tasks that
+    have been submitted but not yet collected, so a restarted process can
+    re-attach to them instead of paying for the same research twice.
+
+    Parameters
+    ----------
+    output_dir : str
+        Goal directory the registry file lives in
+    """
+
+    FILENAME = "research_tasks.json"
+
+    def __init__(self, output_dir: str):
+        self.path = os.path.join(output_dir, self.FILENAME)
+        self._lock = threading.Lock()
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                self.tasks = json.load(f)
+
+    def add(
+        self,
+        task_id: str,
+        response_id: str,
+        query: str,
+        started_at: float,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a newly submitted background task."""
+        with self._lock:
+            self.tasks[task_id] = {
+                "response_id": response_id,
+                "query": query,
+                "started_at": started_at,
+                "metadata": metadata or {},
+            }
+            self._write()
+
+    def remove(self, task_id: str) -> None:
+        """Forget a task once its result has been collected."""
+        with self._lock:
+            if self.tasks.pop(task_id, None) is not None:
+                self._write()
+
+    def _write(self) -> None:
+        # Write then rename so a crash never leaves a half-written registry
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.tasks, f, indent=2)
+        os.replace(tmp_path, self.path)
+
 
 class ResearchBackend(str, Enum):
     """Available research backends."""
     OPENAI_DEEP_RESEARCH = "openai_deep_research"
     PERPLEXITY = "perplexity"
     GPT_RESEARCHER = "gpt_researcher"
+    LOCAL_CORPUS = "local_corpus"
 
 
 class ResearchProvider(Protocol):
@@ -78,27 +397,76 @@ class OpenAIDeepResearchProvider:
     """OpenAI o3-deep-research / o4-mini-deep-research backend."""
     
     def __init__(self, config: dict, output_dir: str):
-        from openai import OpenAI
-        self.client = OpenAI(timeout=3600)
+        self._clients = _AsyncOpenAIClients(
+            max_connections=config.get("RESEARCH_MAX_CONNECTIONS", _DEFAULT_MAX_CONNECTIONS),
+            timeout=3600,
+        )
         self.model = config.get("OPENAI_DEEP_RESEARCH_MODEL", "o3-deep-research")
         self.background = config.get("OPENAI_DEEP_RESEARCH_BACKGROUND", True)
         self.output_dir = output_dir
-        self.active_tasks: Dict[str, Dict[str, Any]] = {}
+        self.registry = ResearchTaskRegistry(output_dir)
+        # Tasks left unfinished by a previous process are re-attached to
+        self.active_tasks: Dict[str, Dict[str, Any]] = {
+            task_id: {**entry, "last_check": None, "last_response": None}
+            for task_id, entry in self.registry.tasks.items()
+        }
+        self.min_polling_interval = config.get("OPENAI_DEEP_RESEARCH_POLLING_INTERVAL", 10)
+        self.max_polling_interval = config.get("OPENAI_DEEP_RESEARCH_MAX_POLLING_INTERVAL", 120)
+        self.polling_backoff = config.get("OPENAI_DEEP_RESEARCH_POLLING_BACKOFF", 0.1)
+        self._pollers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BackgroundTaskPoller]" = (
+            weakref.WeakKeyDictionary()
+        )
         
         logger.info(f"Initialized OpenAI Deep Research provider: model={self.model}, background={self.background}")
+        if self.active_tasks:
+            logger.info(f"Found {len(self.active_tasks)} unfinished background research tasks")
+
+    @property
+    def client(self):
+        """AsyncOpenAI client for the running event loop."""
+        return self._clients.get()
+
+    @property
+    def poller(self) -> BackgroundTaskPoller:
+        """Background task poller for the running event loop."""
+        loop = asyncio.get_running_loop()
+        poller = self._pollers.get(loop)
+        if poller is None:
+            poller = BackgroundTaskPoller(
+                retrieve=lambda response_id: self.client.responses.retrieve(response_id),
+                min_interval=self.min_polling_interval,
+                max_interval=self.max_polling_interval,
+                backoff=self.polling_backoff,
+                on_response=self._record_response,
+            )
+            self._pollers[loop] = poller
+        return poller
     
     def supports_background_mode(self) -> bool:
         return self.background
     
-    async def conduct_research(self, query: str, task_id: str) -> str:
-        """Start deep research task."""
+    async def conduct_research(
+        self, query: str, task_id: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Start deep research task. In background mode an unfinished task with
+        the same id and query is re-attached to rather than resubmitted, and
+        `metadata` is persisted with the task in the registry.
+        """
         from coscientist.global_state import log_progress
+
+        existing = self.active_tasks.get(task_id)
+        if self.background and existing is not None and existing["query"] == query:
+            log_progress(self.output_dir, "RESEARCH_RESUME",
+                        f"{task_id}: re-attached to {existing['response_id']}")
+            logger.info(f"Re-attached to background task: {task_id} -> {existing['response_id']}")
+            return existing["response_id"]
         
         log_progress(self.output_dir, "RESEARCH_START", f"{task_id}: {query[:80]}...")
         logger.info(f"Starting OpenAI Deep Research: {task_id}")
         
         try:
-            response = self.client.responses.create(
+            response = await self.client.responses.create(
                 model=self.model,
                 input=query,
                 background=self.background,
@@ -106,12 +474,16 @@ class OpenAIDeepResearchProvider:
             )
             
             if self.background:
+                started_at = time.time()
                 self.active_tasks[task_id] = {
                     "response_id": response.id,
                     "query": query,
-                    "started_at": time.time(),
-                    "last_check": time.time()
+                    "started_at": started_at,
+                    "metadata": metadata or {},
+                    "last_check": started_at,
+                    "last_response": None,
                 }
+                self.registry.add(task_id, response.id, query, started_at, metadata)
                 logger.info(f"Background task started: {task_id} -> {response.id}")
                 return response.id
             else:
@@ -125,9 +497,7 @@ class OpenAIDeepResearchProvider:
             raise
     
     async def get_result(self, task_id: str) -> Optional[str]:
-        """Poll for task completion."""
-        from coscientist.global_state import log_progress
-        
+        """Poll for task completion once."""
         if task_id not in self.active_tasks:
             logger.warning(f"Task {task_id} not found in active tasks")
             return None
@@ -135,46 +505,99 @@ class OpenAIDeepResearchProvider:
         task = self.active_tasks[task_id]
         
         try:
-            response = self.client.responses.retrieve(task["response_id"])
-            task["last_check"] = time.time()
-            
-            if response.status == "completed":
-                elapsed = time.time() - task["started_at"]
-                report = self._extract_report(response)
-                log_progress(self.output_dir, "RESEARCH_DONE", 
-                            f"{task_id}: Complete in {elapsed:.0f}s, {len(report)} chars")
-                logger.info(f"Task {task_id} completed in {elapsed:.0f}s")
-                del self.active_tasks[task_id]
-                return report
-                
-            elif response.status == "failed":
-                error = getattr(response, 'error', 'Unknown error')
-                log_progress(self.output_dir, "RESEARCH_ERROR", f"{task_id}: {error}")
-                logger.error(f"Task {task_id} failed: {error}")
-                del self.active_tasks[task_id]
-                return f"# Research Error\n\n{error}"
-                
-            else:
-                # Still running - log progress
-                progress = self.get_progress(task_id)
-                if progress["details"]:
-                    log_progress(self.output_dir, "RESEARCH_PROGRESS", 
-                                f"{task_id}: {progress['details']}")
-                return None
+            response = await self.client.responses.retrieve(task["response_id"])
+            self._record_response(task["response_id"], response)
+            if response.status in _TERMINAL_STATUSES:
+                return self._finish_task(task_id, response)
+            return None
                 
         except Exception as e:
             logger.error(f"Error checking task {task_id}: {e}")
             return None
+
+    async def wait_for_result(self, task_id: str) -> str:
+        """
+        Wait for a background task to finish, polled by the shared poller.
+
+        Parameters
+        ----------
+        task_id : str
+            Task identifier from conduct_research
+
+        Returns
+        -------
+        str
+            The final report, or an error report if the task failed
+        """
+        if task_id not in self.active_tasks:
+            raise KeyError(f"Task {task_id} not found in active tasks")
+
+        task = self.active_tasks[task_id]
+        response = await self.poller.track(task["response_id"], task["started_at"])
+        return self._finish_task(task_id, response)
+
+    async def cancel(self, task_id: str) -> None:
+        """Cancel a background task server-side and stop tracking it."""
+        from coscientist.global_state import log_progress
+
+        task = self.active_tasks.pop(task_id, None)
+        if task is None:
+            return
+        self.registry.remove(task_id)
+        try:
+            await self.client.responses.cancel(task["response_id"])
+        except Exception as e:
+            logger.warning(f"Could not cancel background task {task_id}: {e}")
+        log_progress(self.output_dir, "RESEARCH_CANCELLED", f"{task_id}: {task['response_id']}")
+
+    def _record_response(self, response_id: str, response) -> None:
+        """Store a polled response on its task and log progress if still running."""
+        from coscientist.global_state import log_progress
+
+        # Copy: reflection threads may add tasks while this loop polls
+        for task_id, task in list(self.active_tasks.items()):
+            if task["response_id"] != response_id:
+                continue
+            task["last_check"] = time.time()
+            task["last_response"] = response
+            if response.status not in _TERMINAL_STATUSES:
+                progress = self.get_progress(task_id)
+                if progress["details"]:
+                    log_progress(self.output_dir, "RESEARCH_PROGRESS",
+                                f"{task_id}: {progress['details']}")
+
+    def _finish_task(self, task_id: str, response) -> str:
+        """Turn a terminal response into a report and stop tracking the task."""
+        from coscientist.global_state import log_progress
+
+        task = self.active_tasks.pop(task_id)
+        self.registry.remove(task_id)
+        elapsed = time.time() - task["started_at"]
+
+        if response.status == "completed":
+            report = self._extract_report(response)
+            log_progress(self.output_dir, "RESEARCH_DONE", 
+                        f"{task_id}: Complete in {elapsed:.0f}s, {len(report)} chars")
+            logger.info(f"Task {task_id} completed in {elapsed:.0f}s")
+            return report
+
+        error = getattr(response, 'error', None) or f"Research {response.status}"
+        log_progress(self.output_dir, "RESEARCH_ERROR", f"{task_id}: {error}")
+        logger.error(f"Task {task_id} {response.status}: {error}")
+        return f"# Research Error\n\n{error}"
     
     def get_progress(self, task_id: str) -> Dict[str, Any]:
-        """Get current progress for task."""
+        """
+        Get current progress for task, parsed from the response retrieved by
+        the most recent `get_result` poll (this makes no API call).
+        """
         if task_id not in self.active_tasks:
             return {"status": "unknown", "details": "", "percent": 0}
         
         task = self.active_tasks[task_id]
         
         try:
-            response = self.client.responses.retrieve(task["response_id"])
+            response = task.get("last_response")
             
             if not hasattr(response, 'output') or not response.output:
                 elapsed = time.time() - task["started_at"]
@@ -246,7 +669,7 @@ class PerplexityProvider:
     
     def __init__(self, config: dict, output_dir: str):
         try:
-            from openai import OpenAI
+            import openai  # noqa: F401
         except ImportError:
             raise ImportError("OpenAI SDK required for Perplexity (pip install openai)")
         
@@ -254,14 +677,20 @@ class PerplexityProvider:
         if not api_key:
             raise ValueError("PERPLEXITY_API_KEY not set in config")
         
-        self.client = OpenAI(
+        self._clients = _AsyncOpenAIClients(
+            max_connections=config.get("RESEARCH_MAX_CONNECTIONS", _DEFAULT_MAX_CONNECTIONS),
             api_key=api_key,
-            base_url="https://api.perplexity.ai"
+            base_url=config.get("PERPLEXITY_BASE_URL", "https://api.perplexity.ai"),
         )
         self.model = config.get("PERPLEXITY_MODEL", "sonar-pro")
         self.output_dir = output_dir
         
         logger.info(f"Initialized Perplexity provider: model={self.model}")
+
+    @property
+    def client(self):
+        """AsyncOpenAI client for the running event loop."""
+        return self._clients.get()
     
     def supports_background_mode(self) -> bool:
         return False  # Perplexity is fast (~30s), no need for background
@@ -274,7 +703,7 @@ class PerplexityProvider:
         logger.info(f"Starting Perplexity research: {task_id}")
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": query}]
             )
@@ -359,10 +788,115 @@ class GPTResearcherProvider:
         return {"status": "running", "details": "Web scraping in progress...", "percent": 50}
 
 
+class LocalCorpusProvider:
+    """Offline backend answering queries from a BM25 index over local files."""
+    
+    def __init__(self, config: dict, output_dir: str):
+        from coscientist.local_corpus import LocalCorpusIndex
+        
+        corpus_dir = config.get("LOCAL_CORPUS_DIR")
+        if not corpus_dir or not os.path.isdir(corpus_dir):
+            raise ValueError(f"LOCAL_CORPUS_DIR not set or not a directory: {corpus_dir}")
+        
+        index_path = config.get(
+            "LOCAL_CORPUS_INDEX_PATH",
+            os.path.join(corpus_dir, ".coscientist_index.json"),
+        )
+        self.index = LocalCorpusIndex.load_or_build(corpus_dir, index_path)
+        self.top_k = config.get("LOCAL_CORPUS_TOP_K", 8)
+        self.output_dir = output_dir
+        
+        logger.info(
+            f"Initialized local corpus provider: {len(self.index.passages)} passages "
+            f"from {len(self.index.fingerprint)} files"
+        )
+    
+    def supports_background_mode(self) -> bool:
+        return False  # Local search takes milliseconds
+    
+    async def conduct_research(self, query: str, task_id: str) -> str:
+        """Answer a query with the best-matching local passages."""
+        from coscientist.global_state import log_progress
+        
+        passages = self.index.search(query, self.top_k)
+        if not passages:
+            report = f"# Local Corpus Report\n\nNo passages in the local corpus match: {query}"
+        else:
+            sections = [
+                f"## {i}. {p['source']} (score {p['score']:.2f})\n\n{p['text']}"
+                for i, p in enumerate(passages, start=1)
+            ]
+            sources = sorted({p["source"] for p in passages})
+            report = (
+                "# Local Corpus Report\n\n"
+                f"**Query:** {query}\n\n"
+                + "\n\n".join(sections)
+                + "\n\n## Sources\n\n"
+                + "\n".join(f"- {source}" for source in sources)
+            )
+        
+        log_progress(self.output_dir, "RESEARCH_DONE",
+                    f"{task_id}: Local corpus, {len(passages)} passages")
+        return report
+    
+    async def get_result(self, task_id: str) -> Optional[str]:
+        """Local search is blocking, no polling needed."""
+        raise NotImplementedError("Local corpus is blocking, use conduct_research directly")
+    
+    def get_progress(self, task_id: str) -> Dict[str, Any]:
+        """Local search finishes immediately."""
+        return {"status": "running", "details": "Searching local corpus...", "percent": 50}
+
+
+def _create_backend(backend: str, config: dict, output_dir: str):
+    """Instantiate the provider for a single research backend."""
+    if backend == ResearchBackend.OPENAI_DEEP_RESEARCH:
+        return OpenAIDeepResearchProvider(config, output_dir)
+    elif backend == ResearchBackend.PERPLEXITY:
+        return PerplexityProvider(config, output_dir)
+    elif backend == ResearchBackend.GPT_RESEARCHER:
+        return GPTResearcherProvider(config, output_dir)
+    elif backend == ResearchBackend.LOCAL_CORPUS:
+        return LocalCorpusProvider(config, output_dir)
+    raise ValueError(f"Unknown research backend: {backend}")
+
+
+async def _complete_research(
+    provider, query: str, task_id: str, metadata: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Run a query on one provider to completion, waiting on its poller in
+    background mode. If cancelled, the provider's background task is
+    cancelled too so it stops costing money.
+    """
+    try:
+        if metadata is not None and provider.supports_background_mode():
+            result = await provider.conduct_research(query, task_id, metadata=metadata)
+        else:
+            result = await provider.conduct_research(query, task_id)
+        if provider.supports_background_mode():
+            result = await provider.wait_for_result(task_id)
+        return result
+    except asyncio.CancelledError:
+        if hasattr(provider, "cancel"):
+            await provider.cancel(task_id)
+        raise
+
+
 class HybridResearchProvider:
     """
     Uses primary provider with optional fallback.
-    Supports: OpenAI Deep Research, Perplexity, GPT-Researcher
+    Supports: OpenAI Deep Research, Perplexity, GPT-Researcher, local corpus
+
+    In hedged mode (RESEARCH_HEDGE_ENABLED) `research` starts the same query on
+    a hedge backend if the primary has not answered after a delay. The delay
+    is either fixed (RESEARCH_HEDGE_DELAY in seconds) or the primary's observed
+    p95 latency (RESEARCH_HEDGE_DELAY = "p95"). The first result wins and the
+    other call is cancelled. Outcomes are counted in `hedge_wins`.
+
+    Every `research` call is admitted by the process-wide ResearchScheduler,
+    which applies per-backend concurrency and requests-per-minute limits,
+    priority classes and fair queuing across goals (one goal per output_dir).
     """
     
     def __init__(self, config: dict, output_dir: str):
@@ -372,26 +906,47 @@ class HybridResearchProvider:
         logger.info(f"Initializing Hybrid Research Provider: backend={backend}, fallback={fallback_enabled}")
         
         # Create primary provider
-        if backend == ResearchBackend.OPENAI_DEEP_RESEARCH:
-            self.primary = OpenAIDeepResearchProvider(config, output_dir)
-        elif backend == ResearchBackend.PERPLEXITY:
-            self.primary = PerplexityProvider(config, output_dir)
-        elif backend == ResearchBackend.GPT_RESEARCHER:
-            self.primary = GPTResearcherProvider(config, output_dir)
-        else:
-            raise ValueError(f"Unknown research backend: {backend}")
+        self.primary = _create_backend(backend, config, output_dir)
+        self.backend = ResearchBackend(backend).value
+        self.scheduler = get_research_scheduler(config)
         
         # Create fallback provider (GPT-Researcher) ONLY if enabled
         self.fallback = GPTResearcherProvider(config, output_dir) if fallback_enabled else None
         self.config = config
         self.output_dir = output_dir
+
+        # Hedged mode: race a second backend against slow primary calls
+        self.hedge = None
+        self.hedge_backend = None
+        if config.get("RESEARCH_HEDGE_ENABLED", False):
+            hedge_backend = config.get("RESEARCH_HEDGE_BACKEND", ResearchBackend.GPT_RESEARCHER.value)
+            if hedge_backend == ResearchBackend.GPT_RESEARCHER and self.fallback is not None:
+                self.hedge = self.fallback
+            else:
+                self.hedge = _create_backend(hedge_backend, config, output_dir)
+            self.hedge_backend = ResearchBackend(hedge_backend).value
+            logger.info(f"Hedged research enabled: hedge backend={hedge_backend}")
+        self.hedge_delay_setting = config.get("RESEARCH_HEDGE_DELAY", "p95")
+        self.hedge_initial_delay = config.get("RESEARCH_HEDGE_INITIAL_DELAY", 120.0)
+        self.hedge_min_samples = config.get("RESEARCH_HEDGE_MIN_SAMPLES", 20)
+        # Primary latencies; for calls the hedge won this is the time until
+        # the primary was cancelled, a lower bound on its real latency
+        self._primary_latencies: deque = deque(maxlen=200)
+        self.hedge_wins: Counter = Counter()
     
     def supports_background_mode(self) -> bool:
         return self.primary.supports_background_mode()
     
-    async def conduct_research(self, query: str, task_id: str) -> str:
-        """Conduct research with primary - NO FALLBACK, fail fast."""
+    async def conduct_research(
+        self, query: str, task_id: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Conduct research with primary - NO FALLBACK, fail fast. `metadata` is
+        stored with background tasks so they can be resumed after a restart.
+        """
         try:
+            if metadata is not None and self.supports_background_mode():
+                return await self.primary.conduct_research(query, task_id, metadata=metadata)
             return await self.primary.conduct_research(query, task_id)
         except Exception as e:
             logger.error(f"Research backend FAILED: {e}")
@@ -401,6 +956,199 @@ class HybridResearchProvider:
     async def get_result(self, task_id: str) -> Optional[str]:
         """Get result from primary provider."""
         return await self.primary.get_result(task_id)
+
+    async def wait_for_result(self, task_id: str) -> str:
+        """Wait for a background task on the primary provider to finish."""
+        return await self.primary.wait_for_result(task_id)
+
+    async def research(
+        self,
+        query: str,
+        task_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        priority: ResearchPriority = ResearchPriority.OTHER,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Conduct research and return the final report, waiting on the shared
+        poller when the primary provider runs in background mode. The call
+        waits for a scheduler slot first.
+
+        Parameters
+        ----------
+        query : str
+            Research query
+        task_id : str
+            Unique identifier for this task
+        metadata : dict, optional
+            Persisted with background tasks, see `unfinished_tasks`
+        priority : ResearchPriority
+            Scheduling priority class
+        timeout : float, optional
+            Seconds the research may take once it holds a scheduler slot;
+            time spent queued for the slot does not count
+
+        Returns
+        -------
+        str
+            The final report
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the research holds its slot for longer than `timeout`
+        """
+        if self.hedge is not None:
+            return await self._hedged_research(query, task_id, metadata, priority, timeout)
+
+        async with self.scheduler.slot(self.backend, priority, self.output_dir):
+            return await asyncio.wait_for(
+                self._primary_research(query, task_id, metadata), timeout
+            )
+
+    async def _primary_research(
+        self, query: str, task_id: str, metadata: Optional[Dict[str, Any]]
+    ) -> str:
+        """
+        Run a query on the primary provider. If cancelled, e.g. by a timeout,
+        its background task is cancelled server-side and deregistered, as in
+        `_complete_research`.
+        """
+        try:
+            result = await self.conduct_research(query, task_id, metadata)
+            if not self.supports_background_mode():
+                return result
+            return await self.wait_for_result(task_id)
+        except asyncio.CancelledError:
+            if hasattr(self.primary, "cancel"):
+                await self.primary.cancel(task_id)
+            raise
+
+    async def _scheduled_research(
+        self,
+        provider,
+        backend: str,
+        query: str,
+        task_id: str,
+        metadata: Optional[Dict[str, Any]],
+        priority: ResearchPriority,
+        timeout: Optional[float] = None,
+        granted: Optional[asyncio.Future] = None,
+    ) -> str:
+        """
+        Run research on one provider once it holds a scheduler slot, and
+        resolve `granted` with the time the slot was granted.
+        """
+        async with self.scheduler.slot(backend, priority, self.output_dir):
+            if granted is not None and not granted.done():
+                granted.set_result(time.monotonic())
+            return await asyncio.wait_for(
+                _complete_research(provider, query, task_id, metadata), timeout
+            )
+
+    def hedge_delay(self) -> float:
+        """
+        Seconds to wait on the primary before starting the hedge.
+
+        Returns
+        -------
+        float
+            The fixed delay, or the primary's observed p95 latency once
+            `hedge_min_samples` calls have been seen (the initial delay before)
+        """
+        if self.hedge_delay_setting != "p95":
+            return float(self.hedge_delay_setting)
+        if len(self._primary_latencies) < self.hedge_min_samples:
+            return float(self.hedge_initial_delay)
+        ordered = sorted(self._primary_latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    async def _hedged_research(
+        self,
+        query: str,
+        task_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        priority: ResearchPriority = ResearchPriority.OTHER,
+        timeout: Optional[float] = None,
+    ) -> str:
+        from coscientist.global_state import log_progress
+
+        delay = self.hedge_delay()
+        granted = asyncio.get_running_loop().create_future()
+        primary = asyncio.ensure_future(
+            self._scheduled_research(
+                self.primary, self.backend, query, task_id, metadata, priority,
+                timeout=timeout, granted=granted,
+            )
+        )
+        running = {primary}
+        try:
+            # The hedge delay and the primary's latency start once it holds a
+            # slot, so calls that are merely queued are not hedged
+            await asyncio.wait({primary, granted}, return_when=asyncio.FIRST_COMPLETED)
+            start = granted.result() if granted.done() else time.monotonic()
+            done, _ = await asyncio.wait(
+                running, timeout=max(0.0, start + delay - time.monotonic())
+            )
+            if done:
+                if isinstance(primary.exception(), asyncio.TimeoutError):
+                    raise primary.exception()
+                if primary.exception() is not None:
+                    # Fail fast, as in unhedged mode
+                    raise RuntimeError(
+                        f"Research failed for {task_id}: {primary.exception()}"
+                    ) from primary.exception()
+                self._primary_latencies.append(time.monotonic() - start)
+                self.hedge_wins["unhedged"] += 1
+                return primary.result()
+
+            log_progress(self.output_dir, "RESEARCH_HEDGE",
+                        f"{task_id}: primary slower than {delay:.0f}s, starting hedge")
+            hedge = asyncio.ensure_future(
+                self._scheduled_research(
+                    self.hedge, self.hedge_backend, query, f"{task_id}_hedge", None, priority,
+                    timeout=timeout,
+                )
+            )
+            running.add(hedge)
+
+            errors = []
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        errors.append(task.exception())
+                        continue
+                    winner = "primary" if task is primary else "hedge"
+                    self._primary_latencies.append(time.monotonic() - start)
+                    self.hedge_wins[winner] += 1
+                    log_progress(self.output_dir, "RESEARCH_HEDGE",
+                                f"{task_id}: {winner} won after {time.monotonic() - start:.0f}s "
+                                f"(wins: {dict(self.hedge_wins)})")
+                    return task.result()
+
+            if all(isinstance(error, asyncio.TimeoutError) for error in errors):
+                raise errors[0]
+            raise RuntimeError(f"Research failed for {task_id}: {errors[0]}") from errors[0]
+        finally:
+            granted.cancel()
+            # Cancel the loser (or both, if we were cancelled ourselves)
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    def unfinished_tasks(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Background tasks submitted but not yet collected, including those
+        restored from a previous process.
+
+        Returns
+        -------
+        dict
+            Task id -> {"response_id", "query", "started_at", "metadata", ...}
+        """
+        return dict(getattr(self.primary, "active_tasks", {}))
     
     def get_progress(self, task_id: str) -> Dict[str, Any]:
         """Get progress from primary provider."""
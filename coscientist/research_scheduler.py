@@ -0,0 +1,248 @@
+"""
+Process-wide scheduler that every research call goes through.
+
+Research runs on several event loops at once: the framework's loop for the
+literature review, and the shared research loop that reflection worker
+threads submit assumption research to. The scheduler is therefore guarded by a threading lock
+and wakes waiters on their own loop with `call_soon_threadsafe`.
+
+For each backend it enforces a concurrency limit and a requests-per-minute
+limit. Queued calls are served by priority class (literature review before
+assumption research), and within a class round-robin across goals so one
+goal's burst cannot starve another running in the same process.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Optional
+
+
+class ResearchPriority(IntEnum):
+    """Priority classes for queued research calls, lowest value first."""
+
+    LITERATURE_REVIEW = 0
+    ASSUMPTION_RESEARCH = 1
+    OTHER = 2
+
+
+# None means unlimited. Overridden per backend by RESEARCH_BACKEND_LIMITS.
+DEFAULT_BACKEND_LIMITS = {
+    "openai_deep_research": {"max_concurrency": 4, "requests_per_minute": 30},
+    "perplexity": {"max_concurrency": 8, "requests_per_minute": 50},
+    "gpt_researcher": {"max_concurrency": 4, "requests_per_minute": None},
+    "local_corpus": {"max_concurrency": None, "requests_per_minute": None},
+}
+
+
+class _Waiter:
+    __slots__ = ("loop", "future", "granted")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.future = loop.create_future()
+        self.granted = False
+
+
+class _BackendQueue:
+    def __init__(self, max_concurrency: Optional[int], requests_per_minute: Optional[int]):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.running = 0
+        self.starts: deque = deque()
+        # priority -> goal -> waiters; goal order is the round-robin order
+        self.waiting: dict[int, OrderedDict[str, deque]] = {}
+        self.timer_pending = False
+
+    def has_waiters(self) -> bool:
+        return any(self.waiting.values())
+
+    def queued(self) -> int:
+        return sum(len(w) for goals in self.waiting.values() for w in goals.values())
+
+
+def _grant(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ResearchScheduler:
+    """
+    Admission control for research calls across all threads and event loops.
+
+    Parameters
+    ----------
+    limits : dict, optional
+        Backend -> {"max_concurrency": int | None, "requests_per_minute": int | None},
+        merged over `DEFAULT_BACKEND_LIMITS`
+    """
+
+    def __init__(self, limits: Optional[dict] = None):
+        self._limits = {
+            backend: dict(backend_limits)
+            for backend, backend_limits in DEFAULT_BACKEND_LIMITS.items()
+        }
+        for backend, backend_limits in (limits or {}).items():
+            self._limits.setdefault(backend, {}).update(backend_limits)
+        self._lock = threading.Lock()
+        self._queues: dict[str, _BackendQueue] = {}
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        backend: str,
+        priority: ResearchPriority = ResearchPriority.OTHER,
+        goal: str = "",
+    ):
+        """
+        Hold one of `backend`'s slots for the duration of the block.
+
+        Parameters
+        ----------
+        backend : str
+            Research backend name, e.g. "openai_deep_research"
+        priority : ResearchPriority
+            Priority class of the call
+        goal : str
+            Goal the call belongs to, used for fair queuing
+        """
+        await self.acquire(backend, priority, goal)
+        try:
+            yield
+        finally:
+            self.release(backend)
+
+    async def acquire(
+        self,
+        backend: str,
+        priority: ResearchPriority = ResearchPriority.OTHER,
+        goal: str = "",
+    ) -> None:
+        """Wait until a slot for `backend` is granted. Pair with `release`."""
+        waiter = _Waiter(asyncio.get_running_loop())
+        with self._lock:
+            queue = self._queue(backend)
+            goals = queue.waiting.setdefault(int(priority), OrderedDict())
+            goals.setdefault(goal, deque()).append(waiter)
+            self._dispatch(queue)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    # Granted while being cancelled; hand the slot on
+                    queue.running -= 1
+                    self._dispatch(queue)
+                else:
+                    waiters = queue.waiting[int(priority)][goal]
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del queue.waiting[int(priority)][goal]
+            raise
+
+    def release(self, backend: str) -> None:
+        """Give back a slot obtained with `acquire`."""
+        with self._lock:
+            queue = self._queue(backend)
+            queue.running -= 1
+            self._dispatch(queue)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Current load per backend.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Backend -> {"running": int, "queued": int}
+        """
+        with self._lock:
+            return {
+                backend: {"running": queue.running, "queued": queue.queued()}
+                for backend, queue in self._queues.items()
+            }
+
+    def _queue(self, backend: str) -> _BackendQueue:
+        if backend not in self._queues:
+            limits = self._limits.get(backend, {})
+            self._queues[backend] = _BackendQueue(
+                limits.get("max_concurrency"), limits.get("requests_per_minute")
+            )
+        return self._queues[backend]
+
+    def _dispatch(self, queue: _BackendQueue) -> None:
+        # Caller holds self._lock
+        while queue.has_waiters():
+            if queue.max_concurrency is not None and queue.running >= queue.max_concurrency:
+                return
+
+            now = time.monotonic()
+            if queue.requests_per_minute is not None:
+                while queue.starts and now - queue.starts[0] >= 60.0:
+                    queue.starts.popleft()
+                if len(queue.starts) >= queue.requests_per_minute:
+                    self._dispatch_later(queue, queue.starts[0] + 60.0 - now)
+                    return
+
+            waiter = self._next_waiter(queue)
+            waiter.granted = True
+            queue.running += 1
+            queue.starts.append(now)
+            waiter.loop.call_soon_threadsafe(_grant, waiter.future)
+
+    def _dispatch_later(self, queue: _BackendQueue, delay: float) -> None:
+        if queue.timer_pending:
+            return
+        queue.timer_pending = True
+
+        def _on_timer():
+            with self._lock:
+                queue.timer_pending = False
+                self._dispatch(queue)
+
+        timer = threading.Timer(max(delay, 0.0), _on_timer)
+        timer.daemon = True
+        timer.start()
+
+    @staticmethod
+    def _next_waiter(queue: _BackendQueue) -> _Waiter:
+        for priority in sorted(queue.waiting):
+            goals = queue.waiting[priority]
+            for goal, waiters in goals.items():
+                waiter = waiters.popleft()
+                if waiters:
+                    goals.move_to_end(goal)
+                else:
+                    del goals[goal]
+                return waiter
+        raise RuntimeError("No research calls are waiting")
+
+
+_SCHEDULER: Optional[ResearchScheduler] = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def get_research_scheduler(config: Optional[dict] = None) -> ResearchScheduler:
+    """
+    Get the process-wide research scheduler, creating it on first use.
+
+    Parameters
+    ----------
+    config : dict, optional
+        Configuration from researcher_config.json; its RESEARCH_BACKEND_LIMITS
+        are applied when the scheduler is first created
+
+    Returns
+    -------
+    ResearchScheduler
+        The shared scheduler
+    """
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None:
+            _SCHEDULER = ResearchScheduler((config or {}).get("RESEARCH_BACKEND_LIMITS"))
+        return _SCHEDULER
@@ -65,21 +65,7 @@ def extract_with_structured_output(
     """
     # Create structured output LLM
     structured_llm = llm.with_structured_output(output_model)
-
-    # Build system message
-    system_msg = "Extract the requested information from the text."
-    if instruction:
-        system_msg += f" {instruction}"
-
-    # Get field descriptions from Pydantic model for context
-    field_descriptions = []
-    for field_name, field_info in output_model.model_fields.items():
-        if field_info.description:
-            field_descriptions.append(f"- {field_name}: {field_info.description}")
-
-    if field_descriptions:
-        system_msg += "\n\nExpected fields:\n" + "\n".join(field_descriptions)
-
+    system_msg = _structured_system_message(output_model, instruction)
     last_error = None
 
     for attempt in range(max_retries):
@@ -128,6 +114,72 @@ def extract_with_structured_output(
     )
 
 
+async def aextract_with_structured_output(
+    llm: BaseChatModel,
+    text: str,
+    output_model: Type[T],
+    instruction: str = None,
+    max_retries: int = 3
+) -> T:
+    """
+    Async version of `extract_with_structured_output`. Cancelling it cancels
+    the in-flight LLM call.
+    """
+    structured_llm = llm.with_structured_output(output_model)
+    system_msg = _structured_system_message(output_model, instruction)
+    last_error = None
+
+    for attempt in range(max_retries):
+        try:
+            logger.info(f"Structured extraction attempt {attempt + 1}/{max_retries}")
+            result = await structured_llm.ainvoke([
+                SystemMessage(content=system_msg),
+                HumanMessage(content=text)
+            ])
+            if isinstance(result, output_model):
+                logger.info("✓ Structured extraction successful")
+                return result
+            raise ValueError(f"Expected {output_model.__name__}, got {type(result)}")
+
+        except ValidationError as e:
+            last_error = e
+            logger.warning(f"Validation error on attempt {attempt + 1}: {e}")
+            system_msg += f"\n\nPrevious attempt had validation errors: {str(e)}"
+            system_msg += "\nPlease ensure all required fields are present and correctly formatted."
+
+        except Exception as e:
+            last_error = e
+            logger.warning(f"Extraction error on attempt {attempt + 1}: {e}")
+            if "token" in str(e).lower() and "limit" in str(e).lower():
+                logger.warning("Token limit detected, attempting compaction...")
+                text = await _acompact_text(llm, text, output_model)
+                continue
+            system_msg += f"\n\nPrevious attempt failed: {str(e)}"
+            system_msg += "\nPlease try again, ensuring proper formatting."
+
+    raise RuntimeError(
+        f"Failed to extract {output_model.__name__} after {max_retries} attempts. "
+        f"Last error: {last_error}"
+    )
+
+
+def _structured_system_message(output_model: Type[BaseModel], instruction: str = None) -> str:
+    """System message for structured extraction, listing the model's fields."""
+    system_msg = "Extract the requested information from the text."
+    if instruction:
+        system_msg += f" {instruction}"
+
+    # Get field descriptions from Pydantic model for context
+    field_descriptions = []
+    for field_name, field_info in output_model.model_fields.items():
+        if field_info.description:
+            field_descriptions.append(f"- {field_name}: {field_info.description}")
+
+    if field_descriptions:
+        system_msg += "\n\nExpected fields:\n" + "\n".join(field_descriptions)
+    return system_msg
+
+
 def extract_with_llm_fallback(
     llm: BaseChatModel,
     text: str,
@@ -162,7 +214,31 @@ def extract_with_llm_fallback(
     RuntimeError
         If extraction and parsing fails
     """
-    # Build extraction prompt
+    prompt = _fallback_prompt(text, output_model, instruction)
+    try:
+        response = llm.invoke([HumanMessage(content=prompt)])
+        return _validate_fallback_response(response.content, output_model)
+    except Exception as e:
+        raise RuntimeError(f"LLM fallback extraction failed: {e}")
+
+
+async def aextract_with_llm_fallback(
+    llm: BaseChatModel,
+    text: str,
+    output_model: Type[T],
+    instruction: str = None
+) -> T:
+    """Async version of `extract_with_llm_fallback`."""
+    prompt = _fallback_prompt(text, output_model, instruction)
+    try:
+        response = await llm.ainvoke([HumanMessage(content=prompt)])
+        return _validate_fallback_response(response.content, output_model)
+    except Exception as e:
+        raise RuntimeError(f"LLM fallback extraction failed: {e}")
+
+
+def _fallback_prompt(text: str, output_model: Type[BaseModel], instruction: str = None) -> str:
+    """Prompt asking the LLM to return the model's fields as JSON."""
     field_descriptions = []
     for field_name, field_info in output_model.model_fields.items():
         desc = field_info.description or field_name
@@ -181,21 +257,19 @@ Return ONLY the JSON object, no other text."""
 
     if instruction:
         prompt = f"{instruction}\n\n{prompt}"
+    return prompt
 
-    try:
-        response = llm.invoke([HumanMessage(content=prompt)])
-        json_text = response.content.strip()
 
-        # Remove markdown code blocks if present
-        if json_text.startswith("```"):
-            lines = json_text.split("\n")
-            json_text = "\n".join(lines[1:-1]) if len(lines) > 2 else json_text
+def _validate_fallback_response(content: str, output_model: Type[T]) -> T:
+    """Parse the JSON returned for `_fallback_prompt` into the model."""
+    json_text = content.strip()
 
-        # Parse JSON into Pydantic model
-        return output_model.model_validate_json(json_text)
+    # Remove markdown code blocks if present
+    if json_text.startswith("```"):
+        lines = json_text.split("\n")
+        json_text = "\n".join(lines[1:-1]) if len(lines) > 2 else json_text
 
-    except Exception as e:
-        raise RuntimeError(f"LLM fallback extraction failed: {e}")
+    return output_model.model_validate_json(json_text)
 
 
 def _compact_text(
@@ -234,9 +308,39 @@ def _compact_text(
     if target_length is None:
         target_length = len(text) // 2
 
-    # Build compaction prompt
+    try:
+        response = llm.invoke([HumanMessage(content=_compaction_prompt(text, target_model, target_length))])
+        return _compacted_or_truncated(text, response.content, target_length)
+
+    except Exception as e:
+        logger.error(f"Compaction failed: {e}, using truncation")
+        return text[:target_length]
+
+
+async def _acompact_text(
+    llm: BaseChatModel,
+    text: str,
+    target_model: Type[BaseModel],
+    target_length: int = None
+) -> str:
+    """Async version of `_compact_text`."""
+    if target_length is None:
+        target_length = len(text) // 2
+
+    try:
+        response = await llm.ainvoke(
+            [HumanMessage(content=_compaction_prompt(text, target_model, target_length))]
+        )
+        return _compacted_or_truncated(text, response.content, target_length)
+
+    except Exception as e:
+        logger.error(f"Compaction failed: {e}, using truncation")
+        return text[:target_length]
+
+
+def _compaction_prompt(text: str, target_model: Type[BaseModel], target_length: int) -> str:
     field_names = list(target_model.model_fields.keys())
-    prompt = f"""Compress the following text to approximately {target_length} characters while preserving all information needed to extract these fields: {', '.join(field_names)}.
+    return f"""Compress the following text to approximately {target_length} characters while preserving all information needed to extract these fields: {', '.join(field_names)}.
 
 Remove redundant information, verbose explanations, and examples, but keep all essential content.
 
@@ -245,22 +349,18 @@ Original text:
 
 Compressed version:"""
 
-    try:
-        response = llm.invoke([HumanMessage(content=prompt)])
-        compacted = response.content.strip()
-
-        logger.info(f"Compacted text from {len(text)} to {len(compacted)} chars")
 
-        if len(compacted) >= len(text):
-            logger.warning("Compaction did not reduce size, using truncation")
-            return text[:target_length]
+def _compacted_or_truncated(text: str, content: str, target_length: int) -> str:
+    compacted = content.strip()
 
-        return compacted
+    logger.info(f"Compacted text from {len(text)} to {len(compacted)} chars")
 
-    except Exception as e:
-        logger.error(f"Compaction failed: {e}, using truncation")
+    if len(compacted) >= len(text):
+        logger.warning("Compaction did not reduce size, using truncation")
         return text[:target_length]
 
+    return compacted
+
 
 def robust_parse_with_llm(
     llm: BaseChatModel,
@@ -329,3 +429,43 @@ def robust_parse_with_llm(
                 f"Structured output error: {e}. "
                 f"LLM extraction error: {e2}"
             )
+
+
+async def arobust_parse_with_llm(
+    llm: BaseChatModel,
+    text: str,
+    output_model: Type[T],
+    instruction: str = None,
+    fallback_to_llm_extraction: bool = True
+) -> T:
+    """
+    Async version of `robust_parse_with_llm`. Cancelling it cancels the
+    in-flight LLM call.
+    """
+    try:
+        return await aextract_with_structured_output(
+            llm=llm,
+            text=text,
+            output_model=output_model,
+            instruction=instruction
+        )
+    except Exception as e:
+        logger.warning(f"Structured output extraction failed: {e}")
+
+        if not fallback_to_llm_extraction:
+            raise
+
+        logger.info("Trying LLM-based extraction fallback...")
+        try:
+            return await aextract_with_llm_fallback(
+                llm=llm,
+                text=text,
+                output_model=output_model,
+                instruction=instruction
+            )
+        except Exception as e2:
+            raise RuntimeError(
+                f"All parsing strategies failed. "
+                f"Structured output error: {e}. "
+                f"LLM extraction error: {e2}"
+            )
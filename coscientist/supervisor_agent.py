@@ -12,10 +12,12 @@ More details:
 - Balances between generating new hypotheses, evolving existing ones,
   running tournaments, expanding literature review, or finishing
 - Considers quality metrics, diversity metrics, and research momentum
+- Optionally settles unambiguous states with fixed rules and only asks the
+  LLM when there is a real trade-off
 """
 
 import re
-from typing import TypedDict
+from typing import Literal, NotRequired, Optional, TypedDict
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langgraph.graph import END, StateGraph
@@ -48,9 +50,60 @@ class SupervisorDecisionState(TypedDict):
     literature_review_subtopics_completed: int
     action: str
     decision_reasoning: str
+    # Whether the action came from the fixed rules or from the LLM
+    decided_by: NotRequired[Literal["rules", "llm"]]
 
 
-def build_supervisor_agent(llm: BaseChatModel) -> StateGraph:
+# Actions after which new hypotheses wait to be ranked
+_GENERATING_ACTIONS = ("generate_new_hypotheses", "evolve_hypotheses")
+
+
+def rule_based_decision(state: SupervisorDecisionState) -> Optional[tuple[str, str]]:
+    """
+    Decide the next action without the LLM when only one action makes sense.
+
+    The rules follow the supervisor prompt's own guidance and never choose
+    between exploring and refining, or decide to finish:
+
+    - Hypotheses that were just generated or evolved and are unranked go
+      to the tournament.
+    - With every hypothesis ranked, a meta-review runs when 10 or more
+      hypotheses were ranked since the last one, or when 4 or more were and
+      the tournament just ran.
+
+    Parameters
+    ----------
+    state : SupervisorDecisionState
+        The supervisor state
+
+    Returns
+    -------
+    Optional[tuple[str, str]]
+        The action and its reasoning, or None if the LLM should decide
+    """
+    latest_actions = [a for a in state["latest_actions"].split(", ") if a]
+    latest_action = latest_actions[0] if latest_actions else None
+    unranked = state["num_unranked_hypotheses"]
+    newly_ranked = state["new_hypotheses_since_meta_review"]
+
+    if unranked > 0 and latest_action in _GENERATING_ACTIONS:
+        return "run_tournament", (
+            f"- {unranked} unranked hypotheses after {latest_action} must be "
+            "ranked before any other decision can use them"
+        )
+    if unranked == 0 and newly_ranked >= 10:
+        return "run_meta_review", (
+            f"- {newly_ranked} hypotheses ranked since the last meta-review (10 or more)"
+        )
+    if unranked == 0 and newly_ranked >= 4 and latest_action == "run_tournament":
+        return "run_meta_review", (
+            f"- The tournament just ranked {newly_ranked} new hypotheses since the "
+            "last meta-review (4 or more)"
+        )
+    return None
+
+
+def build_supervisor_agent(llm: BaseChatModel, fast_path: bool = False) -> StateGraph:
     """
     Builds and configures a LangGraph for supervisor decision-making.
 
@@ -58,6 +111,9 @@ def build_supervisor_agent(llm: BaseChatModel) -> StateGraph:
     ----------
     llm : BaseChatModel
         The language model to use for supervisor decisions.
+    fast_path : bool
+        If True, `rule_based_decision` settles unambiguous states and the
+        LLM is only called when the rules defer.
 
     Returns
     -------
@@ -70,9 +126,18 @@ def build_supervisor_agent(llm: BaseChatModel) -> StateGraph:
         "supervisor_decision",
         lambda state: _supervisor_decision_node(state, llm),
     )
-
     graph.add_edge("supervisor_decision", END)
-    graph.set_entry_point("supervisor_decision")
+
+    if not fast_path:
+        graph.set_entry_point("supervisor_decision")
+        return graph.compile()
+
+    graph.add_node("rule_based_decision", _rule_based_decision_node)
+    graph.add_conditional_edges(
+        "rule_based_decision",
+        lambda state: END if state.get("decided_by") == "rules" else "supervisor_decision",
+    )
+    graph.set_entry_point("rule_based_decision")
     return graph.compile()
 
 
@@ -111,6 +176,24 @@ def _parse_supervisor_response(response: str) -> tuple[str, str]:
     return action, decision_reasoning
 
 
+def _rule_based_decision_node(
+    state: SupervisorDecisionState,
+) -> SupervisorDecisionState:
+    """
+    Rule-based decision node; leaves the state unchanged if the rules defer.
+    """
+    decision = rule_based_decision(state)
+    if decision is None:
+        return state
+    action, reasoning = decision
+    return {
+        **state,
+        "action": action,
+        "decision_reasoning": f"Rule-based decision:\n{reasoning}",
+        "decided_by": "rules",
+    }
+
+
 def _supervisor_decision_node(
     state: SupervisorDecisionState,
     llm: BaseChatModel,
@@ -154,4 +237,9 @@ def _supervisor_decision_node(
         }
     )
     action, decision_reasoning = _parse_supervisor_response(response_content)
-    return {**state, "action": action, "decision_reasoning": decision_reasoning}
+    return {
+        **state,
+        "action": action,
+        "decision_reasoning": decision_reasoning,
+        "decided_by": "llm",
+    }
@@ -0,0 +1,69 @@
+"""
+Shared fixtures: hypotheses, and a framework for a fresh goal in a temporary
+output directory.
+"""
+
+import numpy as np
+import pytest
+
+from coscientist import global_state, proximity_agent
+from coscientist.custom_types import ParsedHypothesis
+from coscientist.global_state import CoscientistState, CoscientistStateManager
+
+
+class _RandomEmbeddings:
+    def embed_documents(self, texts):
+        return [np.random.rand(8).tolist() for _ in texts]
+
+    def embed_query(self, text):
+        return np.random.rand(8).tolist()
+
+
+@pytest.fixture
+def make_hypothesis():
+    """Build a ParsedHypothesis; the text defaults to one derived from the uid."""
+
+    def make(uid: str, text: str | None = None, parent_uid: str | None = None):
+        return ParsedHypothesis(
+            uid=uid,
+            hypothesis=text or f"Hypothesis {uid} explains the observed phenomenon.",
+            predictions=["A measurable outcome changes"],
+            assumptions=["The mechanism is active in vivo"],
+            parent_uid=parent_uid,
+        )
+
+    return make
+
+
+@pytest.fixture
+def state_manager(tmp_path, monkeypatch) -> CoscientistStateManager:
+    """State manager for a fresh goal whose output directory is under tmp_path."""
+    monkeypatch.setattr(global_state, "_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        proximity_agent, "create_embedding", lambda text: np.random.rand(8).tolist()
+    )
+    return CoscientistStateManager(CoscientistState("goal"))
+
+
+@pytest.fixture
+def make_framework(state_manager, monkeypatch):
+    """
+    Build a CoscientistFramework on `state_manager` from CoscientistConfig
+    overrides, without the API calls of configuration validation.
+    """
+    # Imported here: the framework needs researcher_config.json and LLM clients
+    from coscientist.framework import CoscientistConfig, CoscientistFramework
+
+    monkeypatch.setattr(
+        CoscientistFramework, "_validate_configuration", lambda self: None
+    )
+
+    def make(**config_overrides):
+        config_overrides.setdefault(
+            "proximity_agent_embedding_model", _RandomEmbeddings()
+        )
+        return CoscientistFramework(
+            CoscientistConfig(**config_overrides), state_manager
+        )
+
+    return make
@@ -0,0 +1,48 @@
+"""
+Tests for the shared background-task poller. Responses are faked, so no API
+calls are made.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from coscientist.research_backend import BackgroundTaskPoller
+
+MIN_INTERVAL = 0.01
+
+
+def _fake_retrieve(durations: dict[str, float], calls: list[str]):
+    started = time.time()
+
+    async def retrieve(response_id: str):
+        calls.append(response_id)
+        done = time.time() - started >= durations[response_id]
+        return SimpleNamespace(status="completed" if done else "in_progress")
+
+    return retrieve
+
+
+def test_poller_resolves_each_task_with_backoff():
+    durations = {"resp_short": 0.05, "resp_long": 0.6}
+    calls: list[str] = []
+
+    async def run():
+        poller = BackgroundTaskPoller(
+            _fake_retrieve(durations, calls),
+            min_interval=MIN_INTERVAL,
+            max_interval=0.2,
+            backoff=0.5,
+        )
+        futures = [poller.track(rid) for rid in durations]
+        assert poller.track("resp_long") is futures[1]
+        responses = await asyncio.gather(*futures)
+        return poller, responses
+
+    poller, responses = asyncio.run(run())
+
+    assert [r.status for r in responses] == ["completed", "completed"]
+    assert poller.polls == {rid: calls.count(rid) for rid in durations}
+    # A fixed MIN_INTERVAL poll would retrieve the long task ~60 times
+    fixed_interval_polls = durations["resp_long"] / MIN_INTERVAL
+    assert poller.polls["resp_long"] <= fixed_interval_polls / 2
@@ -0,0 +1,60 @@
+"""
+Tests for batch generation: several hypotheses from one structured LLM call.
+"""
+
+import asyncio
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from coscientist.agent_state_tracker import AgentStateTracker
+from coscientist.custom_types import ParsedHypothesis
+from coscientist.generation_agent import BatchConfig, build_generation_agent
+from coscientist.reasoning_types import ReasoningType
+
+
+class _StructuredLLM(GenericFakeChatModel):
+    def with_structured_output(self, schema, **kwargs):
+        def to_batch(message):
+            return schema(
+                hypotheses=[
+                    ParsedHypothesis(
+                        uid="llm-made-up-uid",
+                        hypothesis=f"Kinase mechanism number {i} drives resistance",
+                        predictions=["prediction"],
+                        assumptions=["assumption"],
+                    )
+                    for i in range(4)
+                ]
+            )
+
+        return self | RunnableLambda(to_batch)
+
+
+def test_one_call_returns_distinct_hypotheses_and_counts_tokens(tmp_path):
+    usage = {"input_tokens": 1000, "output_tokens": 300, "total_tokens": 1300}
+    llm = _StructuredLLM(messages=iter([AIMessage(content="batch", usage_metadata=usage)]))
+    agent = build_generation_agent(
+        "batch",
+        BatchConfig(
+            field="biology",
+            reasoning_type=list(ReasoningType)[0],
+            llm=llm,
+            n_hypotheses=3,
+        ),
+    )
+    tracker = AgentStateTracker(str(tmp_path), "generation_batch")
+
+    state = asyncio.run(
+        agent.ainvoke(
+            {"goal": "goal", "literature_review": "review"},
+            config={"callbacks": [tracker]},
+        )
+    )
+
+    hypotheses = state["hypotheses"]
+    assert len(hypotheses) == 3
+    assert len({h.uid for h in hypotheses}) == 3
+    assert "llm-made-up-uid" not in {h.uid for h in hypotheses}
+    assert (tracker.llm_calls, tracker.input_tokens, tracker.output_tokens) == (1, 1000, 300)
@@ -0,0 +1,58 @@
+"""
+Tests for map-reduce debate summaries with a content-hash cache.
+"""
+
+import asyncio
+
+from langchain_core.messages import AIMessage
+
+from coscientist.debate_summaries import DebateSummarizer, chunk_by_tokens
+from coscientist.report_digests import estimate_tokens
+
+
+class _ConcurrencyLLM:
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return AIMessage(content=f"summary {self.calls} " + "s" * 80)
+
+
+DEBATES = [f"Debate {i}: " + "d" * 396 for i in range(8)]  # 100 tokens each
+
+
+def test_chunks_keep_order_and_budget():
+    chunks = chunk_by_tokens(DEBATES, 250)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 2, 2]
+    assert sum(chunks, []) == DEBATES
+    assert chunk_by_tokens(["x" * 4000], 250) == [["x" * 4000]]
+
+
+def test_debates_are_summarised_concurrently_and_cached(tmp_path):
+    llm = _ConcurrencyLLM()
+    summarizer = DebateSummarizer(str(tmp_path), llm, token_budget=60, chunk_tokens=250)
+
+    summary = asyncio.run(summarizer.asummarize(DEBATES))
+    assert llm.max_in_flight == 4  # the four chunks are summarised at once
+    assert estimate_tokens(summary) <= 60
+    first_calls = llm.calls
+
+    # One more debate only adds the summaries that depend on it
+    summarizer = DebateSummarizer(str(tmp_path), llm, token_budget=60, chunk_tokens=250)
+    asyncio.run(summarizer.asummarize(DEBATES + ["Debate 8: " + "d" * 396]))
+    assert summarizer.cache_hits >= 4
+    assert llm.calls - first_calls < first_calls
+
+
+def test_debates_within_budget_are_kept(tmp_path):
+    llm = _ConcurrencyLLM()
+    summarizer = DebateSummarizer(str(tmp_path), llm, token_budget=10000)
+    assert asyncio.run(summarizer.asummarize(DEBATES[:2])) == "\n\n".join(DEBATES[:2])
+    assert llm.calls == 0
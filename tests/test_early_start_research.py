@@ -0,0 +1,131 @@
+"""
+Tests for early-start literature research: generation is signalled once
+enough reports are in, and stragglers are folded into the next expansion.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from coscientist.literature_review_agent import _research_with_early_start
+
+SUBTOPICS = ["fast", "medium", "slow"]
+LATENCY = {"fast": 0.01, "medium": 0.02, "slow": 0.5}
+
+
+async def _report(subtopic):
+    await asyncio.sleep(LATENCY[subtopic])
+    return f"report on {subtopic}"
+
+
+def _framework(straggler_timeout=60.0):
+    published = []
+    return SimpleNamespace(
+        config=SimpleNamespace(
+            early_start_min_reports=2,
+            straggler_deadline=0.05,
+            straggler_timeout=straggler_timeout,
+        ),
+        state_manager=SimpleNamespace(publish_partial_literature_review=published.append),
+        straggler_research={},
+        literature_review_ready=None,
+        published=published,
+    )
+
+
+def test_stragglers_are_deferred_then_collected_without_new_research():
+    framework = _framework()
+    state = {"goal": "g", "subtopics": SUBTOPICS, "subtopic_reports": ["", "", ""]}
+
+    async def run():
+        framework.literature_review_ready = asyncio.Event()
+        first = await _research_with_early_start(
+            [_report(s) for s in SUBTOPICS], [0, 1, 2], state, framework
+        )
+        assert framework.literature_review_ready.is_set()
+
+        # The next expansion collects the straggler instead of starting it again
+        second = await _research_with_early_start(
+            [_report("fast")], [2], {**state, "subtopic_reports": first[:2] + [""]}, framework
+        )
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == ["report on fast", "report on medium", ""]
+    assert framework.published[0]["subtopic_reports"][0] == "report on fast"
+    assert second == ["report on slow"]
+    assert framework.straggler_research == {}
+
+
+def test_stragglers_past_the_timeout_are_cancelled_and_researched_again():
+    framework = _framework(straggler_timeout=0.05)
+    state = {"goal": "g", "subtopics": SUBTOPICS, "subtopic_reports": ["", "", ""]}
+
+    async def run():
+        first = await _research_with_early_start(
+            [_report(s) for s in SUBTOPICS], [0, 1, 2], state, framework
+        )
+        straggler = framework.straggler_research["slow"]
+        await asyncio.sleep(0.1)
+        assert straggler.cancelled()  # Its research slot is released
+
+        second = await _research_with_early_start(
+            [_report("fast")], [2], {**state, "subtopic_reports": first[:2] + [""]}, framework
+        )
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first[2] == ""
+    assert second == ["report on fast"]  # Researched again, not collected
+
+
+def test_failed_reports_do_not_count_toward_the_early_start():
+    framework = _framework()
+    state = {"goal": "g", "subtopics": SUBTOPICS, "subtopic_reports": ["", "", ""]}
+
+    async def failed(subtopic):
+        await asyncio.sleep(LATENCY[subtopic])
+        return ""  # _write_subtopic_report's placeholder for failed research
+
+    async def run():
+        framework.literature_review_ready = asyncio.Event()
+        reports = await _research_with_early_start(
+            [failed("fast"), failed("medium"), _report("slow")], [0, 1, 2], state, framework
+        )
+        return reports, framework.literature_review_ready.is_set()
+
+    reports, ready = asyncio.run(run())
+
+    # Only one usable report: no early start, so the slow subtopic is awaited
+    assert reports == ["", "", "report on slow"]
+    assert not ready
+
+
+def test_failed_generation_cancels_the_early_started_review(make_framework, monkeypatch):
+    framework = make_framework(early_start_min_reports=1)
+    review = {}
+
+    async def literature_review(max_subtopics):
+        framework.literature_review_ready.set()
+        try:
+            await asyncio.sleep(60)  # Stragglers still running
+        except asyncio.CancelledError:
+            review["cancelled"] = True
+            raise
+
+    async def generate(**kwargs):
+        raise RuntimeError("generation failed")
+
+    monkeypatch.setattr(framework, "_run_initial_literature_review", literature_review)
+    monkeypatch.setattr(framework, "generate_new_hypotheses", generate)
+
+    async def run():
+        with pytest.raises(RuntimeError, match="generation failed"):
+            await framework.start(n_hypotheses=2)
+        # Cancelled and awaited by start, not left to the loop's shutdown
+        return dict(review)
+
+    assert asyncio.run(run()) == {"cancelled": True}
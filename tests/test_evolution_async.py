@@ -0,0 +1,105 @@
+"""
+Tests that evolution agents can run concurrently with ainvoke.
+"""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from coscientist.custom_types import ReviewedHypothesis
+from coscientist.evolution_agent import build_evolution_agent
+
+REPORT = """#FINAL REPORT#
+# Hypothesis
+Refined hypothesis: kinase signalling drives tumour resistance.
+
+# Falsifiable Predictions
+1. Kinase inhibition restores sensitivity in resistant tumours.
+
+# Assumptions
+1. Resistant tumours depend on kinase signalling.
+"""
+
+LATENCY = 0.3
+
+
+class _SlowLLM(GenericFakeChatModel):
+    async def ainvoke(self, input, config=None, **kwargs):
+        await asyncio.sleep(LATENCY)
+        return AIMessage(content=REPORT)
+
+
+def _parent(i):
+    return ReviewedHypothesis(
+        hypothesis=f"Parent hypothesis number {i} about kinases",
+        predictions=["prediction"],
+        assumptions=["assumption"],
+        causal_reasoning="reasoning",
+        assumption_research_results={},
+        verification_result="review",
+    )
+
+
+def test_evolutions_run_concurrently():
+    llm = _SlowLLM(messages=iter([]))
+    parents = [_parent(i) for i in range(3)]
+    feedback_agent = build_evolution_agent("evolve_from_feedback", llm)
+    out_of_the_box_agent = build_evolution_agent("out_of_the_box", llm)
+
+    async def run():
+        return await asyncio.gather(
+            *[
+                feedback_agent.ainvoke(
+                    {"goal": "goal", "parent_hypothesis": parent, "meta_review": "meta"}
+                )
+                for parent in parents
+            ],
+            out_of_the_box_agent.ainvoke(
+                {"goal": "goal", "top_hypotheses": parents, "elo_ratings": [1250, 1230, 1210]}
+            ),
+        )
+
+    started_at = time.monotonic()
+    states = asyncio.run(run())
+
+    assert time.monotonic() - started_at < 2 * LATENCY
+    assert [s["evolved_hypothesis"].parent_uid for s in states[:3]] == [p.uid for p in parents]
+    assert states[3]["evolved_hypothesis"].hypothesis.startswith("Refined hypothesis")
+
+
+class _SlowParser:
+    def __init__(self):
+        self.cancelled = 0
+
+    async def ainvoke(self, messages):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+class _UnstructuredLLM:
+    """Answers without structure, so parsing falls back to a slow LLM call."""
+
+    def __init__(self):
+        self.parser = _SlowParser()
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        return AIMessage(content="Kinases probably matter for resistance, somehow.")
+
+    def with_structured_output(self, model):
+        return self.parser
+
+
+def test_cancelling_an_evolution_cancels_its_llm_parse():
+    llm = _UnstructuredLLM()
+    agent = build_evolution_agent("out_of_the_box", llm)
+    state = {"goal": "goal", "top_hypotheses": [_parent(0)], "elo_ratings": [1200]}
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(agent.ainvoke(state), 0.2))
+    assert llm.parser.cancelled == 1
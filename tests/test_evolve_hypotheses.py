@@ -0,0 +1,104 @@
+"""
+Tests for running evolutions concurrently from the framework.
+"""
+
+import asyncio
+from collections import Counter
+
+import numpy as np
+
+from coscientist import framework as framework_module
+from coscientist.custom_types import ReviewedHypothesis
+
+RATINGS = {"a": 1300.0, "b": 1250.0, "c": 1200.0, "d": 1150.0, "e": 1100.0}
+
+
+class _EvolutionAgent:
+    """Finishes later parents first; fails for parent "b"."""
+
+    def __init__(self, mode: str, counters: Counter, make_hypothesis):
+        self.mode = mode
+        self.counters = counters
+        self.make_hypothesis = make_hypothesis
+
+    async def ainvoke(self, state, config=None):
+        self.counters["in_flight"] += 1
+        self.counters["max_in_flight"] = max(
+            self.counters["max_in_flight"], self.counters["in_flight"]
+        )
+        try:
+            if self.mode == "out_of_the_box":
+                await asyncio.sleep(0.01)
+                return {"evolved_hypothesis": self.make_hypothesis("oob")}
+            parent = state["parent_hypothesis"].uid
+            await asyncio.sleep(0.05 - 0.01 * "abcde".index(parent))
+            if parent == "b":
+                raise RuntimeError("evolution failed")
+            return {
+                "evolved_hypothesis": self.make_hypothesis(
+                    f"{parent}2", parent_uid=parent
+                )
+            }
+        finally:
+            self.counters["in_flight"] -= 1
+
+
+def _framework(make_framework, make_hypothesis, monkeypatch, counters: Counter):
+    monkeypatch.setattr(
+        framework_module,
+        "build_evolution_agent",
+        lambda mode, llm: _EvolutionAgent(mode, counters, make_hypothesis),
+    )
+    # Pick the first of the remaining hypotheses instead of random ones
+    monkeypatch.setattr(
+        framework_module.np.random,
+        "choice",
+        lambda a, size, replace: np.array(a[:size]),
+    )
+
+    framework = make_framework(
+        generation_concurrency=2, evolution_agent_llms={"fake": None}
+    )
+    state_manager = framework.state_manager
+    tournament = state_manager._state.tournament
+    for uid, rating in RATINGS.items():
+        hypothesis = ReviewedHypothesis(
+            **make_hypothesis(uid).model_dump(),
+            causal_reasoning="reasoning",
+            assumption_research_results={},
+            verification_result="review",
+        )
+        state_manager._state.proximity_graph.add_hypothesis(
+            hypothesis, embedding=np.random.rand(8).tolist()
+        )
+        tournament.add_hypothesis(hypothesis, initial_rating=rating)
+    for uid in "bcde":
+        tournament.record_match("a", uid, 1, "debate")
+    tournament.ratings.update(RATINGS)
+    state_manager._state.meta_reviews.append({"result": "meta-review"})
+    return framework
+
+
+def test_one_failed_evolution_keeps_the_others_in_selection_order(
+    make_framework, make_hypothesis, monkeypatch
+):
+    counters = Counter()
+    framework = _framework(make_framework, make_hypothesis, monkeypatch, counters)
+
+    reflected = []
+
+    def reflect(initial_state):
+        reflected.append(initial_state["hypothesis_to_review"].uid)
+        return {**initial_state, "passed_initial_filter": False}
+
+    monkeypatch.setattr(framework, "_reflect", reflect)
+    asyncio.run(framework.evolve_hypotheses(n_hypotheses=4))
+
+    # Selection order is the top two (a, b), then c and d; b's evolution
+    # failed and out-of-the-box comes last
+    assert reflected == ["a2", "c2", "d2", "oob"]
+    assert counters["max_in_flight"] == 2
+    failures = framework.state_manager._state.generation_failures
+    assert [(f["mode"], f["error"]) for f in failures] == [
+        ("evolve_from_feedback", "RuntimeError: evolution failed")
+    ]
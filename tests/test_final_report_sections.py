@@ -0,0 +1,80 @@
+"""
+Tests for drafting final report sections concurrently and assembling them.
+"""
+
+import asyncio
+
+from langchain_core.messages import AIMessage
+
+from coscientist.custom_types import ReviewedHypothesis
+from coscientist.final_report_agent import SECTIONS_MARKER, build_final_report_agent
+from coscientist.ranking_agent import EloTournament
+
+
+class _SectionLLM:
+    def __init__(self, assembly: str):
+        self.assembly = assembly
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.assembly_prompt = None
+
+    async def ainvoke(self, prompt, config=None, **kwargs):
+        if "Complete a research overview" in prompt:
+            self.assembly_prompt = prompt
+            return AIMessage(content=self.assembly)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        rank = prompt.split("# Hypothesis ranked ")[1].split("\n")[0]
+        return AIMessage(content=f"#### Hypothesis {rank}: section")
+
+
+def _tournament() -> EloTournament:
+    tournament = EloTournament(goal="goal")
+    for uid, rating in [("a", 1300.0), ("b", 1250.0), ("c", 1200.0), ("d", 1100.0)]:
+        tournament.add_hypothesis(
+            ReviewedHypothesis(
+                uid=uid,
+                hypothesis=f"Hypothesis {uid} explains the observed phenomenon.",
+                predictions=["A measurable outcome changes"],
+                assumptions=["The mechanism is active in vivo"],
+                causal_reasoning="reasoning",
+                assumption_research_results={},
+                verification_result="review",
+            ),
+            initial_rating=rating,
+        )
+    return tournament
+
+
+def _run(llm) -> dict:
+    agent = build_final_report_agent(llm, parallel_sections=True)
+    return asyncio.run(agent.ainvoke({"goal": "goal", "tournament": _tournament(), "top_k": 3}))
+
+
+def test_sections_are_drafted_concurrently_and_placed_at_the_marker():
+    llm = _SectionLLM(f"### 1. Summary\n\n{SECTIONS_MARKER}\n\n### 4. Conclusions")
+    state = _run(llm)
+
+    assert llm.max_in_flight == 3
+    assert "#### Hypothesis 3: section" in llm.assembly_prompt
+    report = state["result"]
+    assert SECTIONS_MARKER not in report
+    positions = [
+        report.index(text)
+        for text in [
+            "### 1. Summary",
+            "#### Hypothesis 1",
+            "#### Hypothesis 2",
+            "#### Hypothesis 3",
+            "### 4. Conclusions",
+        ]
+    ]
+    assert positions == sorted(positions)
+
+
+def test_sections_are_appended_without_the_marker():
+    state = _run(_SectionLLM("### 1. Summary"))
+    assert state["result"].startswith("### 1. Summary")
+    assert state["result"].endswith("#### Hypothesis 3: section")
@@ -0,0 +1,47 @@
+"""
+Tests that async hypothesis generation runs concurrently and that a timeout
+cancels the in-flight LLM call instead of leaving it running.
+"""
+
+import asyncio
+import time
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from coscientist.generation_agent import IndependentConfig, build_generation_agent
+from coscientist.reasoning_types import ReasoningType
+
+
+class _SlowLLM(GenericFakeChatModel):
+    cancelled: int = 0
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return AIMessage(content="too late")
+
+
+def test_timeout_cancels_concurrent_generations():
+    llm = _SlowLLM(messages=iter([]))
+    agent = build_generation_agent(
+        "independent",
+        IndependentConfig(field="biology", reasoning_type=list(ReasoningType)[0], llm=llm),
+    )
+    initial_state = {"goal": "goal", "literature_review": "review"}
+
+    async def run():
+        return await asyncio.gather(
+            *[asyncio.wait_for(agent.ainvoke(initial_state), 0.2) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+    started_at = time.monotonic()
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+    assert time.monotonic() - started_at < 1
+    assert llm.cancelled == 3
@@ -0,0 +1,84 @@
+"""
+Tests for hedged research, where a second backend races slow primary calls.
+Both backends are in-process fakes.
+"""
+
+import asyncio
+
+from coscientist.research_backend import HybridResearchProvider
+from coscientist.research_scheduler import ResearchScheduler
+
+
+class _FakeBackend:
+    def __init__(self, name: str, latency: float):
+        self.name = name
+        self.latency = latency
+        self.cancelled = 0
+
+    def supports_background_mode(self) -> bool:
+        return False
+
+    async def conduct_research(self, query: str, task_id: str) -> str:
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"{self.name}: {query}"
+
+
+def _hedged_provider(tmp_path, primary_latency: float, delay) -> HybridResearchProvider:
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    (corpus_dir / "note.md").write_text("placeholder")
+    provider = HybridResearchProvider(
+        {
+            "RESEARCH_BACKEND": "local_corpus",
+            "LOCAL_CORPUS_DIR": str(corpus_dir),
+            "RESEARCH_HEDGE_ENABLED": True,
+            "RESEARCH_HEDGE_BACKEND": "local_corpus",
+            "RESEARCH_HEDGE_DELAY": delay,
+            "RESEARCH_HEDGE_INITIAL_DELAY": 0.05,
+            "RESEARCH_HEDGE_MIN_SAMPLES": 3,
+        },
+        str(tmp_path),
+    )
+    provider.primary = _FakeBackend("primary", primary_latency)
+    provider.hedge = _FakeBackend("hedge", 0.01)
+    return provider
+
+
+def test_hedge_wins_against_slow_primary_and_cancels_it(tmp_path):
+    provider = _hedged_provider(tmp_path, primary_latency=5.0, delay=0.05)
+
+    report = asyncio.run(provider.research("query", "task"))
+
+    assert report == "hedge: query"
+    assert provider.primary.cancelled == 1
+    assert provider.hedge_wins == {"hedge": 1}
+
+
+def test_fast_primary_is_not_hedged_and_sets_p95_delay(tmp_path):
+    provider = _hedged_provider(tmp_path, primary_latency=0.01, delay="p95")
+
+    async def run():
+        return [await provider.research("query", f"task_{i}") for i in range(3)]
+
+    assert asyncio.run(run()) == ["primary: query"] * 3
+    assert provider.hedge_wins == {"unhedged": 3}
+    assert provider.hedge_delay() < 0.05
+
+
+def test_queued_calls_are_not_hedged_or_timed_out(tmp_path):
+    provider = _hedged_provider(tmp_path, primary_latency=0.1, delay=0.15)
+    provider.scheduler = ResearchScheduler({"local_corpus": {"max_concurrency": 1}})
+
+    async def run():
+        # The second call waits 0.1s for the slot, then runs for 0.1s
+        return await asyncio.gather(
+            *[provider.research("query", f"task_{i}", timeout=0.15) for i in range(2)]
+        )
+
+    assert asyncio.run(run()) == ["primary: query"] * 2
+    assert provider.hedge_wins == {"unhedged": 2}
+    assert max(provider._primary_latencies) < 0.15
@@ -0,0 +1,110 @@
+"""
+Tests for the streaming generate -> reflect -> rank hypothesis pipeline.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+from langchain_core.messages import AIMessage
+
+from coscientist.custom_types import ReviewedHypothesis
+
+QUEUE_SIZE = 1
+
+
+class _GenerationAgent:
+    def __init__(self, make_hypothesis):
+        self.make_hypothesis = make_hypothesis
+        self.count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, state, config=None):
+        self.count += 1
+        uid = f"new-{self.count}"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        return {"hypothesis": self.make_hypothesis(uid)}
+
+
+class _JudgeLLM:
+    def invoke(self, prompt):
+        return AIMessage(content="WINNER: 1")
+
+
+def test_pipeline_reflects_each_hypothesis_it_generates(
+    make_framework, make_hypothesis, monkeypatch
+):
+    framework = make_framework(
+        pipeline_queue_size=QUEUE_SIZE,
+        generation_concurrency=2,
+        meta_review_agent_llm=_JudgeLLM(),
+    )
+    state_manager = framework.state_manager
+
+    # One reflection interrupted by a crash, and one hypothesis queued earlier
+    for uid in ["crashed", "queued"]:
+        state_manager.add_generated_hypothesis(make_hypothesis(uid))
+        state_manager.advance_hypothesis(
+            kind="generated", embedding=np.random.rand(8).tolist()
+        )
+    state_manager.next_reflection_state()
+
+    agent = _GenerationAgent(make_hypothesis)
+    monkeypatch.setattr(
+        framework, "_plan_generations", lambda n: [("independent", 1)] * n
+    )
+    monkeypatch.setattr(
+        framework, "_setup_generation", lambda mode, n: (mode, agent, {})
+    )
+
+    added = []
+    add_generated_hypothesis = state_manager.add_generated_hypothesis
+    monkeypatch.setattr(
+        state_manager,
+        "add_generated_hypothesis",
+        lambda hypothesis: added.append(hypothesis.uid)
+        or add_generated_hypothesis(hypothesis),
+    )
+
+    reflected = []
+    ahead_of_reflection = []
+
+    def reflect(initial_state):
+        hypothesis = initial_state["hypothesis_to_review"]
+        reflected.append(hypothesis.uid)
+        ahead_of_reflection.append(
+            len(added) - sum(uid.startswith("new-") for uid in reflected)
+        )
+        time.sleep(0.05)
+        reviewed = ReviewedHypothesis(
+            **hypothesis.model_dump(),
+            causal_reasoning="reasoning",
+            assumption_research_results={},
+            verification_result="review",
+        )
+        return {
+            "hypothesis_to_review": hypothesis,
+            "passed_initial_filter": True,
+            "reviewed_hypothesis": reviewed,
+        }
+
+    monkeypatch.setattr(framework, "_reflect", reflect)
+    asyncio.run(framework._run_hypothesis_pipeline(4))
+
+    # The interrupted reflection resumes first, each new hypothesis is
+    # reflected as it arrives, and the earlier queue is drained at the end
+    assert reflected[0] == "crashed" and reflected[-1] == "queued"
+    assert sorted(reflected[1:-1]) == ["new-1", "new-2", "new-3", "new-4"]
+    assert agent.max_in_flight == 2
+    # New hypotheses are added at most one queue slot and one blocked put
+    # ahead of reflection
+    assert max(ahead_of_reflection) <= QUEUE_SIZE + 1
+    assert state_manager.reflection_queue_is_empty
+    assert state_manager.in_flight_reflections == []
+    assert sorted(framework.state_manager._state.tournament.hypotheses) == sorted(
+        reflected
+    )
@@ -0,0 +1,64 @@
+"""
+Tests for incremental meta-reviews that only read matches played since the
+previous meta-review.
+"""
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from coscientist.custom_types import ReviewedHypothesis
+from coscientist.meta_review_agent import build_meta_review_agent
+from coscientist.ranking_agent import EloTournament
+
+
+class _RecordingLLM(GenericFakeChatModel):
+    prompts: list = []
+
+    def invoke(self, input, config=None, **kwargs):
+        self.prompts.append(input)
+        return AIMessage(content=f"meta-review {len(self.prompts)}")
+
+
+def _reviewed(uid: str) -> ReviewedHypothesis:
+    return ReviewedHypothesis(
+        uid=uid,
+        hypothesis=f"Hypothesis {uid} explains the observed phenomenon.",
+        predictions=["A measurable outcome changes"],
+        assumptions=["The mechanism is active in vivo"],
+        causal_reasoning="reasoning",
+        assumption_research_results={},
+        verification_result="review",
+    )
+
+
+def test_only_new_matches_are_reviewed():
+    tournament = EloTournament(goal="goal")
+    for uid in ["a", "b", "c"]:
+        tournament.add_hypothesis(_reviewed(uid))
+    tournament.record_match("a", "b", winner=1, debate="first debate")
+
+    llm = _RecordingLLM(messages=iter([]), prompts=[])
+    agent = build_meta_review_agent(llm, incremental=True)
+    first = agent.invoke({"goal": "goal", "tournament": tournament, "top_k": 1})
+    assert first["match_watermark"] == 1
+    assert "first debate" in llm.prompts[0]
+
+    tournament.record_match("b", "c", winner=2, debate="second debate")
+    second = agent.invoke(
+        {
+            "goal": "goal",
+            "tournament": tournament,
+            "top_k": 1,
+            "previous_review": first["result"],
+            "match_watermark": first["match_watermark"],
+        }
+    )
+    assert second["match_watermark"] == 2
+    assert "second debate" in llm.prompts[1]
+    assert "first debate" not in llm.prompts[1]
+    assert "meta-review 1" in llm.prompts[1]
+
+    # Without new matches the previous meta-review is kept and no call is made
+    third = agent.invoke({**second, "previous_review": second["result"]})
+    assert third["result"] == "meta-review 2"
+    assert len(llm.prompts) == 2
@@ -0,0 +1,49 @@
+"""
+Tests for the lineage index and the evolution memo in the state manager.
+"""
+
+
+def test_children_and_ancestors(state_manager, make_hypothesis):
+    manager = state_manager
+    manager.add_evolved_hypothesis(
+        make_hypothesis("b", "Evolved child hypothesis", parent_uid="a")
+    )
+    manager.add_evolved_hypothesis(
+        make_hypothesis("c", "Evolved grandchild hypothesis", parent_uid="b")
+    )
+    manager.add_evolved_hypothesis(
+        make_hypothesis("d", "Second evolved child hypothesis", parent_uid="a")
+    )
+
+    assert manager.children_of("a") == ["b", "d"]
+    assert manager.ancestors_of("c") == ["b", "a"]
+    assert manager.ancestors_of("a") == []
+
+
+def test_evolution_memo_depends_on_content_and_meta_review(
+    state_manager, make_hypothesis
+):
+    manager = state_manager
+    parent = make_hypothesis("a", "Kinase activity drives resistance")
+    key = manager.evolution_key("evolve_from_feedback", [parent])
+    manager.add_evolved_hypothesis(
+        make_hypothesis("b", "Evolved child hypothesis", parent_uid="a"), key
+    )
+
+    assert manager.evolution_was_tried(key)
+    # Same content under a different uid is still the same evolution
+    assert (
+        manager.evolution_key(
+            "evolve_from_feedback", [make_hypothesis("z", parent.hypothesis)]
+        )
+        == key
+    )
+    assert not manager.evolution_was_tried(
+        manager.evolution_key("out_of_the_box", [parent])
+    )
+
+    # A new meta-review makes the parent worth evolving again
+    manager._state.meta_reviews.append({"result": "Focus on in vivo evidence"})
+    assert not manager.evolution_was_tried(
+        manager.evolution_key("evolve_from_feedback", [parent])
+    )
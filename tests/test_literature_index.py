@@ -0,0 +1,56 @@
+"""
+Tests for the per-run literature passage index.
+"""
+
+from langchain_core.embeddings import Embeddings
+
+from coscientist.literature_index import LiteratureIndex
+
+VOCABULARY = ["kinase", "tumour", "microbiome", "immune", "crispr", "exhaustion"]
+
+
+class _BagOfWordsEmbeddings(Embeddings):
+    def __init__(self):
+        self.embedded_documents = 0
+
+    def _embed(self, text):
+        words = text.lower().split()
+        return [float(words.count(term)) + 0.01 for term in VOCABULARY]
+
+    def embed_documents(self, texts):
+        self.embedded_documents += len(texts)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+REPORTS = [
+    "kinase inhibitors shrink tumour xenografts\n\nkinase resistance emerges quickly",
+    "microbiome diversity shapes immune tone",
+    "crispr screens reveal exhaustion regulators",
+]
+
+
+def test_retrieves_relevant_passages_within_budget(tmp_path):
+    index = LiteratureIndex(str(tmp_path), _BagOfWordsEmbeddings(), passage_words=5)
+    assert index.add_reports(REPORTS) == 4
+
+    context = index.context_for("kinase tumour", token_budget=100, top_k=2)
+    assert context == (
+        "kinase inhibitors shrink tumour xenografts\n\nkinase resistance emerges quickly"
+    )
+    assert index.context_for("kinase tumour", token_budget=12, top_k=2) == (
+        "kinase inhibitors shrink tumour xenografts"
+    )
+
+
+def test_reports_are_embedded_once_and_index_persists(tmp_path):
+    embeddings = _BagOfWordsEmbeddings()
+    LiteratureIndex(str(tmp_path), embeddings).add_reports(REPORTS[:2])
+
+    # After a restart only the new report is embedded
+    index = LiteratureIndex(str(tmp_path), embeddings)
+    index.add_reports(REPORTS)
+    assert embeddings.embedded_documents == 3
+    assert "crispr" in index.context_for("crispr exhaustion", token_budget=100, top_k=1)
@@ -0,0 +1,68 @@
+"""
+Tests for the offline local-corpus research backend.
+"""
+
+import asyncio
+import time
+
+from coscientist.local_corpus import LocalCorpusIndex
+from coscientist.research_backend import create_research_provider
+
+DOCUMENTS = {
+    "kinase.md": "Kinase inhibitors block tumour growth by suppressing MAPK signalling.",
+    "microbiome.txt": "Gut microbiome diversity modulates immune responses in mice.",
+    "notes/crispr.md": "CRISPR screens identify genes required for T cell exhaustion.",
+}
+
+
+def _write_corpus(corpus_dir):
+    for rel_path, text in DOCUMENTS.items():
+        path = corpus_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+def test_search_ranks_matching_passage_first(tmp_path):
+    _write_corpus(tmp_path)
+    index = LocalCorpusIndex.build(str(tmp_path))
+
+    results = index.search("Which genes drive T cell exhaustion?", top_k=2)
+
+    assert results[0]["source"] == "notes/crispr.md"
+    assert index.search("quantum chromodynamics") == []
+
+
+def test_index_is_reused_until_corpus_changes(tmp_path):
+    corpus_dir = tmp_path / "corpus"
+    _write_corpus(corpus_dir)
+    index_path = str(tmp_path / "index.json")
+
+    LocalCorpusIndex.load_or_build(str(corpus_dir), index_path)
+    assert len(LocalCorpusIndex.load_or_build(str(corpus_dir), index_path).passages) == 3
+
+    (corpus_dir / "new.md").write_text("Senescent cells secrete inflammatory factors.")
+    index = LocalCorpusIndex.load_or_build(str(corpus_dir), index_path)
+    assert index.search("senescent cells")[0]["source"] == "new.md"
+
+
+def test_provider_answers_hundreds_of_queries_per_second(tmp_path):
+    corpus_dir = tmp_path / "corpus"
+    _write_corpus(corpus_dir)
+    provider = create_research_provider(
+        {"RESEARCH_BACKEND": "local_corpus", "LOCAL_CORPUS_DIR": str(corpus_dir)},
+        str(tmp_path),
+    )
+
+    async def run_queries(n):
+        # Warm-up query so one-time imports are not timed
+        await provider.conduct_research("warm-up", "warm_up")
+        start = time.monotonic()
+        reports = await asyncio.gather(
+            *[provider.conduct_research("kinase inhibitors", f"q{i}") for i in range(n)]
+        )
+        return reports, time.monotonic() - start
+
+    reports, elapsed = asyncio.run(run_queries(300))
+
+    assert "kinase.md" in reports[0]
+    assert 300 / elapsed > 100
@@ -0,0 +1,80 @@
+"""
+Tests for parallel drafting in collaborative generation: agents draft at
+the same time each round, then one merge turn writes the final report.
+"""
+
+import asyncio
+import time
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from coscientist.generation_agent import CollaborativeConfig, build_generation_agent
+from coscientist.reasoning_types import ReasoningType
+
+FINAL_REPORT = """#FINAL REPORT#
+# Hypothesis
+Merged hypothesis: kinase signalling drives tumour resistance.
+
+# Falsifiable Predictions
+1. Kinase inhibition restores sensitivity in resistant tumours.
+
+# Assumptions
+1. Resistant tumours depend on kinase signalling.
+"""
+
+LATENCY = 0.2
+
+
+class _DraftingLLM(GenericFakeChatModel):
+    name: str = ""
+    prompts: list = []
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        self.prompts.append(input)
+        await asyncio.sleep(LATENCY)
+        if "merge the drafts" in input:
+            return AIMessage(content=FINAL_REPORT)
+        return AIMessage(content=f"draft {len(self.prompts)} by {self.name}")
+
+
+def test_agents_draft_concurrently_and_merge():
+    llms = {
+        name: _DraftingLLM(messages=iter([]), name=name, prompts=[])
+        for name in ["alice", "bob", "carol"]
+    }
+    agent = build_generation_agent(
+        "collaborative",
+        CollaborativeConfig(
+            agent_names=list(llms),
+            agent_fields={name: "biology" for name in llms},
+            agent_reasoning_types={name: list(ReasoningType)[0] for name in llms},
+            llms=llms,
+            parallel_drafting=True,
+            drafting_rounds=2,
+        ),
+    )
+
+    started_at = time.monotonic()
+    state = asyncio.run(
+        agent.ainvoke(
+            {
+                "goal": "goal",
+                "literature_review": "review",
+                "transcript": [],
+                "turn": 0,
+                "next_agent": "alice",
+                "finished": False,
+            }
+        )
+    )
+    elapsed = time.monotonic() - started_at
+
+    # Two drafting rounds and one merge turn, not 2 x 3 + 1 sequential turns
+    assert elapsed < 4 * LATENCY
+    assert [name for name, _ in state["transcript"]] == ["alice", "bob", "carol"] * 2 + ["alice"]
+    # Second-round drafts see every first-round draft but no second-round draft
+    second_round_prompt = llms["bob"].prompts[1]
+    assert all(f"draft 1 by {name}" in second_round_prompt for name in llms)
+    assert "draft 2 by" not in second_round_prompt
+    assert state["hypothesis"].hypothesis.startswith("Merged hypothesis")
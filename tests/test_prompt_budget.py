@@ -0,0 +1,80 @@
+"""
+Tests for token-budgeted prompt rendering in load_prompt.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from coscientist.common import (
+    PromptTooLargeError,
+    compressible_variables,
+    estimate_tokens,
+    load_prompt,
+    prompt_token_budget,
+    prompt_token_stats,
+)
+
+RESEARCH = "research finding " * 2000  # about 8500 tokens
+REASONING = "causal step " * 400  # about 1200 tokens
+
+
+def _verification_prompt(**kwargs) -> str:
+    return load_prompt(
+        "deep_verification",
+        hypothesis="Kinase activity drives resistance",
+        reasoning=REASONING,
+        assumption_research=RESEARCH,
+        **kwargs,
+    )
+
+
+def test_templates_declare_compressible_variables():
+    assert compressible_variables("deep_verification") == {
+        "assumption_research": 1,
+        "reasoning": 2,
+    }
+    assert compressible_variables("desk_reject") == {}
+    assert not _verification_prompt().startswith("{#")
+
+
+def test_lowest_priority_variable_is_compressed_first():
+    prompt = _verification_prompt(token_budget=5000)
+    assert estimate_tokens(prompt) <= 5000
+    assert REASONING in prompt
+    assert "... [truncated]" in prompt
+
+    # A digest is preferred over truncation when it fits
+    prompt = _verification_prompt(
+        token_budget=5000, digests={"assumption_research": "research digest"}
+    )
+    assert "research digest" in prompt
+    assert "... [truncated]" not in prompt
+
+    assert prompt_token_stats()["deep_verification"]["compressed"] >= 2
+
+
+def test_equal_priorities_are_truncated_evenly():
+    prompt = load_prompt(
+        "tournament",
+        token_budget=1500,
+        goal="goal",
+        hypothesis_1="Hypothesis one",
+        hypothesis_2="Hypothesis two",
+        review_1="a" * 8000,
+        review_2="b" * 4000,
+    )
+    assert estimate_tokens(prompt) <= 1500
+    assert prompt.count("a") > prompt.count("b") > 0
+
+
+def test_prompts_that_cannot_fit_fail_before_the_call():
+    with pytest.raises(PromptTooLargeError):
+        load_prompt("desk_reject", token_budget=10, hypothesis="Kinase activity drives resistance")
+
+
+def test_budget_leaves_room_for_the_output():
+    llm = SimpleNamespace(model_name="gpt-4o-mini", max_tokens=16000)
+    assert prompt_token_budget(llm) == int(128000 * 0.9) - 16000
+    gemini = SimpleNamespace(model="gemini-2.5-flash", max_output_tokens=None)
+    assert prompt_token_budget(gemini) == int(1048576 * 0.9)
@@ -0,0 +1,81 @@
+"""
+Tests that an interrupted reflection resumes from its checkpoint.
+"""
+
+import numpy as np
+import pytest
+from langchain_core.messages import AIMessage
+
+RESPONSES = {
+    "desk_reject": "FINAL EVALUATION: PASS",
+    "decomposition": "Assumptions:\n1. **Kinase activity is elevated**\n- Sub-assumption 1.1: it is measurable",
+    "simulation": "Step-by-step causal reasoning",
+}
+
+
+class _ReflectionLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        if "FINAL EVALUATION" in prompt:
+            return AIMessage(content=RESPONSES["desk_reject"])
+        if "sub-assumption" in prompt.lower():
+            return AIMessage(content=RESPONSES["decomposition"])
+        return AIMessage(content=RESPONSES["simulation"])
+
+
+class _CrashingReviewLLM:
+    """Fails the first deep verification, as a crash would."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("process crashed")
+        return AIMessage(content="The hypothesis is plausible.")
+
+
+class _ResearchProvider:
+    def __init__(self):
+        self.calls = 0
+
+    async def research(self, query, task_id, priority=None, timeout=None):
+        self.calls += 1
+        return "# Research report"
+
+
+def test_interrupted_reflection_resumes_from_its_checkpoint(
+    make_framework, make_hypothesis
+):
+    framework = make_framework(
+        reflection_agent_llms={"fake": _ReflectionLLM()},
+        meta_review_agent_llm=_CrashingReviewLLM(),
+    )
+    framework.research_provider = _ResearchProvider()
+    state_manager = framework.state_manager
+    state_manager.add_generated_hypothesis(
+        make_hypothesis("h1", "Kinase activity drives resistance to targeted therapy.")
+    )
+    state_manager.advance_hypothesis(
+        kind="generated", embedding=np.random.rand(8).tolist()
+    )
+
+    with pytest.raises(RuntimeError, match="process crashed"):
+        framework.process_reflection_queue()
+    assert [h.uid for h in state_manager.in_flight_reflections] == ["h1"]
+    llm = framework.config.reflection_agent_llms["fake"]
+    completed_llm_calls = llm.calls
+    assert framework.research_provider.calls == 1
+
+    # Same thread_id (the uid): only deep verification runs again
+    framework.process_reflection_queue()
+
+    assert framework.research_provider.calls == 1
+    assert llm.calls == completed_llm_calls
+    assert state_manager.in_flight_reflections == []
+    reviewed = state_manager._state.tournament.hypotheses["h1"]
+    assert reviewed.verification_result == "The hypothesis is plausible."
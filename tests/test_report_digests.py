@@ -0,0 +1,49 @@
+"""
+Tests for cached report digests and token-budgeted report selection.
+"""
+
+import asyncio
+
+from langchain_core.messages import AIMessage
+
+from coscientist.report_digests import (
+    ReportDigestCache,
+    estimate_tokens,
+    select_report_context,
+)
+
+
+class _CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        return AIMessage(content=f"digest #{self.calls}")
+
+
+def test_each_report_is_condensed_once(tmp_path):
+    llm = _CountingLLM()
+    cache = ReportDigestCache(str(tmp_path))
+    reports = ["long report A " * 50, "long report B " * 50, "long report A " * 50]
+
+    digests = asyncio.run(cache.acondense(reports, llm))
+    assert llm.calls == 2
+    assert digests[0] == digests[2]
+
+    # A new cache on the same goal directory reuses the stored digests
+    again = ReportDigestCache(str(tmp_path)).get_or_create(reports[1], llm)
+    assert again == digests[1]
+    assert llm.calls == 2
+
+
+def test_longest_reports_are_swapped_until_within_budget():
+    short, medium, long = "s" * 400, "m" * 4000, "l" * 8000
+    digests = {medium: "medium digest", long: "long digest"}
+
+    context = select_report_context([short, medium, long], 1200, digests.get)
+
+    # Swapping the long report is enough; the others keep their full text
+    assert context == "\n\n".join([short, medium, "long digest"])
+    assert estimate_tokens(context) <= 1200
+    assert select_report_context([short], 10, digests.get) == short
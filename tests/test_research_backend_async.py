@@ -0,0 +1,109 @@
+"""
+Tests that research providers do not block the event loop.
+
+A local stand-in for the Perplexity API answers every chat completion after a
+fixed delay. If the provider blocked the loop, N concurrent research calls
+would take N times that delay; with AsyncOpenAI they take about one delay.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from coscientist.research_backend import PerplexityProvider, run_research
+
+LATENCY = 0.5
+N_SUBTOPICS = 5
+
+
+class _SlowCompletionHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        time.sleep(LATENCY)
+        body = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": "sonar-pro",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "# Report\n\nDone."},
+                        "finish_reason": "stop",
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowCompletionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _provider(server: ThreadingHTTPServer, tmp_path) -> PerplexityProvider:
+    return PerplexityProvider(
+        {
+            "PERPLEXITY_API_KEY": "test-key",
+            "PERPLEXITY_BASE_URL": f"http://127.0.0.1:{server.server_port}",
+        },
+        str(tmp_path),
+    )
+
+
+def test_concurrent_research_finishes_in_about_one_call_latency(tmp_path):
+    server = _start_server()
+    try:
+        provider = _provider(server, tmp_path)
+
+        async def research_all():
+            # Warm-up call so one-time import and client setup costs are not timed
+            await provider.conduct_research("warm-up", "warm_up")
+            start = time.monotonic()
+            reports = await asyncio.gather(
+                *[
+                    provider.conduct_research(f"subtopic {i}", f"subtopic_{i}")
+                    for i in range(N_SUBTOPICS)
+                ]
+            )
+            return reports, time.monotonic() - start
+
+        reports, elapsed = asyncio.run(research_all())
+    finally:
+        server.shutdown()
+
+    assert reports == ["# Report\n\nDone."] * N_SUBTOPICS
+    assert elapsed < 2 * LATENCY, f"{N_SUBTOPICS} calls took {elapsed:.2f}s"
+
+
+def test_synchronous_research_calls_share_one_client(tmp_path):
+    server = _start_server()
+    try:
+        provider = _provider(server, tmp_path)
+
+        async def research(task_id):
+            report = await provider.conduct_research("assumption", task_id)
+            return report, provider.client
+
+        # Reflection runs research from worker threads, one call at a time
+        first_report, first_client = run_research(research("first"))
+        second_report, second_client = run_research(research("second"))
+    finally:
+        server.shutdown()
+
+    assert first_report == second_report == "# Report\n\nDone."
+    assert second_client is first_client
+    assert not first_client.is_closed()
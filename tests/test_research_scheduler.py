@@ -0,0 +1,79 @@
+"""
+Tests for the research scheduler's admission order and limits.
+"""
+
+import asyncio
+import threading
+
+from coscientist.research_scheduler import ResearchPriority, ResearchScheduler
+
+
+def test_priority_then_round_robin_across_goals():
+    scheduler = ResearchScheduler({"fake": {"max_concurrency": 1}})
+    order = []
+
+    async def call(name, priority, goal):
+        async with scheduler.slot("fake", priority, goal):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        # Occupy the only slot so everything below queues up
+        await scheduler.acquire("fake")
+        tasks = [
+            asyncio.create_task(call("a1", ResearchPriority.ASSUMPTION_RESEARCH, "goal_a")),
+            asyncio.create_task(call("a2", ResearchPriority.ASSUMPTION_RESEARCH, "goal_a")),
+            asyncio.create_task(call("b1", ResearchPriority.ASSUMPTION_RESEARCH, "goal_b")),
+            asyncio.create_task(call("lit", ResearchPriority.LITERATURE_REVIEW, "goal_b")),
+        ]
+        await asyncio.sleep(0.01)
+        assert scheduler.stats()["fake"] == {"running": 1, "queued": 4}
+        scheduler.release("fake")
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == ["lit", "a1", "b1", "a2"]
+
+
+def test_concurrency_limit_holds_across_threads_and_loops():
+    scheduler = ResearchScheduler({"fake": {"max_concurrency": 2}})
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    async def call():
+        async with scheduler.slot("fake"):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+    async def burst():
+        await asyncio.gather(*[call() for _ in range(4)])
+
+    threads = [threading.Thread(target=asyncio.run, args=(burst(),)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert scheduler.stats()["fake"] == {"running": 0, "queued": 0}
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    scheduler = ResearchScheduler({"fake": {"max_concurrency": 1}})
+
+    async def run():
+        await scheduler.acquire("fake")
+        waiter = asyncio.create_task(scheduler.acquire("fake"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        scheduler.release("fake")
+        await asyncio.wait_for(scheduler.acquire("fake"), timeout=1.0)
+
+    asyncio.run(run())
+    assert scheduler.stats()["fake"] == {"running": 1, "queued": 0}
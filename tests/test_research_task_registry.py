@@ -0,0 +1,78 @@
+"""
+Tests that background research tasks survive a process restart through the
+task registry. The OpenAI client is replaced by a fake, so no API calls are made.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from coscientist.research_backend import ResearchTaskRegistry, create_research_provider
+
+CONFIG = {
+    "RESEARCH_BACKEND": "openai_deep_research",
+    "OPENAI_DEEP_RESEARCH_BACKGROUND": True,
+    "OPENAI_DEEP_RESEARCH_POLLING_INTERVAL": 0.01,
+}
+
+
+class _FakeResponses:
+    def __init__(self, finished: bool):
+        self.finished = finished
+        self.created = 0
+        self.cancelled = []
+
+    async def create(self, **kwargs):
+        self.created += 1
+        return SimpleNamespace(id=f"resp_{self.created}")
+
+    async def retrieve(self, response_id):
+        if not self.finished:
+            return SimpleNamespace(status="in_progress", output=[])
+        return SimpleNamespace(status="completed", output=[], output_text="# Report")
+
+    async def cancel(self, response_id):
+        self.cancelled.append(response_id)
+
+
+def _provider(output_dir, responses: _FakeResponses):
+    provider = create_research_provider(CONFIG, str(output_dir))
+    provider.primary._clients.get = lambda: SimpleNamespace(responses=responses)
+    return provider
+
+
+def test_restarted_provider_reattaches_instead_of_resubmitting(tmp_path):
+    first = _FakeResponses(finished=False)
+    asyncio.run(
+        _provider(tmp_path, first).conduct_research(
+            "query", "lit_review_x", metadata={"subtopic": "x"}
+        )
+    )
+    registry_file = tmp_path / ResearchTaskRegistry.FILENAME
+    assert json.loads(registry_file.read_text())["lit_review_x"]["response_id"] == "resp_1"
+
+    # A new process sees the unfinished task and collects it without a new submission
+    second = _FakeResponses(finished=True)
+    provider = _provider(tmp_path, second)
+    assert provider.unfinished_tasks()["lit_review_x"]["metadata"] == {"subtopic": "x"}
+
+    report = asyncio.run(provider.research("query", "lit_review_x"))
+
+    assert report == "# Report"
+    assert second.created == 0
+    assert json.loads(registry_file.read_text()) == {}
+
+
+def test_timed_out_research_is_cancelled_and_deregistered(tmp_path):
+    responses = _FakeResponses(finished=False)
+    provider = _provider(tmp_path, responses)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(provider.research("query", "assumption_research_x", timeout=0.05))
+
+    assert responses.cancelled == ["resp_1"]
+    assert provider.unfinished_tasks() == {}
+    registry_file = tmp_path / ResearchTaskRegistry.FILENAME
+    assert json.loads(registry_file.read_text()) == {}
@@ -0,0 +1,52 @@
+"""
+Tests for review cards written after reflection and used in tournament prompts.
+"""
+
+from langchain_core.messages import AIMessage
+
+from coscientist.custom_types import ReviewedHypothesis
+from coscientist.ranking_agent import EloTournament
+from coscientist.reflection_agent import review_card_node
+
+FULL_REVIEW = "Full review with every detail of the assumption research. " * 50
+
+
+class _RecordingLLM:
+    def __init__(self, content: str):
+        self.content = content
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return AIMessage(content=self.content)
+
+
+def _reviewed(uid: str) -> ReviewedHypothesis:
+    return ReviewedHypothesis(
+        uid=uid,
+        hypothesis=f"Hypothesis {uid} explains the observed phenomenon.",
+        predictions=["A measurable outcome changes"],
+        assumptions=["The mechanism is active in vivo"],
+        causal_reasoning="reasoning",
+        assumption_research_results={},
+        verification_result=FULL_REVIEW,
+    )
+
+
+def test_tournament_prompts_use_the_card_when_there_is_one():
+    card_llm = _RecordingLLM("**Verdict:** plausible")
+    state = review_card_node({"reviewed_hypothesis": _reviewed("a")}, card_llm)
+    carded = state["reviewed_hypothesis"]
+    assert carded.review_card == "**Verdict:** plausible"
+    assert carded.verification_result == FULL_REVIEW
+    assert FULL_REVIEW in card_llm.prompts[0]
+
+    tournament = EloTournament(goal="goal")
+    tournament.add_hypothesis(carded)
+    tournament.add_hypothesis(_reviewed("b"))
+    judge = _RecordingLLM("WINNER: 1")
+    assert tournament.judge_match("a", "b", judge)[0] == 1
+
+    # The card replaces the full review of "a"; "b" has no card yet
+    assert "**Verdict:** plausible" in judge.prompts[0]
+    assert judge.prompts[0].count(FULL_REVIEW) == 1
@@ -0,0 +1,36 @@
+"""
+Tests for embedding-based deduplication of literature review subtopics.
+"""
+
+from coscientist.literature_review_agent import deduplicate_subtopics
+
+VOCABULARY = ["kinase", "microbiome", "crispr", "ageing"]
+
+
+def _embed_documents(texts):
+    return [[float(term in text.lower()) + 0.01 for term in VOCABULARY] for text in texts]
+
+
+def test_duplicates_of_existing_and_new_subtopics_are_skipped():
+    kept, skipped = deduplicate_subtopics(
+        new_subtopics=[
+            "Kinase signalling in tumours",  # duplicates an existing subtopic
+            "Microbiome effects on immunity",
+            "The microbiome and immune response",  # duplicates the previous one
+            "Ageing clocks",
+        ],
+        existing_subtopics=["How do kinase inhibitors act?"],
+        embed_documents=_embed_documents,
+        threshold=0.9,
+    )
+
+    assert kept == ["Microbiome effects on immunity", "Ageing clocks"]
+    assert skipped == ["Kinase signalling in tumours", "The microbiome and immune response"]
+
+
+def test_first_review_keeps_distinct_subtopics():
+    kept, skipped = deduplicate_subtopics(
+        ["CRISPR screens", "Ageing clocks"], [], _embed_documents, threshold=0.9
+    )
+    assert kept == ["CRISPR screens", "Ageing clocks"]
+    assert skipped == []
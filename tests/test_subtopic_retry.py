@@ -0,0 +1,99 @@
+"""
+Tests that failed subtopic research is retried by the next literature review
+expansion, and that finished reports survive a crash.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage
+
+from coscientist.literature_review_agent import (
+    _parallel_research_node,
+    _resumable_subtopics,
+    _topic_decomposition_node,
+)
+
+
+class _FlakyProvider:
+    def __init__(self, failures: dict[str, object]):
+        self.failures = failures
+        self.queries = []
+
+    async def research(self, query, task_id, metadata=None, priority=None):
+        subtopic = metadata["subtopic"]
+        self.queries.append(subtopic)
+        failure = self.failures.pop(subtopic, None)
+        if isinstance(failure, Exception):
+            raise failure
+        return failure or f"report on {subtopic}"
+
+
+def _research(provider, tmp_path, subtopics, reports):
+    framework = SimpleNamespace(
+        config=SimpleNamespace(early_start_min_reports=None),
+        state_manager=SimpleNamespace(_state=SimpleNamespace(_output_dir=str(tmp_path))),
+        research_provider=provider,
+    )
+    state = {"goal": "goal", "subtopics": subtopics, "subtopic_reports": reports}
+    return asyncio.run(_parallel_research_node(state, framework))["subtopic_reports"]
+
+
+def test_failed_subtopics_are_retried_on_expansion(tmp_path):
+    provider = _FlakyProvider(
+        {"timeout": asyncio.TimeoutError(), "error": "# Research Error\n\nstatus failed"}
+    )
+    reports = _research(provider, tmp_path, ["ok", "timeout", "error"], [])
+    assert reports == ["report on ok", "", ""]
+
+    # An error report kept by an older state is retried as well
+    reports = _research(
+        provider,
+        tmp_path,
+        ["ok", "timeout", "error", "old"],
+        reports + ["# Research Timeout\n\ntimed out"],
+    )
+    assert reports == ["report on ok", "report on timeout", "report on error", "report on old"]
+    assert provider.queries.count("ok") == 1
+
+
+def test_reports_finished_before_a_crash_are_reused(tmp_path):
+    provider = _FlakyProvider({})
+    _research(provider, tmp_path, ["kept"], [])
+
+    # The state was never saved, but the report was
+    framework = SimpleNamespace(
+        state_manager=SimpleNamespace(_state=SimpleNamespace(_output_dir=str(tmp_path))),
+        research_provider=provider,
+    )
+    assert _resumable_subtopics({"subtopics": []}, framework) == ["kept"]
+    assert _research(provider, tmp_path, ["kept"], []) == ["report on kept"]
+    assert provider.queries == ["kept"]
+
+
+class _DecompositionLLM:
+    def invoke(self, prompt):
+        return AIMessage(
+            content="### Subtopic 1\nkept\n### Subtopic 2\nqueued\n### Subtopic 3\nsync call"
+        )
+
+
+def test_subtopics_without_a_report_or_task_are_not_lost_in_a_crash(tmp_path):
+    framework = SimpleNamespace(
+        state_manager=SimpleNamespace(_state=SimpleNamespace(_output_dir=str(tmp_path))),
+        research_provider=_FlakyProvider({}),
+    )
+    state = {"goal": "goal", "max_subtopics": 3, "subtopics": []}
+    subtopics = _topic_decomposition_node(state, _DecompositionLLM(), framework)["subtopics"]
+    # Only the first report finished before the crash
+    _research(framework.research_provider, tmp_path, subtopics[:1], [])
+
+    resumed = _topic_decomposition_node(state, None, framework)["subtopics"]
+    assert resumed == ["kept", "queued", "sync call"]
+    provider = _FlakyProvider({})
+    assert _research(provider, tmp_path, resumed, []) == [
+        "report on kept",
+        "report on queued",
+        "report on sync call",
+    ]
+    assert provider.queries == ["queued", "sync call"]
@@ -0,0 +1,70 @@
+"""
+Tests for the rule-based supervisor fast path.
+"""
+
+from langchain_core.messages import AIMessage
+
+from coscientist.supervisor_agent import build_supervisor_agent, rule_based_decision
+
+
+class _SupervisorLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        return AIMessage(
+            content="DECISION: generate_new_hypotheses\n\nREASONING:\n- More ideas are needed"
+        )
+
+
+def _state(latest_actions: str, unranked: int, newly_ranked: int) -> dict:
+    return {
+        "goal": "goal",
+        "meta_review": "",
+        "previous_meta_review": "",
+        "total_actions": 3,
+        "latest_actions": latest_actions,
+        "total_hypotheses": 8,
+        "num_unranked_hypotheses": unranked,
+        "num_meta_reviews": 1,
+        "new_hypotheses_since_meta_review": newly_ranked,
+        "total_matches_played": 12,
+        "total_rounds_played": 2,
+        "top_3_elo_ratings": "1250, 1220, 1210",
+        "max_elo_rating": 1250.0,
+        "num_elo_ratings_over_1400": 0,
+        "median_elo_rating": 1200.0,
+        "cosine_similarity_trajectory": "0.5",
+        "cluster_count_trajectory": "3",
+        "literature_review_subtopics_completed": 5,
+    }
+
+
+def test_rules_only_settle_unambiguous_states():
+    assert rule_based_decision(_state("generate_new_hypotheses, run_tournament", 2, 0))[0] == (
+        "run_tournament"
+    )
+    assert rule_based_decision(_state("evolve_hypotheses", 0, 12))[0] == "run_meta_review"
+    assert rule_based_decision(_state("run_tournament, generate_new_hypotheses", 0, 4))[0] == (
+        "run_meta_review"
+    )
+    # Exploring versus refining is a trade-off left to the LLM
+    assert rule_based_decision(_state("run_meta_review, run_tournament", 0, 0)) is None
+    assert rule_based_decision(_state("", 0, 2)) is None
+
+
+def test_fast_path_skips_the_llm_call():
+    llm = _SupervisorLLM()
+    agent = build_supervisor_agent(llm, fast_path=True)
+
+    state = agent.invoke(_state("generate_new_hypotheses", 2, 0))
+    assert (state["action"], state["decided_by"], llm.calls) == ("run_tournament", "rules", 0)
+    assert state["decision_reasoning"].startswith("Rule-based decision:")
+
+    state = agent.invoke(_state("run_meta_review", 0, 0))
+    assert (state["action"], state["decided_by"], llm.calls) == (
+        "generate_new_hypotheses",
+        "llm",
+        1,
+    )
@@ -0,0 +1,89 @@
+"""
+Tests for tiered hypothesis parsing: markdown, then repaired JSON, and the
+LLM only when neither validates.
+"""
+
+import asyncio
+
+import pytest
+
+import coscientist.common as common
+from coscientist.common import (
+    aparse_hypothesis_tiered,
+    hypothesis_parse_stats,
+    parse_hypothesis_tiered,
+)
+
+MARKDOWN = """#FINAL REPORT#
+# Hypothesis
+Gut microbiome dysbiosis drives rheumatoid arthritis inflammation.
+
+# Falsifiable Predictions
+1. RA patients show lower microbial diversity than controls.
+
+# Assumptions
+1. Microbial metabolites cross the intestinal barrier.
+"""
+
+JSON_WITH_DEFECTS = """Here is the hypothesis:
+```json
+{
+  "hypothesis": "Gut microbiome dysbiosis drives rheumatoid arthritis inflammation.",
+  "falsifiable_predictions": ["RA patients show lower microbial diversity.",],
+  "assumptions": ["Metabolites cross the intestinal barrier."],
+}
+```"""
+
+NO_STRUCTURE = "I think the microbiome matters for arthritis, but I am not sure how."
+
+
+def test_llm_is_only_called_when_local_parsing_fails(monkeypatch):
+    llm_calls = []
+
+    def fake_llm_parser(llm, text):
+        llm_calls.append(text)
+        return common.ParsedHypothesis(
+            hypothesis="Microbiome composition modulates arthritis severity.",
+            predictions=["prediction"],
+            assumptions=["assumption"],
+        )
+
+    monkeypatch.setattr(common, "parse_hypothesis_with_llm", fake_llm_parser)
+    monkeypatch.setattr(common, "_PARSE_TIERS", common.Counter())
+
+    from_markdown = parse_hypothesis_tiered(None, MARKDOWN)
+    from_json = parse_hypothesis_tiered(None, JSON_WITH_DEFECTS)
+    parse_hypothesis_tiered(None, NO_STRUCTURE)
+
+    assert from_markdown.assumptions == ["Microbial metabolites cross the intestinal barrier."]
+    assert from_json.predictions == ["RA patients show lower microbial diversity."]
+    assert llm_calls == [NO_STRUCTURE]
+    stats = hypothesis_parse_stats()
+    assert (stats["markdown"], stats["json"], stats["llm"]) == (1, 1, 1)
+    assert abs(stats["fast_path_rate"] - 2 / 3) < 1e-9
+
+
+class _SlowParserLLM:
+    def __init__(self):
+        self.cancelled = 0
+
+    def with_structured_output(self, model):
+        return self
+
+    async def ainvoke(self, messages):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+def test_timeout_cancels_the_async_llm_parse():
+    llm = _SlowParserLLM()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(aparse_hypothesis_tiered(llm, NO_STRUCTURE), 0.1))
+    assert llm.cancelled == 1
+
+    # Local tiers need no LLM call
+    parsed = asyncio.run(aparse_hypothesis_tiered(llm, MARKDOWN))
+    assert parsed.predictions == ["RA patients show lower microbial diversity than controls."]
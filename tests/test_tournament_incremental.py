@@ -0,0 +1,42 @@
+"""
+Tests for seeding hypotheses into the EloTournament one at a time, as the
+streaming pipeline does. No LLM calls are made: matches are recorded directly.
+"""
+
+from coscientist.custom_types import ReviewedHypothesis
+from coscientist.ranking_agent import DEFAULT_ELO, EloTournament
+
+
+def _reviewed(uid: str) -> ReviewedHypothesis:
+    return ReviewedHypothesis(
+        uid=uid,
+        hypothesis=f"Hypothesis {uid} explains the observed phenomenon.",
+        predictions=["A measurable outcome changes"],
+        assumptions=["The mechanism is active in vivo"],
+        causal_reasoning="reasoning",
+        assumption_research_results={},
+        verification_result="review",
+    )
+
+
+def test_pending_opponents_only_lists_unplayed_pairs():
+    tournament = EloTournament(goal="goal")
+    for uid in ["a", "b", "c"]:
+        tournament.add_hypothesis(_reviewed(uid))
+
+    tournament.record_match("a", "b", winner=1, debate="a beats b")
+
+    assert tournament.pending_round_robin_opponents("a") == ["c"]
+    assert sorted(tournament.pending_round_robin_opponents("c")) == ["a", "b"]
+
+
+def test_record_match_updates_ratings_and_history():
+    tournament = EloTournament(goal="goal")
+    tournament.add_hypothesis(_reviewed("a"))
+    tournament.add_hypothesis(_reviewed("b"))
+
+    tournament.record_match("b", "a", winner=1, debate="b beats a")
+
+    assert tournament.ratings["b"] > DEFAULT_ELO > tournament.ratings["a"]
+    assert ("a", "b", 1) in tournament.match_history
+    assert tournament.get_win_loss_records()["b"] == {"wins": 1, "losses": 0}
@@ -0,0 +1,65 @@
+"""
+Tests for windowed multi-turn transcripts with a rolling summary.
+"""
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from coscientist import multiturn
+from coscientist.ranking_agent import DebateState
+
+
+class _RecordingLLM(GenericFakeChatModel):
+    prompts: list = []
+
+    def invoke(self, input, config=None, **kwargs):
+        self.prompts.append(input)
+        return super().invoke(input, config, **kwargs)
+
+
+def _llm(prefix):
+    messages = [
+        AIMessage(
+            content=f"{prefix}{i}",
+            usage_metadata={"input_tokens": 10 * i, "output_tokens": 1, "total_tokens": 10 * i + 1},
+        )
+        for i in range(20)
+    ]
+    return _RecordingLLM(messages=iter(messages), prompts=[])
+
+
+def test_old_turns_are_summarised_every_few_turns():
+    debater, summarizer = _llm("turn "), _llm("summary ")
+    window = multiturn.TranscriptWindow(keep_last=2, summary_llm=summarizer, summarize_every=2)
+    agent = multiturn.build_multi_turn_agent(
+        DebateState,
+        {
+            "scientist": multiturn.create_agent_node_fn(
+                "scientist",
+                debater,
+                "simulated_debate",
+                ["goal", "hypothesis_1", "hypothesis_2", "review_1", "review_2"],
+                transcript_window=window,
+            )
+        },
+        multiturn.create_moderator_node_fn(["scientist"], lambda msg: False, max_turns=5),
+    )
+
+    state = agent.invoke(
+        DebateState(
+            goal="goal", hypothesis_1="h1", hypothesis_2="h2", review_1="r1", review_2="r2",
+            transcript=[], turn=0, next_agent="scientist", finished=False,
+        )
+    )
+
+    # Six turns; the first two were folded into the summary before the fifth
+    assert len(state["transcript"]) == 6
+    assert len(summarizer.prompts) == 1
+    assert state["summarized_turns"] == 2
+    last_prompt = debater.prompts[-1]
+    assert "Summary of earlier turns:\nsummary 0" in last_prompt
+    assert "scientist: turn 1\n" not in last_prompt
+    assert "scientist: turn 2\nscientist: turn 3\nscientist: turn 4" in last_prompt
+
+    assert [u["agent"] for u in state["turn_usage"]].count("summary") == 1
+    assert "6 turns" in multiturn.summarize_turn_usage(state["turn_usage"])